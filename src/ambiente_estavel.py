@@ -0,0 +1,195 @@
+"""
+🧊 Ambiente Estável para Medições Reprodutíveis
+
+Prepara o processo antes dos benchmarks e avalia o quanto a execução foi
+ruidosa:
+
+- fixa o processo em CPUs isoladas (isolcpus) ou, na falta delas, em uma
+  única CPU, evitando migrações entre núcleos
+- congela o GC (gc.freeze) e o desliga durante as regiões cronometradas
+- verifica o governador de frequência e o turbo via sysfs (Linux) e avisa
+- registra a carga média antes e depois da execução
+- calcula uma pontuação de estabilidade (0-100) por execução
+
+Uso:
+    estado = preparar_ambiente()
+    with regiao_cronometrada():
+        ...  # medições
+    relatorio = avaliar_estabilidade(estado, variacoes)
+"""
+
+import gc
+import glob
+import os
+from contextlib import contextmanager
+
+SYSFS_CPU = '/sys/devices/system/cpu'
+
+# Abaixo desta pontuação a execução é considerada ruidosa
+LIMIAR_ESTABILIDADE = 70
+
+
+# ============================================================================
+# CPU E FREQUÊNCIA
+# ============================================================================
+
+def _ler(caminho):
+    try:
+        with open(caminho) as arquivo:
+            return arquivo.read().strip()
+    except OSError:
+        return None
+
+
+def interpretar_lista_cpus(texto):
+    """Converte '0-2,5' em {0, 1, 2, 5}."""
+    cpus = set()
+    for parte in (texto or '').split(','):
+        if not parte:
+            continue
+        inicio, _, fim = parte.partition('-')
+        cpus.update(range(int(inicio), int(fim or inicio) + 1))
+    return cpus
+
+
+def cpus_isoladas():
+    """CPUs reservadas pelo kernel com isolcpus (vazio se nenhuma)."""
+    return interpretar_lista_cpus(_ler(os.path.join(SYSFS_CPU, 'isolated')))
+
+
+def fixar_cpus(cpus=None):
+    """
+    Fixa o processo nas CPUs dadas, nas isoladas ou na última disponível.
+
+    Returns:
+        (cpus fixadas, aviso ou None)
+    """
+    if not hasattr(os, 'sched_setaffinity'):
+        return None, 'afinidade de CPU indisponível nesta plataforma'
+    disponiveis = os.sched_getaffinity(0)
+    escolhidas = set(cpus or ()) or (cpus_isoladas() & disponiveis)
+    aviso = None
+    if not escolhidas:
+        escolhidas = {max(disponiveis)}
+        aviso = f'nenhuma CPU isolada (isolcpus); fixando na CPU {max(disponiveis)}'
+    try:
+        os.sched_setaffinity(0, escolhidas)
+    except OSError as e:
+        # CPU inexistente ou fora do cpuset do processo (ex.: --cpus 999)
+        return None, f"não foi possível fixar nas CPUs {sorted(escolhidas)}: {e.strerror or e}"
+    return sorted(escolhidas), aviso
+
+
+def verificar_frequencia():
+    """Avisos sobre governador de frequência e turbo (Linux/sysfs)."""
+    avisos = []
+    governadores = {
+        _ler(caminho)
+        for caminho in glob.glob(os.path.join(SYSFS_CPU, 'cpu[0-9]*', 'cpufreq', 'scaling_governor'))
+    }
+    governadores.discard(None)
+    if governadores - {'performance'}:
+        avisos.append(f"governador de frequência: {', '.join(sorted(governadores))} "
+                      "(use 'performance')")
+
+    no_turbo = _ler(os.path.join(SYSFS_CPU, 'intel_pstate', 'no_turbo'))
+    boost = _ler(os.path.join(SYSFS_CPU, 'cpufreq', 'boost'))
+    if no_turbo == '0' or boost == '1':
+        avisos.append('turbo/boost ativo: a frequência varia com temperatura e carga')
+    return avisos
+
+
+def carga_media():
+    """Carga média de 1 minuto (None se indisponível)."""
+    try:
+        return os.getloadavg()[0]
+    except (AttributeError, OSError):
+        return None
+
+
+# ============================================================================
+# GC
+# ============================================================================
+
+@contextmanager
+def regiao_cronometrada():
+    """Congela os objetos existentes e desliga o GC durante a medição."""
+    estava_ativo = gc.isenabled()
+    gc.collect()
+    gc.freeze()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if estava_ativo:
+            gc.enable()
+        gc.unfreeze()
+
+
+# ============================================================================
+# PREPARAÇÃO E AVALIAÇÃO
+# ============================================================================
+
+def preparar_ambiente(cpus=None, fixar=True):
+    """Fixa CPUs (se `fixar`), verifica frequência e anota a carga inicial."""
+    fixadas, aviso = fixar_cpus(cpus) if fixar else (None, None)
+    avisos = ([aviso] if aviso else []) + verificar_frequencia()
+    return {'cpus': fixadas, 'avisos': avisos, 'carga_antes': carga_media()}
+
+
+def avaliar_estabilidade(estado, variacoes):
+    """
+    Pontuação de estabilidade (0-100) de uma execução.
+
+    Desconta frequência variável e turbo (15 pontos cada), carga média por
+    CPU (até 30 pontos) e a variação média entre rodadas dos casos (até 40
+    pontos; 10% de variação zera essa parcela). Sem nenhuma variação medida,
+    a estabilidade é desconhecida: a parcela é perdida inteira e a execução
+    nunca é estável (variacao_media None).
+    """
+    carga_depois = carga_media()
+    pontuacao = 100.0
+    pontuacao -= 15 * sum('governador' in a or 'turbo' in a for a in estado['avisos'])
+
+    cargas = [c for c in (estado['carga_antes'], carga_depois) if c is not None]
+    if cargas:
+        pontuacao -= min(30.0, 30.0 * max(cargas) / (os.cpu_count() or 1))
+
+    variacoes = [v for v in variacoes if v is not None]
+    variacao_media = sum(variacoes) / len(variacoes) if variacoes else None
+    pontuacao -= 40.0 if variacao_media is None else min(40.0, 400.0 * variacao_media)
+
+    pontuacao = max(0.0, round(pontuacao, 1))
+    return {
+        'pontuacao': pontuacao,
+        'estavel': variacao_media is not None and pontuacao >= LIMIAR_ESTABILIDADE,
+        'cpus': estado['cpus'],
+        'avisos': estado['avisos'],
+        'carga_antes': estado['carga_antes'],
+        'carga_depois': carga_depois,
+        'variacao_media': variacao_media,
+    }
+
+
+def variacoes_das_execucoes(execucoes):
+    """Extrai a variação entre rodadas de todas as medições de uma execução."""
+    return [m.get('variacao') for e in execucoes for m in e['resultados']]
+
+
+def mostrar_avisos(estado):
+    """Imprime as CPUs fixadas e os avisos da preparação."""
+    print(f"🧊 Ambiente estável: CPUs {estado['cpus'] or 'sem afinidade'}, GC congelado nas medições")
+    for aviso in estado['avisos']:
+        print(f"   ⚠️ {aviso}")
+
+
+def mostrar_estabilidade(relatorio):
+    """Imprime a pontuação de estabilidade de uma execução."""
+    def formatar(carga):
+        return 'N/A' if carga is None else f"{carga:.2f}"
+
+    variacao = relatorio['variacao_media']
+    icone = '✅' if relatorio['estavel'] else '⚠️'
+    print(f"\n{icone} Estabilidade: {relatorio['pontuacao']:.0f}/100 "
+          f"(carga {formatar(relatorio['carga_antes'])} → {formatar(relatorio['carga_depois'])}, "
+          f"variação média entre rodadas {'desconhecida' if variacao is None else f'{variacao:.1%}'})")
@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+"""
+⚙️ Benchmark de Modelos de Concorrência
+
+Executa as mesmas cargas de trabalho com ThreadPoolExecutor,
+ProcessPoolExecutor e, quando disponível, InterpreterPoolExecutor
+(subinterpretadores, Python 3.14+). Em builds free-threaded (sem GIL)
+as threads são identificadas no relatório.
+
+Cargas:
+- CPU: transformação de listas no estilo de benchmark_listas
+- I/O: mesclagem de fontes com latência simulada, no estilo de exemplos_praticos
+
+Executar: python benchmark_concorrencia.py [--max-workers N] [--tarefas N]
+"""
+
+import argparse
+import concurrent.futures
+import os
+import sys
+import time
+
+# Configurações para os benchmarks de concorrência
+CONCORRENCIA_CONFIG = {
+    'tarefas': 16,
+    'tamanho_cpu': 200000,
+    'latencia_io': 0.02,
+    'registros_io': 200,
+}
+
+
+# ============================================================================
+# CARGAS DE TRABALHO
+# ============================================================================
+
+def carga_cpu(inicio, fim):
+    """Filtra pares e eleva ao quadrado (mesma transformação de benchmark_listas)."""
+    return sum([num ** 2 for num in range(inicio, fim) if num % 2 == 0])
+
+
+def carga_io(lote, registros, latencia):
+    """Simula três consultas de I/O e mescla os resultados com zip."""
+    time.sleep(latencia)
+    ids = list(range(lote * registros, (lote + 1) * registros))
+    time.sleep(latencia)
+    nomes = [f'usuario{i}' for i in ids]
+    time.sleep(latencia)
+    emails = [f'{nome}@email.com' for nome in nomes]
+
+    usuarios = [
+        {'id': id_, 'nome': nome, 'email': email}
+        for id_, nome, email in zip(ids, nomes, emails)
+    ]
+    return len(usuarios)
+
+
+def montar_tarefas(carga, tarefas):
+    """Divide a carga em tarefas independentes (função, argumentos)."""
+    if carga == 'cpu':
+        passo = CONCORRENCIA_CONFIG['tamanho_cpu']
+        return [(carga_cpu, (i * passo, (i + 1) * passo)) for i in range(tarefas)]
+    registros = CONCORRENCIA_CONFIG['registros_io']
+    latencia = CONCORRENCIA_CONFIG['latencia_io']
+    return [(carga_io, (i, registros, latencia)) for i in range(tarefas)]
+
+
+# ============================================================================
+# EXECUTORES
+# ============================================================================
+
+def gil_habilitado():
+    """Retorna False apenas em builds free-threaded com o GIL desligado."""
+    verificar = getattr(sys, '_is_gil_enabled', None)
+    return True if verificar is None else verificar()
+
+
+def executores_disponiveis():
+    """Lista (nome, classe) dos executores suportados por este interpretador."""
+    nome_threads = 'threads' if gil_habilitado() else 'threads (sem GIL)'
+    executores = [
+        (nome_threads, concurrent.futures.ThreadPoolExecutor),
+        ('processos', concurrent.futures.ProcessPoolExecutor),
+    ]
+    interpretadores = getattr(concurrent.futures, 'InterpreterPoolExecutor', None)
+    if interpretadores is not None:
+        executores.append(('subinterpretadores', interpretadores))
+    return executores
+
+
+def executar_carga(classe_executor, workers, tarefas):
+    """Executa todas as tarefas no executor e retorna o tempo total."""
+    inicio = time.perf_counter()
+    with classe_executor(max_workers=workers) as executor:
+        futuros = [executor.submit(funcao, *args) for funcao, args in tarefas]
+        for futuro in futuros:
+            futuro.result()
+    return time.perf_counter() - inicio
+
+
+def curva_escalabilidade(classe_executor, carga, max_workers, tarefas):
+    """Mede o tempo para 1..max_workers workers."""
+    lista_tarefas = montar_tarefas(carga, tarefas)
+    return [
+        (workers, executar_carga(classe_executor, workers, lista_tarefas))
+        for workers in range(1, max_workers + 1)
+    ]
+
+
+def mostrar_curva(nome, curva):
+    """Imprime a curva de escalabilidade com speedup e eficiência."""
+    tempo_base = curva[0][1]
+    print(f"\n   {nome}:")
+    print(f"   {'workers':>7}  {'tempo':>10}  {'speedup':>8}  {'eficiência':>10}")
+    for workers, tempo in curva:
+        speedup = tempo_base / tempo
+        eficiencia = speedup / workers
+        barra = '█' * max(1, round(speedup * 4))
+        print(f"   {workers:>7}  {tempo:>9.4f}s  {speedup:>7.2f}x  {eficiencia:>9.0%}  {barra}")
+
+
+# ============================================================================
+# MAIN
+# ============================================================================
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--max-workers', type=int, default=os.cpu_count() or 1,
+                        help='maior número de workers da curva (padrão: núcleos)')
+    parser.add_argument('--tarefas', type=int, default=CONCORRENCIA_CONFIG['tarefas'],
+                        help='número de tarefas por execução')
+    parser.add_argument('--carga', choices=['cpu', 'io'], action='append',
+                        help='carga a executar (padrão: ambas)')
+    args = parser.parse_args(argv)
+
+    print("\n" + "="*70)
+    print("⚙️  BENCHMARK DE CONCORRÊNCIA: THREADS vs PROCESSOS vs SUBINTERPRETADORES")
+    print("="*70)
+    print(f"🐍 Python: {sys.version.split()[0]}  |  GIL: {'ativo' if gil_habilitado() else 'desligado'}")
+    print(f"🔧 Configuração: {CONCORRENCIA_CONFIG}  |  workers: 1..{args.max_workers}")
+
+    descricoes = {
+        'cpu': 'CPU-bound (transformação de listas)',
+        'io': 'I/O-bound (mesclagem com latência simulada)',
+    }
+    for carga in args.carga or ['cpu', 'io']:
+        print("\n" + "-"*70)
+        print(f"📊 Carga {descricoes[carga]} - {args.tarefas} tarefas")
+        print("-"*70)
+        for nome, classe in executores_disponiveis():
+            try:
+                curva = curva_escalabilidade(classe, carga, args.max_workers, args.tarefas)
+            except Exception as e:
+                print(f"\n   {nome}: indisponível ({str(e)[:50]})")
+                continue
+            mostrar_curva(nome, curva)
+
+    print(f"""
+💡 Lições:
+   - Com GIL, threads só escalam em cargas de I/O (a espera libera o GIL)
+   - Processos escalam em CPU, mas pagam criação e serialização (pickle)
+   - Subinterpretadores e builds sem GIL reduzem esse custo quando disponíveis
+    """)
+
+
+if __name__ == "__main__":
+    main()
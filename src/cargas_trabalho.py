@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+"""
+🎲 Geradores de Cargas de Trabalho
+
+Os benchmarks usam entradas triviais: range(n), random.randint(0, 100),
+['palavra'] * 1000. Dados de produção raramente são assim: poucas chaves
+concentram a maior parte dos acessos, valores se agrupam, entradas chegam
+já ordenadas e chaves maliciosas podem colidir na tabela de hash. Este
+módulo gera inteiros e chaves de texto com essas distribuições:
+
+- sequencial: range(n), a entrada original dos benchmarks
+- uniforme: randint(0, maximo)
+- zipf: poucas chaves muito frequentes e uma cauda longa (expoente 1.1)
+- normal: concentrada em torno do meio do intervalo
+- agrupada: blocos de valores próximos em torno de alguns centros
+- ordenada / reversa: uniforme, já ordenada (crescente ou decrescente)
+- colisoes: inteiros distintos com o mesmo hash (múltiplos do módulo de
+  hash de int), o pior caso de set e dict
+
+Textos (gerar_textos) seguem a mesma distribuição, convertida em chaves
+realistas (ids com prefixo, e-mails, caminhos de URL). O hash de str é
+aleatorizado por processo, então 'colisoes' em textos usa chaves com um
+prefixo comum longo: cada comparação percorre o prefixo inteiro.
+
+Uso nos benchmarks: python exemplos_otimizacao.py -p distribuicao=zipf
+Executar: python cargas_trabalho.py
+"""
+
+import random
+import sys
+
+DISTRIBUICOES = ('sequencial', 'uniforme', 'zipf', 'normal', 'agrupada',
+                 'ordenada', 'reversa', 'colisoes')
+
+EXPOENTE_ZIPF = 1.1
+AGRUPAMENTOS = 8
+
+# hash(n) == n % MODULO_HASH para int positivo: múltiplos do módulo têm hash 0
+MODULO_HASH = sys.hash_info.modulus
+
+
+# ============================================================================
+# INTEIROS
+# ============================================================================
+
+def _zipf(gerador, quantidade, maximo):
+    """Rank r sorteado com peso 1/r^s; os ranks viram valores embaralhados."""
+    from itertools import accumulate
+
+    valores = list(range(maximo + 1))
+    gerador.shuffle(valores)  # as chaves quentes não são só os menores números
+    acumulados = list(accumulate(1 / rank ** EXPOENTE_ZIPF for rank in range(1, maximo + 2)))
+    return gerador.choices(valores, cum_weights=acumulados, k=quantidade)
+
+
+def _normal(gerador, quantidade, maximo):
+    meio, desvio = maximo / 2, maximo / 8
+    return [min(maximo, max(0, round(gerador.gauss(meio, desvio)))) for _ in range(quantidade)]
+
+
+def _agrupada(gerador, quantidade, maximo):
+    centros = [gerador.randint(0, maximo) for _ in range(AGRUPAMENTOS)]
+    largura = max(1, maximo // 100)
+    return [
+        min(maximo, max(0, gerador.choice(centros) + gerador.randint(-largura, largura)))
+        for _ in range(quantidade)
+    ]
+
+
+def gerar_inteiros(distribuicao, quantidade, maximo=None, seed=42):
+    """
+    Lista de `quantidade` inteiros em [0, maximo] com a distribuição pedida.
+
+    `maximo` padrão é quantidade - 1. Em 'colisoes' cada valor v do
+    intervalo vira v * MODULO_HASH: inteiros grandes, todos com hash 0.
+    """
+    if distribuicao not in DISTRIBUICOES:
+        raise ValueError(f"distribuição desconhecida: {distribuicao!r} (use {', '.join(DISTRIBUICOES)})")
+    if maximo is None:
+        maximo = max(0, quantidade - 1)
+    gerador = random.Random(seed)
+
+    if distribuicao == 'sequencial':
+        return list(range(quantidade))
+    if distribuicao == 'zipf':
+        return _zipf(gerador, quantidade, maximo)
+    if distribuicao == 'normal':
+        return _normal(gerador, quantidade, maximo)
+    if distribuicao == 'agrupada':
+        return _agrupada(gerador, quantidade, maximo)
+
+    valores = [gerador.randint(0, maximo) for _ in range(quantidade)]
+    if distribuicao == 'ordenada':
+        valores.sort()
+    elif distribuicao == 'reversa':
+        valores.sort(reverse=True)
+    elif distribuicao == 'colisoes':
+        valores = [valor * MODULO_HASH for valor in valores]
+    return valores
+
+
+# ============================================================================
+# TEXTOS
+# ============================================================================
+
+FORMATOS_CHAVE = (
+    lambda n: f"usuario:{n:08d}",
+    lambda n: f"cliente{n}@email.com.br",
+    lambda n: f"/api/v1/produtos/{n}/avaliacoes",
+    lambda n: f"pedido-{n:06d}-BR",
+)
+
+PREFIXO_COLISAO = 'sessao:' + 'a' * 64 + ':'
+
+
+def chave_texto(valor):
+    """Chave realista e determinística para o inteiro `valor`."""
+    return FORMATOS_CHAVE[valor % len(FORMATOS_CHAVE)](valor)
+
+
+def gerar_textos(distribuicao, quantidade, maximo=None, seed=42):
+    """
+    Lista de chaves de texto cuja frequência segue `distribuicao`.
+
+    Valores iguais geram chaves iguais; em 'ordenada' e 'reversa' a lista
+    de textos também sai ordenada.
+    """
+    if distribuicao == 'colisoes':
+        valores = gerar_inteiros('uniforme', quantidade, maximo, seed)
+        return [f"{PREFIXO_COLISAO}{valor}" for valor in valores]
+
+    textos = list(map(chave_texto, gerar_inteiros(distribuicao, quantidade, maximo, seed)))
+    if distribuicao in ('ordenada', 'reversa'):
+        textos.sort(reverse=distribuicao == 'reversa')
+    return textos
+
+
+# ============================================================================
+# PERFIL DAS DISTRIBUIÇÕES
+# ============================================================================
+
+def perfil(valores):
+    """Distintos, fração coberta pelo 1% de chaves mais frequentes, ordem e slots de hash."""
+    from itertools import groupby
+
+    # Contagem por ordenação, não por Counter: em 'colisoes' um dict levaria tempo quadrático
+    distintos = []
+    frequencias = []
+    for chave, grupo in groupby(sorted(valores)):
+        distintos.append(chave)
+        frequencias.append(sum(1 for _ in grupo))
+    frequencias.sort(reverse=True)
+    # Slots ocupados em uma tabela de 2^k posições, como no índice inicial de set/dict
+    mascara = (1 << max(3, len(distintos).bit_length())) - 1
+    return {
+        'distintos': len(distintos),
+        'top_1pct': sum(frequencias[:max(1, len(distintos) // 100)]) / len(valores),
+        'ordenada': all(a <= b for a, b in zip(valores, valores[1:])),
+        'slots_distintos': len({hash(chave) & mascara for chave in distintos}) / len(distintos),
+    }
+
+
+def main():
+    quantidade = 100_000
+
+    print("="*70)
+    print("🎲 PERFIL DAS CARGAS DE TRABALHO")
+    print("="*70)
+    print(f"\n📊 {quantidade:,} valores por distribuição:")
+    print(f"   {'distribuição':<12} {'distintos':>10} {'top 1%':>8} {'ordenada':>9} {'slots':>7}  exemplo de chave")
+    for distribuicao in DISTRIBUICOES:
+        dados = perfil(gerar_inteiros(distribuicao, quantidade))
+        exemplo = gerar_textos(distribuicao, 1, maximo=quantidade, seed=7)[0]
+        print(f"   {distribuicao:<12} {dados['distintos']:>10,} {dados['top_1pct']:>8.0%} "
+              f"{'sim' if dados['ordenada'] else 'não':>9} {dados['slots_distintos']:>7.0%}  {exemplo[:40]}")
+
+    print(f"""
+💡 Lições:
+   - 'top 1%' mostra a concentração: em zipf poucas chaves dominam e
+     ficam quentes no cache; na uniforme o acesso se espalha
+   - 'slots' é a fração de chaves distintas com índice inicial próprio na
+     tabela de hash: em 'colisoes' todas disputam o mesmo slot
+   - Entradas já ordenadas mudam o custo de sort (Timsort as aproveita) e
+     de estruturas como árvores e bisect
+   - Meça com a distribuição de produção, não só com range(n)
+    """)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,401 @@
+#!/usr/bin/env python3
+"""
+🎲 Combinatória Preguiçosa com Acesso Aleatório e Avaliação em Blocos
+
+exemplo_itertools materializa list(product(...)) e list(combinations(...))
+para entradas de brinquedo. Grades de parâmetros reais têm milhões de
+pontos: este módulo trata produto cartesiano e combinações como espaços
+indexáveis, sem materializá-los:
+
+- espaco[k] devolve o k-ésimo elemento (unranking) sem iterar
+- espaco.posicao(elemento) devolve o índice de um elemento (ranking)
+- espaco.iterar(inicio, fim) percorre um trecho contíguo, na mesma ordem
+  de itertools.product / itertools.combinations
+- dividir() e avaliar_em_paralelo() repartem o espaço em blocos para um
+  ProcessPoolExecutor e devolvem os resultados em fluxo, na ordem
+
+Executar: python combinatoria.py
+Listar casos: python combinatoria.py --listar
+"""
+
+import os
+from itertools import chain, combinations, islice, product
+
+from registro_benchmarks import benchmark, executar_suite
+
+COMBINATORIA_CONFIG = {
+    'orcamento_total': 6.0,  # Segundos de medição divididos entre todos os casos
+    'rodadas': 5,
+    'instrumentar': [],
+    'estavel': False,
+    'seeds': 42,
+}
+
+# Maior bloco enumerado direto pelo itertools ao iterar um trecho do espaço
+LIMITE_BLOCO = 4096
+
+
+# math.prod e math.comb só existem a partir do Python 3.8
+def _prod(valores):
+    from functools import reduce
+    from operator import mul
+
+    return reduce(mul, valores, 1)
+
+
+def _comb(n, k):
+    """Coeficiente binomial pela fórmula multiplicativa (0 fora de 0 <= k <= n)."""
+    if not 0 <= k <= n:
+        return 0
+    k = min(k, n - k)
+    resultado = 1
+    for i in range(1, k + 1):
+        resultado = resultado * (n - k + i) // i
+    return resultado
+
+
+# ============================================================================
+# ESPAÇOS
+# ============================================================================
+
+class EspacoProduto:
+    """
+    Produto cartesiano indexável, na ordem de itertools.product.
+
+    O índice é um número em base mista: o último eixo varia mais rápido.
+    """
+
+    def __init__(self, *sequencias, repeat=1):
+        self.sequencias = tuple(tuple(s) for s in sequencias) * repeat
+        self.tamanhos = tuple(len(s) for s in self.sequencias)
+        self._mapas = None
+
+    def __len__(self):
+        return _prod(self.tamanhos)
+
+    def __iter__(self):
+        return self.iterar()
+
+    def _digitos(self, indice):
+        total = len(self)
+        if indice < 0:
+            indice += total
+        if not 0 <= indice < total:
+            raise IndexError('índice fora do espaço')
+        digitos = []
+        for tamanho in reversed(self.tamanhos):
+            indice, digito = divmod(indice, tamanho)
+            digitos.append(digito)
+        digitos.reverse()
+        return digitos
+
+    def __getitem__(self, indice):
+        return tuple(seq[d] for seq, d in zip(self.sequencias, self._digitos(indice)))
+
+    def posicao(self, elemento):
+        """Índice de `elemento` no espaço (valores hasheáveis e distintos por eixo)."""
+        if self._mapas is None:
+            self._mapas = [{valor: i for i, valor in enumerate(seq)} for seq in self.sequencias]
+        indice = 0
+        for mapa, tamanho, valor in zip(self._mapas, self.tamanhos, elemento):
+            indice = indice * tamanho + mapa[valor]
+        return indice
+
+    def iterar(self, inicio=0, fim=None):
+        """
+        Itera os elementos de índice inicio <= i < fim.
+
+        Os eixos finais (até LIMITE_BLOCO elementos) são enumerados por
+        itertools.product em C; só o prefixo de cada bloco é calculado em
+        Python, por unranking.
+        """
+        fim = len(self) if fim is None else min(fim, len(self))
+        if inicio >= fim:
+            return iter(())
+        return chain.from_iterable(self._trechos(inicio, fim))
+
+    def _trechos(self, inicio, fim):
+        corte, bloco = len(self.tamanhos), 1
+        while corte > 0 and bloco * self.tamanhos[corte - 1] <= LIMITE_BLOCO:
+            corte -= 1
+            bloco *= self.tamanhos[corte]
+        if corte == len(self.tamanhos) and corte > 0:
+            corte -= 1
+            bloco = self.tamanhos[corte]
+
+        prefixos = EspacoProduto(*self.sequencias[:corte])
+        sufixo = self.sequencias[corte:]
+        for indice in range(inicio // bloco, (fim - 1) // bloco + 1):
+            base = indice * bloco
+            trecho = islice(product(*sufixo), max(inicio - base, 0), min(fim - base, bloco))
+            yield map(prefixos[indice].__add__, trecho)
+
+
+class EspacoCombinacoes:
+    """
+    Combinações de r elementos indexáveis, na ordem de itertools.combinations.
+
+    O ranking usa o sistema numérico combinatório: fixar o índice i na
+    posição p pula comb(n - i - 1, r - p - 1) combinações.
+    """
+
+    def __init__(self, sequencia, r):
+        self.sequencia = tuple(sequencia)
+        self.r = r
+        self._mapa = None
+
+    def __len__(self):
+        return _comb(len(self.sequencia), self.r)
+
+    def __iter__(self):
+        return self.iterar()
+
+    def _indices(self, indice):
+        total = len(self)
+        if indice < 0:
+            indice += total
+        if not 0 <= indice < total:
+            raise IndexError('índice fora do espaço')
+        n, r = len(self.sequencia), self.r
+        indices = []
+        candidato = 0
+        for posicao in range(r):
+            while True:
+                bloco = _comb(n - candidato - 1, r - posicao - 1)
+                if indice < bloco:
+                    break
+                indice -= bloco
+                candidato += 1
+            indices.append(candidato)
+            candidato += 1
+        return indices
+
+    def __getitem__(self, indice):
+        return tuple(self.sequencia[i] for i in self._indices(indice))
+
+    def posicao(self, elemento):
+        """Índice de `elemento` (tupla em ordem crescente de posição na sequência)."""
+        if self._mapa is None:
+            self._mapa = {valor: i for i, valor in enumerate(self.sequencia)}
+        n, r = len(self.sequencia), self.r
+        indice = 0
+        anterior = -1
+        for posicao, valor in enumerate(elemento):
+            atual = self._mapa[valor]
+            for pulado in range(anterior + 1, atual):
+                indice += _comb(n - pulado - 1, r - posicao - 1)
+            anterior = atual
+        return indice
+
+    def iterar(self, inicio=0, fim=None):
+        """
+        Itera os elementos de índice inicio <= i < fim.
+
+        O intervalo é decomposto pelos primeiros elementos fixados até que
+        cada bloco restante tenha no máximo LIMITE_BLOCO combinações,
+        enumeradas por itertools.combinations em C.
+        """
+        fim = len(self) if fim is None else min(fim, len(self))
+        if inicio >= fim:
+            return iter(())
+        return chain.from_iterable(self._trechos((), 0, self.r, inicio, fim))
+
+    def _trechos(self, prefixo, primeiro, r, inicio, fim):
+        sequencia = self.sequencia
+        if r == 0 or _comb(len(sequencia) - primeiro, r) <= LIMITE_BLOCO:
+            trecho = islice(combinations(sequencia[primeiro:], r), inicio, fim)
+            yield map(prefixo.__add__, trecho)
+            return
+
+        deslocamento = 0
+        for i in range(primeiro, len(sequencia)):
+            bloco = _comb(len(sequencia) - i - 1, r - 1)
+            if deslocamento + bloco > inicio:
+                yield from self._trechos(prefixo + (sequencia[i],), i + 1, r - 1,
+                                         max(inicio - deslocamento, 0), min(fim - deslocamento, bloco))
+            deslocamento += bloco
+            if deslocamento >= fim:
+                return
+
+
+# ============================================================================
+# AVALIAÇÃO EM BLOCOS
+# ============================================================================
+
+def dividir(espaco, tamanho_bloco):
+    """Intervalos contíguos [inicio, fim) que cobrem o espaço."""
+    total = len(espaco)
+    return [(inicio, min(inicio + tamanho_bloco, total)) for inicio in range(0, total, tamanho_bloco)]
+
+
+def _avaliar_bloco(espaco, inicio, fim, func):
+    return [func(elemento) for elemento in espaco.iterar(inicio, fim)]
+
+
+def avaliar_em_paralelo(espaco, func, workers=None, tamanho_bloco=10_000):
+    """
+    Gera func(elemento) para todo o espaço, na ordem, avaliando blocos em processos.
+
+    Cada processo recebe só (espaço, inicio, fim) e enumera o próprio bloco;
+    no máximo 2 blocos por worker ficam pendentes, então a memória não
+    cresce com o tamanho do espaço. `func` precisa ser importável (pickle).
+    """
+    from collections import deque
+    from concurrent.futures import ProcessPoolExecutor
+
+    workers = workers or os.cpu_count() or 1
+    pendentes = deque()
+    with ProcessPoolExecutor(workers) as executor:
+        for inicio, fim in dividir(espaco, tamanho_bloco):
+            pendentes.append(executor.submit(_avaliar_bloco, espaco, inicio, fim, func))
+            if len(pendentes) >= 2 * workers:
+                yield from pendentes.popleft().result()
+        while pendentes:
+            yield from pendentes.popleft().result()
+
+
+def pontuar(parametros):
+    """Função objetivo de exemplo para uma combinação de parâmetros (custo de CPU)."""
+    total = 0.0
+    for passo in range(50):
+        for valor in parametros:
+            total += (valor * passo) % 7
+    return total
+
+
+# ============================================================================
+# BENCHMARKS
+# ============================================================================
+
+def mostrar(titulo, nomes, medicoes):
+    from medicao import descrever
+
+    print(f"\n📊 {titulo}:")
+    referencia = medicoes[0]['por_chamada']
+    for nome, medicao in zip(nomes, medicoes):
+        print(f"   {nome:<30} {descrever(medicao)}  ({referencia / medicao['por_chamada']:.1f}x)")
+
+
+@benchmark('cronometrado', 'combinatoria', 'acesso', medicoes=6)
+def benchmark_acesso(eixos=6, valores=10, n=40, r=5):
+    """k-ésimo elemento no meio do espaço: unranking vs avançar o iterador do itertools."""
+    from medicao import descrever, medir_caso
+
+    print("\n" + "="*70)
+    print("ACESSO ALEATÓRIO AO k-ÉSIMO ELEMENTO")
+    print("="*70)
+
+    resultados = []
+    grade = EspacoProduto(range(valores), repeat=eixos)
+    combinacoes = EspacoCombinacoes(range(n), r)
+    for rotulo, espaco, enumerar in (
+        (f"produto {valores}^{eixos}", grade, lambda: product(range(valores), repeat=eixos)),
+        (f"combinações C({n},{r})", combinacoes, lambda: combinations(range(n), r)),
+    ):
+        k = len(espaco) // 2
+        variantes = {
+            'islice(itertools, k)': lambda: next(islice(enumerar(), k, None)),
+            'espaco[k]': lambda: espaco[k],
+        }
+        if variantes['espaco[k]']() != variantes['islice(itertools, k)']():
+            raise AssertionError(f"unranking divergiu em {rotulo}")
+        medicoes = [
+            medir_caso(func, COMBINATORIA_CONFIG, caso=f"{nome}@{rotulo}")
+            for nome, func in variantes.items()
+        ]
+        mostrar(f"{rotulo} = {len(espaco):,} elementos, k={k:,}", variantes, medicoes)
+        resultados.extend(medicoes)
+
+        elemento = espaco[k]
+        ranking = medir_caso(lambda: espaco.posicao(elemento), COMBINATORIA_CONFIG,
+                             caso=f"espaco.posicao@{rotulo}")
+        print(f"   {'espaco.posicao(elemento)':<30} {descrever(ranking)}")
+        resultados.append(ranking)
+    return resultados
+
+
+@benchmark('cronometrado', 'combinatoria', 'enumeracao', medicoes=4)
+def benchmark_enumeracao(eixos=5, valores=10, n=30, r=4):
+    """Percorrer o espaço inteiro: itertools vs espaco.iterar (custo da indexabilidade)."""
+    from collections import deque
+
+    from medicao import medir_caso
+
+    print("\n" + "="*70)
+    print("ENUMERAÇÃO COMPLETA")
+    print("="*70)
+
+    resultados = []
+    grade = EspacoProduto(range(valores), repeat=eixos)
+    combinacoes = EspacoCombinacoes(range(n), r)
+    for rotulo, espaco, enumerar in (
+        (f"produto {valores}^{eixos}", grade, lambda: product(range(valores), repeat=eixos)),
+        (f"combinações C({n},{r})", combinacoes, lambda: combinations(range(n), r)),
+    ):
+        meio = len(espaco) // 2
+        if list(espaco.iterar(meio - 3, meio + 3)) != [espaco[i] for i in range(meio - 3, meio + 3)]:
+            raise AssertionError(f"iterar divergiu de espaco[i] em {rotulo}")
+        variantes = {
+            'itertools': lambda: deque(enumerar(), maxlen=0),
+            'espaco.iterar()': lambda: deque(espaco.iterar(), maxlen=0),
+        }
+        medicoes = [
+            medir_caso(func, COMBINATORIA_CONFIG, caso=f"{nome}@{rotulo}")
+            for nome, func in variantes.items()
+        ]
+        mostrar(f"{rotulo} = {len(espaco):,} elementos", variantes, medicoes)
+        resultados.extend(medicoes)
+    return resultados
+
+
+@benchmark('combinatoria', 'paralelo')
+def benchmark_paralelo(eixos=5, valores=10, tamanho_bloco=10_000, max_workers=os.cpu_count() or 1):
+    """Avaliar pontuar() na grade inteira: serial com itertools vs blocos em processos."""
+    import time
+
+    print("\n" + "="*70)
+    print("AVALIAÇÃO EM BLOCOS COM PROCESSOS")
+    print("="*70)
+
+    grade = EspacoProduto(range(valores), repeat=eixos)
+    print(f"\n📊 produto {valores}^{eixos} = {len(grade):,} elementos, blocos de {tamanho_bloco:,}:")
+
+    def cronometrar(caso, func):
+        inicio = time.perf_counter()
+        melhor = max(func())
+        decorrido = time.perf_counter() - inicio
+        return melhor, {'caso': caso, 'numero': 1, 'rodadas': 1, 'por_chamada': decorrido,
+                        'tempos': [decorrido], 'variacao': None}
+
+    esperado, serial = cronometrar('serial(itertools)', lambda: map(pontuar, product(range(valores), repeat=eixos)))
+    print(f"   {'serial (itertools)':<30} {serial['por_chamada']:8.3f} s")
+    resultados = [serial]
+    for workers in range(1, max_workers + 1):
+        melhor, medicao = cronometrar(
+            f"blocos@workers={workers}",
+            lambda: avaliar_em_paralelo(grade, pontuar, workers, tamanho_bloco),
+        )
+        if melhor != esperado:
+            raise AssertionError("avaliação em blocos divergiu da serial")
+        print(f"   {f'{workers} worker(s)':<30} {medicao['por_chamada']:8.3f} s  "
+              f"({serial['por_chamada'] / medicao['por_chamada']:.2f}x)")
+        resultados.append(medicao)
+    return resultados
+
+
+def main(argv=None):
+    if executar_suite("🎲 COMBINATÓRIA PREGUIÇOSA E AVALIAÇÃO EM BLOCOS", COMBINATORIA_CONFIG, argv) is None:
+        return
+
+    print(f"""
+💡 Lições:
+   - Unranking acessa o k-ésimo elemento em O(eixos) ou O(n), sem iterar k vezes
+   - Para percorrer tudo, itertools (em C) continua imbatível: indexar é
+     para saltar, dividir e retomar, não para enumerar
+   - Blocos contíguos [inicio, fim) viajam como três números: cada
+     processo enumera o próprio trecho sem receber a grade materializada
+    """)
+
+
+if __name__ == "__main__":
+    main()
@@ -2,30 +2,40 @@
 """
 Demo Rápido - Zen of Python e Otimizações
 Execute: python demo_rapido.py
+Modo rápido/CI: python demo_rapido.py --rapido [--orcamento 1.0]
 """
 
+import os
 import time
 import sys
-from pathlib import Path
 
 def mostrar_cabecalho():
     print("\n" + "="*80)
     print(" 🐍 ZEN PYTHON & OTIMIZAÇÕES - DEMO RÁPIDO")
     print("="*80)
 
-def zen_python():
+def zen_python(rapido=False):
     print("\n📜 O Zen of Python:")
     print("-" * 40)
     import this
-    time.sleep(2)
+    if not rapido:
+        time.sleep(2)
 
-def demo_otimizacao_rapida():
-    print("\n\n⚡ DEMO: Diferença de Performance")
-    print("-" * 40)
-    
-    # Preparar dados
+def repeticoes(funcs, padrao, orcamento=None):
+    """
+    Número de repetições comum aos casos comparados: o padrão ou o que
+    cabe no orçamento (segundos) somando uma chamada de cada caso.
+    """
+    if orcamento is None:
+        return padrao
+    inicio = time.perf_counter()
+    for func in funcs:
+        func()
+    por_rodada = max(time.perf_counter() - inicio, 1e-9)
+    return max(1, min(padrao, int(orcamento / por_rodada)))
+
+def demo_busca(orcamento=None):
     import timeit
-    from collections import Counter
     
     # Demo 1: Busca em coleções
     print("\n1️⃣ Busca em Coleções")
@@ -33,12 +43,18 @@ def demo_otimizacao_rapida():
     conjunto = set(lista)
     
     # Teste busca
-    tempo_lista = timeit.timeit(lambda: 9999 in lista, number=1000)
-    tempo_set = timeit.timeit(lambda: 9999 in conjunto, number=1000)
+    busca_lista = lambda: 9999 in lista
+    busca_set = lambda: 9999 in conjunto
+    numero = repeticoes([busca_lista, busca_set], 1000, orcamento)
+    tempo_lista = timeit.timeit(busca_lista, number=numero)
+    tempo_set = timeit.timeit(busca_set, number=numero)
     
     print(f"   Lista:  {tempo_lista:.6f}s")
     print(f"   Set:    {tempo_set:.6f}s")
     print(f"   📊 Set é {tempo_lista/tempo_set:.0f}x mais rápido! ⚡")
+
+def demo_strings(orcamento=None):
+    import timeit
     
     # Demo 2: Concatenação de strings
     print("\n2️⃣ Concatenação de Strings")
@@ -53,12 +69,17 @@ def demo_otimizacao_rapida():
     def concat_join():
         return " ".join(palavras)
     
-    tempo_plus = timeit.timeit(concat_plus, number=100)
-    tempo_join = timeit.timeit(concat_join, number=100)
+    numero = repeticoes([concat_plus, concat_join], 100, orcamento)
+    tempo_plus = timeit.timeit(concat_plus, number=numero)
+    tempo_join = timeit.timeit(concat_join, number=numero)
     
     print(f"   Operador +:  {tempo_plus:.6f}s")
     print(f"   Join:        {tempo_join:.6f}s")
     print(f"   📊 Join é {tempo_plus/tempo_join:.0f}x mais rápido! ⚡")
+
+def demo_contagem(orcamento=None):
+    import timeit
+    from collections import Counter
     
     # Demo 3: Counter
     print("\n3️⃣ Contagem de Elementos")
@@ -73,19 +94,75 @@ def demo_otimizacao_rapida():
     def count_counter():
         return dict(Counter(data))
     
-    tempo_manual = timeit.timeit(count_manual, number=1000)
-    tempo_counter = timeit.timeit(count_counter, number=1000)
+    numero = repeticoes([count_manual, count_counter], 1000, orcamento)
+    tempo_manual = timeit.timeit(count_manual, number=numero)
+    tempo_counter = timeit.timeit(count_counter, number=numero)
     
     print(f"   Manual:   {tempo_manual:.6f}s")
     print(f"   Counter:  {tempo_counter:.6f}s")
     print(f"   📊 Counter é {tempo_manual/tempo_counter:.1f}x mais rápido! ⚡")
 
+DEMOS = [demo_busca, demo_strings, demo_contagem]
 
-def main():
+def demo_otimizacao_rapida():
+    print("\n\n⚡ DEMO: Diferença de Performance")
+    print("-" * 40)
+    
+    for demo in DEMOS:
+        demo()
+
+def demo_otimizacao_paralela(orcamento):
+    """Roda cada demo em um subprocesso isolado, em paralelo, e imprime na ordem."""
+    import subprocess
+    
+    print("\n\n⚡ DEMO: Diferença de Performance (modo rápido)")
+    print("-" * 40)
+    
+    por_demo = orcamento / len(DEMOS)
+    processos = [
+        subprocess.Popen(
+            [sys.executable, __file__, '--demo', str(indice), '--orcamento', str(por_demo)],
+            stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+            env=dict(os.environ, PYTHONIOENCODING='utf-8'),
+        )
+        for indice in range(len(DEMOS))
+    ]
+    falhas = 0
+    for processo in processos:
+        saida, _ = processo.communicate()
+        print(saida.decode('utf-8'), end='')
+        falhas += processo.returncode != 0
+    if falhas:
+        raise RuntimeError(f"{falhas} demo(s) falharam")
+
+def ler_argumentos(argv=None):
+    import argparse
+    
+    parser = argparse.ArgumentParser(description="Demo rápido do Zen of Python e otimizações")
+    parser.add_argument('--rapido', '--ci', action='store_true',
+                        default=os.environ.get('ZEN_DEMO_RAPIDO', '').lower() in ('1', 'true', 'sim', 'yes'),
+                        help='sem pausas, repetições ajustadas ao orçamento e demos em paralelo')
+    parser.add_argument('--orcamento', type=float, default=1.0,
+                        help='tempo alvo (s) para as medições no modo rápido')
+    parser.add_argument('--demo', type=int, help=argparse.SUPPRESS)
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = ler_argumentos(argv)
+    
+    # Subprocesso do modo rápido: executa apenas uma demo
+    if args.demo is not None:
+        DEMOS[args.demo](args.orcamento)
+        return
+    
     try:
         mostrar_cabecalho()
-        zen_python()
-        demo_otimizacao_rapida()
+        zen_python(rapido=args.rapido)
+        if args.rapido:
+            demo_otimizacao_paralela(args.orcamento)
+        else:
+            demo_otimizacao_rapida()
         
         print("\n" + "="*80)
         print("✅ Demo concluído! Para mais exemplos, execute os outros scripts.")
@@ -0,0 +1,422 @@
+#!/usr/bin/env python3
+"""
+📈 Estatísticas Online para Fluxos
+
+exemplo_builtins calcula sum/max/min/len sobre uma lista inteira e
+exemplo_19_namespaces usa statistics.mean. Fluxos que não cabem em
+memória pedem agregados de uma passada, com memória constante:
+
+- ResumoOnline: contagem, média e variância (Welford), mínimo e máximo
+- QuantilP2: um quantil estimado com 5 marcadores (algoritmo P², Jain &
+  Chlamtac), memória O(1)
+- TDigest: vários quantis com erro pequeno nas caudas (t-digest com
+  fusão de centroides)
+
+ResumoOnline e TDigest são mescláveis: cada fragmento do fluxo (ex.: um
+processo por arquivo) calcula seu estado parcial e os estados são
+combinados no fim com mesclar().
+
+Os benchmarks comparam precisão e throughput com statistics.mean,
+sum()/len() e statistics.median sobre listas materializadas.
+
+Executar: python estatisticas_online.py
+"""
+
+import math
+import random
+
+from registro_benchmarks import benchmark, executar_suite
+
+ESTATISTICAS_CONFIG = {
+    'orcamento_total': 6.0,  # Segundos de medição divididos entre todos os casos
+    'rodadas': 3,
+    'instrumentar': [],
+    'estavel': False,
+    'seeds': 42,
+}
+
+
+# ============================================================================
+# AGREGADOS ONLINE
+# ============================================================================
+
+class ResumoOnline:
+    """Contagem, média, variância (Welford), mínimo e máximo em uma passada."""
+
+    __slots__ = ('n', 'media', 'm2', 'minimo', 'maximo')
+
+    def __init__(self, valores=()):
+        self.n = 0
+        self.media = 0.0
+        self.m2 = 0.0  # soma dos quadrados dos desvios em relação à média
+        self.minimo = math.inf
+        self.maximo = -math.inf
+        self.atualizar(valores)
+
+    def adicionar(self, valor):
+        self.n += 1
+        delta = valor - self.media
+        self.media += delta / self.n
+        self.m2 += delta * (valor - self.media)
+        if valor < self.minimo:
+            self.minimo = valor
+        if valor > self.maximo:
+            self.maximo = valor
+
+    def atualizar(self, valores):
+        """Consome um iterável; o laço usa variáveis locais em vez de atributos."""
+        n, media, m2, minimo, maximo = self.n, self.media, self.m2, self.minimo, self.maximo
+        for valor in valores:
+            n += 1
+            delta = valor - media
+            media += delta / n
+            m2 += delta * (valor - media)
+            if valor < minimo:
+                minimo = valor
+            if valor > maximo:
+                maximo = valor
+        self.n, self.media, self.m2, self.minimo, self.maximo = n, media, m2, minimo, maximo
+        return self
+
+    @property
+    def variancia(self):
+        """Variância amostral (n - 1), como statistics.variance."""
+        return self.m2 / (self.n - 1) if self.n > 1 else 0.0
+
+    @property
+    def desvio(self):
+        return math.sqrt(self.variancia)
+
+    def mesclar(self, outro):
+        """Combina dois resumos parciais (Chan et al.) em um novo."""
+        resultado = ResumoOnline()
+        n = self.n + outro.n
+        if n == 0:
+            return resultado
+        delta = outro.media - self.media
+        resultado.n = n
+        resultado.media = self.media + delta * outro.n / n
+        resultado.m2 = self.m2 + outro.m2 + delta * delta * self.n * outro.n / n
+        resultado.minimo = min(self.minimo, outro.minimo)
+        resultado.maximo = max(self.maximo, outro.maximo)
+        return resultado
+
+
+class QuantilP2:
+    """
+    Estimativa de um quantil p com cinco marcadores (P²).
+
+    Os marcadores guardam mínimo, p/2, p, (1+p)/2 e máximo; a cada valor
+    os do meio são ajustados por interpolação parabólica. Não é mesclável.
+    """
+
+    def __init__(self, p):
+        if not 0 < p < 1:
+            raise ValueError("p deve estar entre 0 e 1")
+        self.p = p
+        self.alturas = []
+        self.posicoes = [0, 1, 2, 3, 4]
+        self.desejadas = [0, 2 * p, 4 * p, 2 + 2 * p, 4]
+        self.incrementos = [0, p / 2, p, (1 + p) / 2, 1]
+
+    def adicionar(self, valor):
+        q, n = self.alturas, self.posicoes
+        if len(q) < 5:
+            q.append(valor)
+            q.sort()
+            return
+
+        if valor < q[0]:
+            q[0] = valor
+            k = 0
+        elif valor >= q[4]:
+            q[4] = valor
+            k = 3
+        else:
+            k = 0
+            while valor >= q[k + 1]:
+                k += 1
+        for i in range(k + 1, 5):
+            n[i] += 1
+        desejadas = self.desejadas
+        for i in range(5):
+            desejadas[i] += self.incrementos[i]
+
+        for i in (1, 2, 3):
+            d = desejadas[i] - n[i]
+            if (d >= 1 and n[i + 1] - n[i] > 1) or (d <= -1 and n[i - 1] - n[i] < -1):
+                d = 1 if d > 0 else -1
+                parabolica = q[i] + d / (n[i + 1] - n[i - 1]) * (
+                    (n[i] - n[i - 1] + d) * (q[i + 1] - q[i]) / (n[i + 1] - n[i])
+                    + (n[i + 1] - n[i] - d) * (q[i] - q[i - 1]) / (n[i] - n[i - 1])
+                )
+                if q[i - 1] < parabolica < q[i + 1]:
+                    q[i] = parabolica
+                else:
+                    q[i] += d * (q[i + d] - q[i]) / (n[i + d] - n[i])
+                n[i] += d
+
+    def atualizar(self, valores):
+        for valor in valores:
+            self.adicionar(valor)
+        return self
+
+    @property
+    def valor(self):
+        q = self.alturas
+        if len(q) < 5:
+            return q[min(len(q) - 1, int(self.p * len(q)))] if q else math.nan
+        return q[2]
+
+
+class TDigest:
+    """
+    t-digest com fusão: centroides (média, peso) ordenados, menores nas caudas.
+
+    Os valores entram em um buffer; ao comprimir, buffer e centroides são
+    ordenados juntos e fundidos enquanto o peso acumulado couber no limite
+    da função de escala k1, que aperta perto de q=0 e q=1.
+    """
+
+    def __init__(self, compressao=100):
+        self.compressao = compressao
+        self.centroides = []
+        self.buffer = []
+        self.total = 0
+        self.minimo = math.inf
+        self.maximo = -math.inf
+
+    def adicionar(self, valor):
+        self.buffer.append(valor)
+        if len(self.buffer) >= 20 * self.compressao:
+            self._comprimir()
+
+    def atualizar(self, valores):
+        limite = 20 * self.compressao
+        buffer = self.buffer
+        for valor in valores:
+            buffer.append(valor)
+            if len(buffer) >= limite:
+                self._comprimir()
+        return self
+
+    def _limite(self, q):
+        """Maior quantil que o centroide iniciado em q pode alcançar (escala k1)."""
+        k = self.compressao / (2 * math.pi) * math.asin(2 * q - 1) + 1
+        if k >= self.compressao / 4:
+            return 1.0
+        return (math.sin(k * 2 * math.pi / self.compressao) + 1) / 2
+
+    def _comprimir(self):
+        if not self.buffer:
+            return
+        self.minimo = min(self.minimo, min(self.buffer))
+        self.maximo = max(self.maximo, max(self.buffer))
+        pontos = sorted(self.centroides + [(valor, 1) for valor in self.buffer])
+        self.buffer.clear()  # atualizar() guarda a mesma lista em uma variável local
+        self._fundir(pontos)
+
+    def _fundir(self, pontos):
+        """Funde (média, peso) ordenados enquanto o peso acumulado couber no limite."""
+        total = self.total = sum(peso for _, peso in pontos)
+        fundidos = []
+        media, peso = pontos[0]
+        acumulado = 0
+        limite = self._limite(0.0) * total
+        for m, w in pontos[1:]:
+            if acumulado + peso + w <= limite:
+                peso += w
+                media += (m - media) * w / peso
+            else:
+                fundidos.append((media, peso))
+                acumulado += peso
+                limite = self._limite(acumulado / total) * total
+                media, peso = m, w
+        fundidos.append((media, peso))
+        self.centroides = fundidos
+
+    def mesclar(self, outro):
+        """Combina dois digests parciais em um novo."""
+        self._comprimir()
+        outro._comprimir()
+        resultado = TDigest(self.compressao)
+        resultado.minimo = min(self.minimo, outro.minimo)
+        resultado.maximo = max(self.maximo, outro.maximo)
+        pontos = sorted(self.centroides + outro.centroides)
+        if pontos:
+            resultado._fundir(pontos)
+        return resultado
+
+    def quantil(self, q):
+        """Quantil q (0..1), interpolando entre os centros dos centroides."""
+        self._comprimir()
+        centroides = self.centroides
+        if not centroides:
+            return math.nan
+        alvo = q * self.total
+        anterior_media, anterior_centro = self.minimo, 0.0
+        acumulado = 0
+        for media, peso in centroides:
+            centro = acumulado + peso / 2
+            if alvo < centro:
+                fracao = (alvo - anterior_centro) / (centro - anterior_centro)
+                return anterior_media + (media - anterior_media) * fracao
+            anterior_media, anterior_centro = media, centro
+            acumulado += peso
+        if self.total == anterior_centro:
+            return self.maximo
+        fracao = (alvo - anterior_centro) / (self.total - anterior_centro)
+        return anterior_media + (self.maximo - anterior_media) * min(1.0, fracao)
+
+
+# ============================================================================
+# BENCHMARKS
+# ============================================================================
+
+def gerar_fluxo(quantidade, seed=ESTATISTICAS_CONFIG['seeds']):
+    """Valores assimétricos (lognormal), como latências ou valores de pedidos."""
+    gerador = random.Random(seed)
+    return [gerador.lognormvariate(3, 0.8) for _ in range(quantidade)]
+
+
+def erro_relativo(estimado, exato):
+    return abs(estimado - exato) / abs(exato) if exato else abs(estimado)
+
+
+def quantil_exato(ordenados, q):
+    """Quantil q de uma lista ordenada, interpolando entre vizinhos (como numpy 'linear')."""
+    posicao = q * (len(ordenados) - 1)
+    abaixo = int(posicao)
+    acima = min(abaixo + 1, len(ordenados) - 1)
+    return ordenados[abaixo] + (ordenados[acima] - ordenados[abaixo]) * (posicao - abaixo)
+
+
+@benchmark('estatisticas', 'precisao')
+def benchmark_precisao(quantidade=200_000, fragmentos=8):
+    """Erro dos agregados online (inteiros e mesclados de fragmentos) contra os valores exatos."""
+    import statistics
+
+    print("\n" + "="*70)
+    print("PRECISÃO DOS AGREGADOS ONLINE")
+    print("="*70)
+
+    valores = gerar_fluxo(quantidade)
+    ordenados = sorted(valores)
+
+    resumo = ResumoOnline(valores)
+    digest = TDigest().atualizar(valores)
+    medianas = QuantilP2(0.5).atualizar(valores)
+    p99 = QuantilP2(0.99).atualizar(valores)
+
+    # Estados parciais por fragmento, mesclados no fim (como em processos paralelos)
+    passo = -(-quantidade // fragmentos)
+    partes = [valores[i:i + passo] for i in range(0, quantidade, passo)]
+    resumo_mesclado = ResumoOnline()
+    digest_mesclado = TDigest()
+    for parte in partes:
+        resumo_mesclado = resumo_mesclado.mesclar(ResumoOnline(parte))
+        digest_mesclado = digest_mesclado.mesclar(TDigest().atualizar(parte))
+
+    comparacoes = [
+        ('média', sum(valores) / len(valores), [
+            ('Welford', resumo.media), (f'Welford mesclado ({fragmentos})', resumo_mesclado.media)]),
+        ('desvio padrão', statistics.stdev(valores), [
+            ('Welford', resumo.desvio), (f'Welford mesclado ({fragmentos})', resumo_mesclado.desvio)]),
+        ('mediana', statistics.median(valores), [
+            ('P²', medianas.valor), ('t-digest', digest.quantil(0.5)),
+            (f't-digest mesclado ({fragmentos})', digest_mesclado.quantil(0.5))]),
+        ('p99', quantil_exato(ordenados, 0.99), [
+            ('P²', p99.valor), ('t-digest', digest.quantil(0.99)),
+            (f't-digest mesclado ({fragmentos})', digest_mesclado.quantil(0.99))]),
+        ('p99.9', quantil_exato(ordenados, 0.999), [
+            ('t-digest', digest.quantil(0.999)),
+            (f't-digest mesclado ({fragmentos})', digest_mesclado.quantil(0.999))]),
+    ]
+
+    print(f"\n📊 {quantidade:,} valores lognormais ({len(digest.centroides)} centroides no t-digest):")
+    resultados = []
+    for estatistica, valor_exato, estimativas in comparacoes:
+        print(f"\n   {estatistica} exata: {valor_exato:.6g}")
+        for nome, estimado in estimativas:
+            erro = erro_relativo(estimado, valor_exato)
+            print(f"   {nome:<28} {estimado:>14.6g}  erro {erro:.2e}")
+            resultados.append({'caso': f"{estatistica}@{nome}", 'estimado': estimado,
+                               'exato': valor_exato, 'erro_relativo': erro})
+    return resultados
+
+
+@benchmark('cronometrado', 'estatisticas', 'throughput', medicoes=7)
+def benchmark_throughput(quantidade=100_000):
+    """Valores por segundo: statistics sobre a lista vs agregados online de uma passada."""
+    import statistics
+
+    from medicao import descrever, formatar_bytes, medir_caso, pico_memoria
+
+    print("\n" + "="*70)
+    print("THROUGHPUT E MEMÓRIA")
+    print("="*70)
+
+    def media(lista):
+        return sum(lista) / len(lista)
+
+    valores = gerar_fluxo(quantidade)
+    variantes = {
+        'statistics.mean(lista)': lambda: statistics.mean(valores),
+        'sum(lista) / len(lista)': lambda: media(valores),
+        'statistics.median(lista)': lambda: statistics.median(valores),
+        'sorted(lista)[p99]': lambda: sorted(valores)[int(0.99 * quantidade)],
+        'ResumoOnline (Welford)': lambda: ResumoOnline(valores),
+        'QuantilP2(0.5)': lambda: QuantilP2(0.5).atualizar(valores),
+        'TDigest': lambda: TDigest().atualizar(valores).quantil(0.5),
+    }
+
+    # Memória para consumir um fluxo gerado sob demanda: materializar vs uma passada
+    def fluxo():
+        gerador = random.Random(ESTATISTICAS_CONFIG['seeds'])
+        return (gerador.lognormvariate(3, 0.8) for _ in range(quantidade))
+
+    memoria = {
+        'statistics.mean(lista)': lambda: statistics.mean(list(fluxo())),
+        'sum(lista) / len(lista)': lambda: media(list(fluxo())),
+        'statistics.median(lista)': lambda: statistics.median(list(fluxo())),
+        'sorted(lista)[p99]': lambda: sorted(fluxo())[int(0.99 * quantidade)],
+        'ResumoOnline (Welford)': lambda: ResumoOnline(fluxo()),
+        'QuantilP2(0.5)': lambda: QuantilP2(0.5).atualizar(fluxo()),
+        'TDigest': lambda: TDigest().atualizar(fluxo()).quantil(0.5),
+    }
+
+    print(f"\n📊 {quantidade:,} valores (pico de memória ao consumir um fluxo gerado sob demanda):")
+    resultados = []
+    for nome, func in variantes.items():
+        medicao = medir_caso(func, ESTATISTICAS_CONFIG, caso=nome)
+        medicao['valores_s'] = quantidade / medicao['por_chamada']
+        medicao['pico_bytes'] = pico_memoria(memoria[nome])
+        print(f"   {nome:<26} {descrever(medicao)}  {medicao['valores_s'] / 1e6:6.2f} M valores/s  "
+              f"pico {formatar_bytes(medicao['pico_bytes']):>9}")
+        resultados.append(medicao)
+    return resultados
+
+
+def main(argv=None):
+    if executar_suite("📈 ESTATÍSTICAS ONLINE PARA FLUXOS", ESTATISTICAS_CONFIG, argv) is None:
+        return
+
+    print(f"""
+💡 Lições:
+   - statistics.mean é exata (usa frações) e por isso lenta; para floats,
+     sum()/len() (ou fmean, no Python 3.8+) é muito mais rápida
+   - Welford calcula média e variância em uma passada, com memória O(1) e
+     sem a perda de precisão de somar quadrados
+   - P² estima um quantil fixo com 5 números; t-digest estima qualquer
+     quantil e pode ser mesclado; nas caudas extremas (p99.9) o erro cai
+     com uma compressão maior
+   - Em Python puro os agregados online não vencem sorted() e sum() em C
+     no throughput: o ganho é a memória constante e não precisar
+     materializar o fluxo
+   - Estados mescláveis permitem agregar fragmentos em paralelo e combinar
+     no fim sem reler os dados
+    """)
+
+
+if __name__ == "__main__":
+    main()
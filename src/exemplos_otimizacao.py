@@ -5,41 +5,89 @@ Este script demonstra técnicas de otimização com benchmarks reais.
 Cada exemplo compara diferentes abordagens e mede a performance.
 
 Executar: python exemplos_otimizacao.py
+Listar casos: python exemplos_otimizacao.py --listar
+Um caso: python exemplos_otimizacao.py benchmark_busca -p tamanho=100000
+Matriz: python exemplos_otimizacao.py 'benchmark_*' --matriz tamanho=100,1000,10000
+Distribuições: python exemplos_otimizacao.py 'benchmark_*' --matriz distribuicao=uniforme,zipf,colisoes
+Instrumentar: python exemplos_otimizacao.py --instrumentar cprofile,perf,monitoring --json saida.json
+Progresso e telemetria: python exemplos_otimizacao.py --progresso --telemetria eventos.jsonl --tempo-limite 60
 Tempo estimado: 2-5 minutos (dependendo do hardware)
 
 Autor: Repositório Zen Python
 Licença: MIT
 """
 
-import timeit
 import sys
-from itertools import product, groupby, chain, combinations
-from collections import Counter, defaultdict
-from operator import itemgetter
-import random
+
+from registro_benchmarks import benchmark, executar_suite
+
+# Módulos mais pesados (random, itertools, collections, operator)
+# são importados dentro de cada exemplo: a partida do script fica mais
+# rápida e cada função declara explicitamente do que depende.
 
 # Configurações para os benchmarks
 BENCHMARK_CONFIG = {
     'tamanho_teste': 10000,
-    'repeticoes': 1000,
+    'orcamento_total': 6.0,  # Segundos de medição divididos entre todos os casos
+    'rodadas': 5,            # Rodadas por caso (reporta-se a mais rápida)
+    'instrumentar': [],      # Opcional: 'cprofile', 'perf', 'monitoring'
+    'estavel': False,        # GC congelado nas medições (ver ambiente_estavel.py)
     'seeds': 42  # Para reprodutibilidade
 }
 
+
+def medir_caso(func):
+    """
+    Mede um caso com repetições adaptativas.
+
+    O número de iterações é escolhido para que cada rodada dure a fração
+    do orçamento total que cabe a este caso; o overhead do laço de
+    medição é calibrado e subtraído (ver medicao.py).
+    """
+    import medicao
+
+    return medicao.medir_caso(func, BENCHMARK_CONFIG)
+
+
+def descrever(resultado):
+    """Tempo por chamada e número de iterações de uma medição."""
+    import medicao
+
+    return medicao.descrever(resultado)
+
+
+def gerar_dados(distribuicao, quantidade, maximo=None, textos=False):
+    """
+    Entrada de teste com uma distribuição de cargas_trabalho.py (zipf,
+    normal, colisoes...). Com distribuicao=None, cada benchmark usa a
+    sua entrada original.
+    """
+    from cargas_trabalho import gerar_inteiros, gerar_textos
+
+    gerar = gerar_textos if textos else gerar_inteiros
+    return gerar(distribuicao, quantidade, maximo, seed=BENCHMARK_CONFIG['seeds'])
+
+
+def sufixo_distribuicao(distribuicao):
+    return f" ({distribuicao})" if distribuicao else ""
+
 # ============================================================================
 # EXEMPLO 1: BUSCA EM COLEÇÕES
 # ============================================================================
 
-def benchmark_busca():
+@benchmark('cronometrado', 'colecoes', 'busca', medicoes=3)
+def benchmark_busca(tamanho=BENCHMARK_CONFIG['tamanho_teste'], distribuicao=None):
+    """Busca de um valor ausente: loop manual vs 'in' em lista vs 'in' em set."""
     print("\n" + "="*70)
     print("EXEMPLO 1: BUSCA EM COLEÇÕES")
     print("="*70)
     
     # Criar dados de teste
-    tamanho = BENCHMARK_CONFIG['tamanho_teste']
-    repeticoes = BENCHMARK_CONFIG['repeticoes']
-    lista = list(range(tamanho))
+    lista = list(range(tamanho)) if distribuicao is None else gerar_dados(distribuicao, tamanho)
     conjunto = set(lista)
-    valor_buscar = tamanho - 1  # Pior caso: último elemento
+    # Pior caso: valor ausente, a lista inteira é percorrida (com repetidos, o
+    # último elemento pode aparecer antes e a busca pararia cedo)
+    valor_buscar = max(lista, default=0) + 1
     
     # Método 1: Loop em lista
     def busca_lista():
@@ -57,27 +105,37 @@ def benchmark_busca():
         return valor_buscar in conjunto
     
     # Benchmarks
-    tempo_loop = timeit.timeit(busca_lista, number=repeticoes)
-    tempo_lista_in = timeit.timeit(busca_lista_in, number=repeticoes)
-    tempo_set = timeit.timeit(busca_set, number=repeticoes)
-    
-    print(f"\n📊 Buscar elemento em coleção de {tamanho:,} elementos:")
-    print(f"   Loop manual:        {tempo_loop:.6f}s")
-    print(f"   'in' com lista:     {tempo_lista_in:.6f}s  ({tempo_loop/tempo_lista_in:.1f}x mais rápido)")
-    print(f"   'in' com set:       {tempo_set:.6f}s  ({tempo_loop/tempo_set:.1f}x mais rápido) ⚡")
+    loop = medir_caso(busca_lista)
+    lista_in = medir_caso(busca_lista_in)
+    set_ = medir_caso(busca_set)
+    tempo_loop = loop['por_chamada']
+    tempo_lista_in = lista_in['por_chamada']
+    tempo_set = set_['por_chamada']
+    
+    print(f"\n📊 Buscar elemento em coleção de {tamanho:,} elementos{sufixo_distribuicao(distribuicao)}:")
+    print(f"   Loop manual:        {descrever(loop)}")
+    print(f"   'in' com lista:     {descrever(lista_in)}  ({tempo_loop/tempo_lista_in:.1f}x mais rápido)")
+    print(f"   'in' com set:       {descrever(set_)}  ({tempo_loop/tempo_set:.1f}x mais rápido) ⚡")
     print(f"\n💡 Set é {tempo_lista_in/tempo_set:.0f}x mais rápido que lista!")
+    
+    return [loop, lista_in, set_]
 
 
 # ============================================================================
 # EXEMPLO 2: CONCATENAÇÃO DE STRINGS
 # ============================================================================
 
-def benchmark_strings():
+@benchmark('cronometrado', 'strings', medicoes=3)
+def benchmark_strings(quantidade=1000, distribuicao=None):
+    """Concatenação: operador + vs append + join vs join direto."""
     print("\n" + "="*70)
     print("EXEMPLO 2: CONCATENAÇÃO DE STRINGS")
     print("="*70)
     
-    palavras = ['palavra'] * 1000
+    if distribuicao is None:
+        palavras = ['palavra'] * quantidade
+    else:
+        palavras = gerar_dados(distribuicao, quantidade, textos=True)
     
     # Método 1: Concatenação com +
     def concat_plus():
@@ -97,28 +155,40 @@ def benchmark_strings():
             partes.append(palavra)
         return " ".join(partes)
     
-    tempo_plus = timeit.timeit(concat_plus, number=100)
-    tempo_join = timeit.timeit(concat_join, number=100)
-    tempo_list_join = timeit.timeit(concat_list_join, number=100)
-    
-    print(f"\n📊 Concatenar {len(palavras)} strings:")
-    print(f"   Operador +:         {tempo_plus:.6f}s")
-    print(f"   List + join:        {tempo_list_join:.6f}s  ({tempo_plus/tempo_list_join:.1f}x mais rápido)")
-    print(f"   Join direto:        {tempo_join:.6f}s  ({tempo_plus/tempo_join:.1f}x mais rápido) ⚡")
+    plus = medir_caso(concat_plus)
+    join = medir_caso(concat_join)
+    list_join = medir_caso(concat_list_join)
+    tempo_plus = plus['por_chamada']
+    tempo_join = join['por_chamada']
+    tempo_list_join = list_join['por_chamada']
+    
+    print(f"\n📊 Concatenar {len(palavras)} strings{sufixo_distribuicao(distribuicao)}:")
+    print(f"   Operador +:         {descrever(plus)}")
+    print(f"   List + join:        {descrever(list_join)}  ({tempo_plus/tempo_list_join:.1f}x mais rápido)")
+    print(f"   Join direto:        {descrever(join)}  ({tempo_plus/tempo_join:.1f}x mais rápido) ⚡")
     print(f"\n💡 Join é {tempo_plus/tempo_join:.0f}x mais rápido que concatenação com +!")
+    
+    return [plus, list_join, join]
 
 
 # ============================================================================
 # EXEMPLO 3: REMOÇÃO DE DUPLICATAS
 # ============================================================================
 
-def benchmark_duplicatas():
+@benchmark('cronometrado', 'colecoes', 'duplicatas', medicoes=3)
+def benchmark_duplicatas(tamanho=1000, maximo=100, distribuicao=None):
+    """Remoção de duplicatas: loop com 'in' vs set vs dict.fromkeys."""
+    import random
+
     print("\n" + "="*70)
     print("EXEMPLO 3: REMOÇÃO DE DUPLICATAS")
     print("="*70)
     
     # Lista com duplicatas
-    lista = [random.randint(0, 100) for _ in range(1000)]
+    if distribuicao is None:
+        lista = [random.randint(0, maximo) for _ in range(tamanho)]
+    else:
+        lista = gerar_dados(distribuicao, tamanho, maximo)
     
     # Método 1: Loop com verificação
     def remove_dup_loop():
@@ -136,27 +206,34 @@ def benchmark_duplicatas():
     def remove_dup_dict():
         return list(dict.fromkeys(lista))
     
-    tempo_loop = timeit.timeit(remove_dup_loop, number=100)
-    tempo_set = timeit.timeit(remove_dup_set, number=100)
-    tempo_dict = timeit.timeit(remove_dup_dict, number=100)
-    
-    print(f"\n📊 Remover duplicatas de lista com {len(lista)} elementos:")
-    print(f"   Loop com 'in':      {tempo_loop:.6f}s")
-    print(f"   Set (sem ordem):    {tempo_set:.6f}s  ({tempo_loop/tempo_set:.1f}x mais rápido) ⚡")
-    print(f"   Dict (com ordem):   {tempo_dict:.6f}s  ({tempo_loop/tempo_dict:.1f}x mais rápido)")
+    loop = medir_caso(remove_dup_loop)
+    set_ = medir_caso(remove_dup_set)
+    dict_ = medir_caso(remove_dup_dict)
+    tempo_loop = loop['por_chamada']
+    tempo_set = set_['por_chamada']
+    tempo_dict = dict_['por_chamada']
+    
+    print(f"\n📊 Remover duplicatas de lista com {len(lista)} elementos{sufixo_distribuicao(distribuicao)}:")
+    print(f"   Loop com 'in':      {descrever(loop)}")
+    print(f"   Set (sem ordem):    {descrever(set_)}  ({tempo_loop/tempo_set:.1f}x mais rápido) ⚡")
+    print(f"   Dict (com ordem):   {descrever(dict_)}  ({tempo_loop/tempo_dict:.1f}x mais rápido)")
     print(f"\n💡 Set é {tempo_loop/tempo_set:.0f}x mais rápido que loop!")
+    
+    return [loop, set_, dict_]
 
 
 # ============================================================================
 # EXEMPLO 4: OPERAÇÕES COM LISTAS
 # ============================================================================
 
-def benchmark_listas():
+@benchmark('cronometrado', 'listas', medicoes=3)
+def benchmark_listas(tamanho=1000, distribuicao=None):
+    """Transformação e filtro: loop + append vs comprehension vs map + filter."""
     print("\n" + "="*70)
     print("EXEMPLO 4: TRANSFORMAÇÃO DE LISTAS")
     print("="*70)
     
-    numeros = list(range(1000))
+    numeros = list(range(tamanho)) if distribuicao is None else gerar_dados(distribuicao, tamanho)
     
     # Método 1: Loop com append
     def transform_loop():
@@ -174,22 +251,29 @@ def benchmark_listas():
     def transform_map_filter():
         return list(map(lambda x: x ** 2, filter(lambda x: x % 2 == 0, numeros)))
     
-    tempo_loop = timeit.timeit(transform_loop, number=1000)
-    tempo_comp = timeit.timeit(transform_comp, number=1000)
-    tempo_map = timeit.timeit(transform_map_filter, number=1000)
-    
-    print(f"\n📊 Transformar e filtrar lista de {len(numeros)} elementos:")
-    print(f"   Loop + append:      {tempo_loop:.6f}s")
-    print(f"   List comprehension: {tempo_comp:.6f}s  ({tempo_loop/tempo_comp:.1f}x mais rápido) ⚡")
-    print(f"   Map + filter:       {tempo_map:.6f}s  ({tempo_loop/tempo_map:.1f}x mais rápido)")
+    loop = medir_caso(transform_loop)
+    comp = medir_caso(transform_comp)
+    map_ = medir_caso(transform_map_filter)
+    tempo_loop = loop['por_chamada']
+    tempo_comp = comp['por_chamada']
+    tempo_map = map_['por_chamada']
+    
+    print(f"\n📊 Transformar e filtrar lista de {len(numeros)} elementos{sufixo_distribuicao(distribuicao)}:")
+    print(f"   Loop + append:      {descrever(loop)}")
+    print(f"   List comprehension: {descrever(comp)}  ({tempo_loop/tempo_comp:.1f}x mais rápido) ⚡")
+    print(f"   Map + filter:       {descrever(map_)}  ({tempo_loop/tempo_map:.1f}x mais rápido)")
     print(f"\n💡 List comprehension é a forma mais pythônica e eficiente!")
+    
+    return [loop, comp, map_]
 
 
 # ============================================================================
 # EXEMPLO 5: OPERAÇÕES DE CONJUNTO
 # ============================================================================
 
+@benchmark('exemplo', 'colecoes')
 def exemplo_sets():
+    """Operações de conjunto: interseção, união e diferenças."""
     print("\n" + "="*70)
     print("EXEMPLO 5: OPERAÇÕES DE CONJUNTO")
     print("="*70)
@@ -214,7 +298,12 @@ def exemplo_sets():
 # EXEMPLO 6: ITERTOOLS
 # ============================================================================
 
+@benchmark('exemplo', 'itertools')
 def exemplo_itertools():
+    """product, combinations, chain e groupby."""
+    from itertools import product, groupby, chain, combinations
+    from operator import itemgetter
+
     print("\n" + "="*70)
     print("EXEMPLO 6: ITERTOOLS - FERRAMENTAS PODEROSAS")
     print("="*70)
@@ -259,7 +348,11 @@ def exemplo_itertools():
 # EXEMPLO 7: COUNTER E COLLECTIONS
 # ============================================================================
 
+@benchmark('exemplo', 'colecoes')
 def exemplo_collections():
+    """Counter e defaultdict."""
+    from collections import Counter, defaultdict
+
     print("\n" + "="*70)
     print("EXEMPLO 7: COLLECTIONS - COUNTER E DEFAULTDICT")
     print("="*70)
@@ -305,7 +398,9 @@ def exemplo_collections():
 # EXEMPLO 8: ANY, ALL E BUILT-INS
 # ============================================================================
 
+@benchmark('exemplo', 'builtins')
 def exemplo_builtins():
+    """any, all, sum, max, min, enumerate e zip."""
     print("\n" + "="*70)
     print("EXEMPLO 8: ANY, ALL E FUNÇÕES BUILT-IN")
     print("="*70)
@@ -342,7 +437,9 @@ def exemplo_builtins():
 # EXEMPLO 9: GENERATOR vs LIST
 # ============================================================================
 
+@benchmark('exemplo', 'memoria')
 def benchmark_generator():
+    """Uso de memória: lista vs generator."""
     print("\n" + "="*70)
     print("EXEMPLO 9: GENERATOR vs LIST - USO DE MEMÓRIA")
     print("="*70)
@@ -369,7 +466,11 @@ def benchmark_generator():
 # EXEMPLO 10: CASOS PRÁTICOS
 # ============================================================================
 
+@benchmark('exemplo', 'praticos')
 def exemplos_praticos():
+    """Filtrar usuários, contar carrinho e mesclar fontes."""
+    from collections import Counter
+
     print("\n" + "="*70)
     print("EXEMPLO 10: CASOS PRÁTICOS DO DIA A DIA")
     print("="*70)
@@ -419,41 +520,40 @@ def exemplos_praticos():
 # MAIN
 # ============================================================================
 
-def main():
+def cabecalho(args):
+    """Sistema, overhead calibrado e seed; devolve o campo 'sistema' do JSON."""
     import platform
-    import time
-    
-    inicio = time.time()
-    
-    print("\n" + "="*70)
-    print("🚀 EXEMPLOS PRÁTICOS DE OTIMIZAÇÃO EM PYTHON")
-    print("="*70)
-    
+    import random
+
+    from medicao import calibrar_overhead, formatar_tempo
+
     # Informações do sistema
     print(f"📊 Sistema: {platform.system()} {platform.release()}")
-    print(f"🐍 Python: {sys.version.split()[0]}")
     print(f"⚡ Processador: {platform.processor() or 'N/A'}")
-    print(f"🔧 Configuração: {BENCHMARK_CONFIG}")
-    
+    print(f"⏱️  Overhead do laço de medição: {formatar_tempo(calibrar_overhead())}/op (subtraído)")
+
     # Definir seed para reprodutibilidade
     random.seed(BENCHMARK_CONFIG['seeds'])
-    
-    # Executar todos os exemplos
-    benchmark_busca()
-    benchmark_strings()
-    benchmark_duplicatas()
-    benchmark_listas()
-    exemplo_sets()
-    exemplo_itertools()
-    exemplo_collections()
-    exemplo_builtins()
-    benchmark_generator()
-    exemplos_praticos()
-    
+
+    return {'sistema': {
+        'plataforma': platform.platform(),
+        'python': sys.version.split()[0],
+        'processador': platform.processor(),
+    }}
+
+
+def main(argv=None):
+    import time
+
+    inicio = time.perf_counter()
+
+    # Executar os exemplos selecionados (padrão: todos, na ordem de declaração)
+    if executar_suite("🚀 EXEMPLOS PRÁTICOS DE OTIMIZAÇÃO EM PYTHON", BENCHMARK_CONFIG, argv, cabecalho) is None:
+        return
+
     # Tempo total de execução
-    fim = time.time()
-    tempo_total = fim - inicio
-    
+    tempo_total = time.perf_counter() - inicio
+
     print("\n" + "="*70)
     print("✅ PRINCIPAIS LIÇÕES")
     print("="*70)
@@ -0,0 +1,441 @@
+#!/usr/bin/env python3
+"""
+🗄️ Histórico de Resultados e Relatório de Tendências
+
+Guarda as execuções dos benchmarks em um banco SQLite local, indexadas por
+máquina (impressão digital do host), interpretador e revisão do git, e gera
+relatórios de tendência em texto e HTML (gráficos SVG) com detecção de
+pontos de mudança.
+
+Fontes:
+- otimizacao: casos de exemplos_otimizacao.py (via registro de benchmarks)
+- zen:        zen_python_exemplos.benchmark_exemplos
+
+Executar:
+    python historico_resultados.py registrar [CASO...] [--fonte zen] [-p tamanho=1000] [--estavel]
+    python historico_resultados.py importar saida.json   # gerado com --json
+    python historico_resultados.py relatorio [--html tendencias.html] [--caso 'busca*']
+"""
+
+import argparse
+import hashlib
+import html
+import json
+import os
+import platform
+import sqlite3
+import subprocess
+import time
+from pathlib import Path
+
+PROJETO_RAIZ = Path(__file__).resolve().parent.parent
+BANCO_PADRAO = PROJETO_RAIZ / 'resultados' / 'historico.sqlite3'
+
+# Mudança mínima entre médias (20%) e separação mínima em desvios padrão
+LIMIAR_MUDANCA = 0.20
+LIMIAR_SEPARACAO = 3.0
+
+ESQUEMA = """
+CREATE TABLE IF NOT EXISTS execucoes (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    data REAL NOT NULL,
+    host TEXT NOT NULL,
+    interpretador TEXT NOT NULL,
+    revisao TEXT NOT NULL,
+    origem TEXT NOT NULL,
+    metadados TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS medicoes (
+    execucao_id INTEGER NOT NULL REFERENCES execucoes(id),
+    benchmark TEXT NOT NULL,
+    caso TEXT NOT NULL,
+    por_chamada REAL NOT NULL,
+    numero INTEGER,
+    rodadas INTEGER,
+    variacao REAL
+);
+CREATE INDEX IF NOT EXISTS idx_execucoes_serie
+    ON execucoes (host, interpretador, revisao);
+CREATE INDEX IF NOT EXISTS idx_medicoes_caso
+    ON medicoes (benchmark, caso);
+"""
+
+
+# ============================================================================
+# IDENTIFICAÇÃO DA EXECUÇÃO
+# ============================================================================
+
+def descrever_host():
+    """Características da máquina que afetam os tempos."""
+    return {
+        'nome': platform.node(),
+        'sistema': f"{platform.system()} {platform.release()}",
+        'arquitetura': platform.machine(),
+        'processador': platform.processor() or 'N/A',
+        'nucleos': os.cpu_count(),
+    }
+
+
+def impressao_digital_host(host=None):
+    """Hash curto e estável das características da máquina."""
+    conteudo = json.dumps(host or descrever_host(), sort_keys=True)
+    return hashlib.sha256(conteudo.encode('utf-8')).hexdigest()[:12]
+
+
+def descrever_interpretador():
+    """Implementação e versão, ex.: 'CPython 3.12.1'."""
+    return f"{platform.python_implementation()} {platform.python_version()}"
+
+
+def revisao_git():
+    """Revisão atual do git (com sufixo -dirty se houver alterações)."""
+    try:
+        revisao = subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'], cwd=str(PROJETO_RAIZ),
+            capture_output=True, text=True, check=True,
+        ).stdout.strip()
+        alterado = subprocess.run(
+            ['git', 'status', '--porcelain', '--untracked-files=no'], cwd=str(PROJETO_RAIZ),
+            capture_output=True, text=True, check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return 'desconhecida'
+    return f"{revisao}-dirty" if alterado else revisao
+
+
+# ============================================================================
+# BANCO DE DADOS
+# ============================================================================
+
+def abrir_banco(caminho=BANCO_PADRAO):
+    """Abre (e cria, se preciso) o banco de histórico."""
+    caminho = Path(caminho)
+    caminho.parent.mkdir(parents=True, exist_ok=True)
+    conexao = sqlite3.connect(str(caminho))
+    conexao.row_factory = sqlite3.Row
+    conexao.executescript(ESQUEMA)
+    return conexao
+
+
+def salvar_execucao(conexao, origem, execucoes, metadados=None):
+    """
+    Grava uma execução com suas medições.
+
+    Args:
+        origem: 'otimizacao', 'zen', ...
+        execucoes: Lista no formato de registro_benchmarks.executar
+                   ({'rotulo', 'resultados': [medições]})
+        metadados: Informações extras (configuração, estabilidade, ...)
+
+    Returns:
+        O id da execução gravada.
+    """
+    host = descrever_host()
+    metadados = dict(metadados or {}, host=host)
+    with conexao:
+        cursor = conexao.execute(
+            "INSERT INTO execucoes (data, host, interpretador, revisao, origem, metadados) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            (time.time(), impressao_digital_host(host), descrever_interpretador(),
+             revisao_git(), origem, json.dumps(metadados, ensure_ascii=False, default=str)),
+        )
+        execucao_id = cursor.lastrowid
+        conexao.executemany(
+            "INSERT INTO medicoes (execucao_id, benchmark, caso, por_chamada, numero, rodadas, variacao) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?)",
+            [
+                (execucao_id, execucao['rotulo'], medicao['caso'], medicao['por_chamada'],
+                 medicao.get('numero'), medicao.get('rodadas'), medicao.get('variacao'))
+                for execucao in execucoes
+                for medicao in execucao['resultados']
+            ],
+        )
+    return execucao_id
+
+
+def carregar_series(conexao, padrao_caso=None, host=None, interpretador=None):
+    """Agrupa as medições em séries temporais por (origem, benchmark, caso, interpretador, host)."""
+    import fnmatch
+
+    linhas = conexao.execute(
+        "SELECT e.id, e.data, e.host, e.interpretador, e.revisao, e.origem, "
+        "       m.benchmark, m.caso, m.por_chamada "
+        "FROM medicoes m JOIN execucoes e ON e.id = m.execucao_id "
+        "ORDER BY e.data, e.id"
+    ).fetchall()
+
+    series = {}
+    for linha in linhas:
+        if padrao_caso and not fnmatch.fnmatchcase(f"{linha['benchmark']}.{linha['caso']}", padrao_caso):
+            continue
+        if host and linha['host'] != host:
+            continue
+        if interpretador and interpretador not in linha['interpretador']:
+            continue
+        chave = (linha['origem'], linha['benchmark'], linha['caso'],
+                 linha['interpretador'], linha['host'])
+        series.setdefault(chave, []).append(dict(linha))
+    return series
+
+
+# ============================================================================
+# DETECÇÃO DE PONTOS DE MUDANÇA
+# ============================================================================
+
+def _media_desvio(valores):
+    media = sum(valores) / len(valores)
+    if len(valores) < 2:
+        return media, 0.0
+    return media, (sum((v - media) ** 2 for v in valores) / (len(valores) - 1)) ** 0.5
+
+
+def pontos_de_mudanca(valores, minimo=2, inicio=0):
+    """
+    Índices onde o nível da série muda (segmentação binária recursiva).
+
+    Em cada segmento escolhe a divisão com maior separação entre as médias
+    (em desvios padrão combinados) e a aceita se a mudança relativa passar
+    de LIMIAR_MUDANCA e a separação passar de LIMIAR_SEPARACAO.
+    """
+    if len(valores) < 2 * minimo:
+        return []
+
+    melhor, melhor_separacao = None, 0.0
+    for corte in range(minimo, len(valores) - minimo + 1):
+        media_a, desvio_a = _media_desvio(valores[:corte])
+        media_b, desvio_b = _media_desvio(valores[corte:])
+        ruido = max((desvio_a ** 2 + desvio_b ** 2) ** 0.5, 1e-3 * max(media_a, media_b))
+        separacao = abs(media_b - media_a) / ruido
+        if abs(media_b - media_a) / media_a >= LIMIAR_MUDANCA and separacao > melhor_separacao:
+            melhor, melhor_separacao = corte, separacao
+
+    if melhor is None or melhor_separacao < LIMIAR_SEPARACAO:
+        return []
+    return (pontos_de_mudanca(valores[:melhor], minimo, inicio)
+            + [inicio + melhor]
+            + pontos_de_mudanca(valores[melhor:], minimo, inicio + melhor))
+
+
+# ============================================================================
+# RELATÓRIOS
+# ============================================================================
+
+def relatorio_texto(series, ultimas=8):
+    """Tabela de tendência por série, marcando os pontos de mudança."""
+    from medicao import formatar_tempo
+
+    for (origem, benchmark, caso, interpretador, host), pontos in sorted(series.items()):
+        valores = [p['por_chamada'] for p in pontos]
+        mudancas = set(pontos_de_mudanca(valores))
+        print(f"\n📈 [{origem}] {benchmark}.{caso}  ({interpretador}, host {host})")
+        inicio = max(0, len(pontos) - ultimas)
+        for indice in range(inicio, len(pontos)):
+            ponto = pontos[indice]
+            data = time.strftime('%Y-%m-%d %H:%M', time.localtime(ponto['data']))
+            variacao = ''
+            if indice > 0:
+                variacao = f"{(valores[indice] / valores[indice - 1] - 1):+7.1%}"
+            marca = '  ⚠️ mudança de nível' if indice in mudancas else ''
+            print(f"   {data}  {ponto['revisao']:<14} {formatar_tempo(valores[indice]):>12}/op  {variacao:>8}{marca}")
+
+
+def grafico_svg(pontos, largura=640, altura=160, margem=36):
+    """Gráfico de linha SVG de uma série, com pontos de mudança tracejados."""
+    valores = [p['por_chamada'] for p in pontos]
+    minimo, maximo = min(valores), max(valores)
+    faixa = (maximo - minimo) or maximo or 1.0
+    passo = (largura - 2 * margem) / max(len(valores) - 1, 1)
+
+    def x(indice):
+        return margem + indice * passo
+
+    def y(valor):
+        return altura - margem - (valor - minimo) / faixa * (altura - 2 * margem)
+
+    coordenadas = ' '.join(f"{x(i):.1f},{y(v):.1f}" for i, v in enumerate(valores))
+    elementos = [
+        f'<svg xmlns="http://www.w3.org/2000/svg" width="{largura}" height="{altura}">',
+        f'<rect width="{largura}" height="{altura}" fill="#fafafa" stroke="#ddd"/>',
+        f'<polyline points="{coordenadas}" fill="none" stroke="#3572A5" stroke-width="2"/>',
+    ]
+    for indice, valor in enumerate(valores):
+        titulo = html.escape(f"{pontos[indice]['revisao']}: {valor * 1e6:.3f} µs")
+        elementos.append(f'<circle cx="{x(indice):.1f}" cy="{y(valor):.1f}" r="3" fill="#3572A5">'
+                         f'<title>{titulo}</title></circle>')
+    for indice in pontos_de_mudanca(valores):
+        posicao = (x(indice - 1) + x(indice)) / 2
+        elementos.append(f'<line x1="{posicao:.1f}" y1="{margem / 2}" x2="{posicao:.1f}" '
+                         f'y2="{altura - margem / 2}" stroke="#d33" stroke-dasharray="4 3"/>')
+    elementos += [
+        f'<text x="4" y="{margem - 4}" font-size="11">{maximo * 1e6:.3f} µs</text>',
+        f'<text x="4" y="{altura - 6}" font-size="11">{minimo * 1e6:.3f} µs</text>',
+        '</svg>',
+    ]
+    return '\n'.join(elementos)
+
+
+def relatorio_html(series, caminho):
+    """Grava um HTML com um gráfico SVG por série."""
+    secoes = []
+    for (origem, benchmark, caso, interpretador, host), pontos in sorted(series.items()):
+        titulo = html.escape(f"[{origem}] {benchmark}.{caso} — {interpretador}, host {host}")
+        secoes.append(f"<h2>{titulo}</h2>\n{grafico_svg(pontos)}")
+    documento = (
+        '<!DOCTYPE html>\n<html lang="pt-BR"><head><meta charset="utf-8">'
+        '<title>Tendências dos benchmarks</title>'
+        '<style>body{font-family:sans-serif;margin:2em}h2{font-size:1em}</style></head><body>\n'
+        '<h1>Tendências dos benchmarks</h1>\n'
+        '<p>Tempo por chamada ao longo das execuções; linhas tracejadas indicam pontos de mudança.</p>\n'
+        + '\n'.join(secoes) + '\n</body></html>\n'
+    )
+    Path(caminho).write_text(documento, encoding='utf-8')
+
+
+# ============================================================================
+# COLETA
+# ============================================================================
+
+def coletar_otimizacao(args):
+    """Executa os casos selecionados de exemplos_otimizacao pelo registro."""
+    import exemplos_otimizacao
+    from registro_benchmarks import aplicar_medicao, executar
+    from telemetria import criar_telemetria
+
+    aplicar_medicao(exemplos_otimizacao.BENCHMARK_CONFIG, args)
+    casos = [c for c in args.casos if 'cronometrado' in c['tags']]
+    execucoes = executar(casos, args.sobrescritas, args.matriz_valores, criar_telemetria(args),
+                         exemplos_otimizacao.BENCHMARK_CONFIG)
+    return execucoes, {'config': exemplos_otimizacao.BENCHMARK_CONFIG}
+
+
+def coletar_zen(args):
+    """Executa o benchmark de zen_python_exemplos."""
+    import zen_python_exemplos
+
+    execucao = {'rotulo': 'benchmark_exemplos', 'resultados': zen_python_exemplos.benchmark_exemplos()}
+    return [execucao], {}
+
+
+FONTES = {'otimizacao': coletar_otimizacao, 'zen': coletar_zen}
+
+
+def recusar_ruidosa(estabilidade, forcar):
+    """True se a execução é ruidosa demais para virar referência."""
+    from ambiente_estavel import LIMIAR_ESTABILIDADE
+
+    if estabilidade is None:
+        if forcar:
+            print("   ⚠️ Execução sem avaliação de estabilidade gravada por --forcar")
+            return False
+        print("   ❌ Execução sem avaliação de estabilidade (gere o JSON com --estavel): "
+              "não gravada. Use --forcar.")
+        return True
+    if estabilidade['estavel']:
+        return False
+    if forcar:
+        print("   ⚠️ Execução ruidosa gravada por --forcar")
+        return False
+    print(f"   ❌ Execução ruidosa (pontuação {estabilidade['pontuacao']:.0f} < "
+          f"{LIMIAR_ESTABILIDADE}): não gravada. Use --estavel ou --forcar.")
+    return True
+
+
+def comando_registrar(args):
+    from ambiente_estavel import (avaliar_estabilidade, interpretar_lista_cpus, mostrar_avisos,
+                                  mostrar_estabilidade, preparar_ambiente, variacoes_das_execucoes)
+
+    estado = preparar_ambiente(interpretar_lista_cpus(args.cpus), fixar=args.estavel)
+    if args.estavel:
+        mostrar_avisos(estado)
+
+    conexao = abrir_banco(args.banco)
+    for fonte in args.fonte or list(FONTES):
+        execucoes, metadados = FONTES[fonte](args)
+        if not execucoes:
+            print(f"\n⚠️ [{fonte}] nenhum caso cronometrado selecionado")
+            continue
+        metadados['estabilidade'] = avaliar_estabilidade(estado, variacoes_das_execucoes(execucoes))
+        mostrar_estabilidade(metadados['estabilidade'])
+        if recusar_ruidosa(metadados['estabilidade'], args.forcar):
+            continue
+        execucao_id = salvar_execucao(conexao, fonte, execucoes, metadados)
+        total = sum(len(e['resultados']) for e in execucoes)
+        print(f"\n💾 [{fonte}] execução #{execucao_id}: {total} medições gravadas em {args.banco}")
+
+
+def comando_importar(args):
+    with open(args.arquivo, encoding='utf-8') as arquivo:
+        dados = json.load(arquivo)
+    if recusar_ruidosa(dados.get('estabilidade'), args.forcar):
+        return
+    conexao = abrir_banco(args.banco)
+    execucao_id = salvar_execucao(conexao, args.origem, dados['resultados'],
+                                  {'config': dados.get('config'), 'importado_de': args.arquivo,
+                                   'estabilidade': dados.get('estabilidade')})
+    print(f"💾 Execução #{execucao_id} importada de {args.arquivo}")
+
+
+def comando_relatorio(args):
+    conexao = abrir_banco(args.banco)
+    series = carregar_series(conexao, args.caso, args.host, args.interpretador)
+    if not series:
+        print("📭 Nenhuma medição encontrada. Use 'registrar' primeiro.")
+        return
+    relatorio_texto(series, args.ultimas)
+    if args.html:
+        relatorio_html(series, args.html)
+        print(f"\n🖼️  Relatório HTML gravado em {args.html}")
+
+
+# ============================================================================
+# MAIN
+# ============================================================================
+
+def main(argv=None):
+    from registro_benchmarks import criar_parser, preparar_selecao
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--banco', default=str(BANCO_PADRAO), help='arquivo SQLite')
+    comandos = parser.add_subparsers(dest='comando')
+    comandos.required = True
+
+    registrar = comandos.add_parser(
+        'registrar', parents=[criar_parser(None, add_help=False)],
+        help='executa os benchmarks e grava o resultado',
+    )
+    registrar.add_argument('--fonte', choices=list(FONTES), action='append',
+                           help='fonte dos resultados (padrão: todas)')
+    registrar.add_argument('--forcar', action='store_true',
+                           help='grava mesmo se a execução for ruidosa')
+    registrar.set_defaults(executar=comando_registrar)
+
+    importar = comandos.add_parser('importar', help='importa um JSON de exemplos_otimizacao --json')
+    importar.add_argument('arquivo')
+    importar.add_argument('--origem', default='otimizacao')
+    importar.add_argument('--forcar', action='store_true',
+                          help='importa mesmo se a execução for ruidosa ou não tiver avaliação '
+                               'de estabilidade')
+    importar.set_defaults(executar=comando_importar)
+
+    relatorio = comandos.add_parser('relatorio', help='tendências por caso')
+    relatorio.add_argument('--caso', help="glob sobre 'benchmark.caso'")
+    relatorio.add_argument('--host', help='impressão digital do host')
+    relatorio.add_argument('--interpretador', help="ex.: '3.12'")
+    relatorio.add_argument('--ultimas', type=int, default=8, help='pontos por série no texto')
+    relatorio.add_argument('--html', help='grava também um relatório HTML com gráficos SVG')
+    relatorio.set_defaults(executar=comando_relatorio)
+
+    args = parser.parse_args(argv)
+    if args.comando == 'registrar':
+        import exemplos_otimizacao  # registra os casos antes da seleção
+        preparar_selecao(registrar, args)
+
+    print("\n" + "="*70)
+    print("🗄️  HISTÓRICO DE RESULTADOS DOS BENCHMARKS")
+    print("="*70)
+    print(f"🖥️  Host: {impressao_digital_host()}  |  🐍 {descrever_interpretador()}  |  🔖 {revisao_git()}")
+    args.executar(args)
+
+
+if __name__ == "__main__":
+    main()
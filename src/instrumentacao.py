@@ -0,0 +1,204 @@
+"""
+🔬 Instrumentação Opcional dos Casos de Benchmark
+
+Explica *por que* um caso é mais rápido que outro, além do tempo:
+
+- cprofile:   pontos quentes por função (cProfile)
+- perf:       contadores de hardware do Linux (ciclos, instruções, cache e
+              branch misses) via `perf stat` anexado ao processo
+- monitoring: eventos do interpretador (instruções de bytecode, chamadas,
+              saltos) via sys.monitoring, Python 3.12+
+
+Cada ferramenta retorna um dicionário anexado ao resultado estruturado da
+medição. Ferramentas indisponíveis retornam {'erro': motivo}.
+
+Uso:
+    from instrumentacao import instrumentar
+    resultado['instrumentacao'] = instrumentar(func, 1000, ['cprofile', 'perf'])
+"""
+
+import cProfile
+import os
+import pstats
+import shutil
+import signal
+import subprocess
+import sys
+import time
+
+FERRAMENTAS = ('cprofile', 'perf', 'monitoring')
+
+EVENTOS_PERF = ['cycles', 'instructions', 'cache-misses', 'branch-misses']
+
+# Contar cada instrução de bytecode é lento: o monitoring usa poucas iterações
+ITERACOES_MONITORING = 10
+
+
+def _vazia():
+    pass
+
+
+# ============================================================================
+# cProfile
+# ============================================================================
+
+def perfil_cprofile(func, numero, top=5):
+    """Executa `func` `numero` vezes sob cProfile e retorna os pontos quentes."""
+    perfil = cProfile.Profile()
+    perfil.enable()
+    for _ in range(numero):
+        func()
+    perfil.disable()
+
+    # Descarta a entrada do próprio profiler (Profiler.disable)
+    estatisticas = {
+        chave: valor for chave, valor in pstats.Stats(perfil).stats.items()
+        if '_lsprof' not in chave[2]
+    }
+    mais_caros = sorted(estatisticas.items(), key=lambda item: item[1][2], reverse=True)
+    return {
+        'pontos_quentes': [
+            {
+                'funcao': f"{nome} ({os.path.basename(arquivo)}:{linha})",
+                'chamadas_por_iteracao': chamadas / numero,
+                'proprio_por_iteracao': proprio / numero,
+                'acumulado_por_iteracao': acumulado / numero,
+            }
+            for (arquivo, linha, nome), (_, chamadas, proprio, acumulado, _) in mais_caros[:top]
+        ]
+    }
+
+
+# ============================================================================
+# perf stat (Linux)
+# ============================================================================
+
+def contadores_perf(func, numero, eventos=EVENTOS_PERF):
+    """Anexa `perf stat` a este processo enquanto `func` executa."""
+    if not sys.platform.startswith('linux') or shutil.which('perf') is None:
+        return {'erro': 'perf não encontrado (apenas Linux)'}
+
+    perf = subprocess.Popen(
+        ['perf', 'stat', '-x', ',', '-e', ','.join(eventos), '-p', str(os.getpid())],
+        stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True,
+    )
+    time.sleep(0.2)  # tempo para o perf se anexar ao processo
+    if perf.poll() is not None:
+        return {'erro': perf.stderr.read().strip()[:120]}
+
+    for _ in range(numero):
+        func()
+    perf.send_signal(signal.SIGINT)
+    _, saida = perf.communicate()
+
+    # Formato CSV: valor,unidade,evento,...
+    contadores = {}
+    for linha in saida.splitlines():
+        campos = linha.split(',')
+        if len(campos) >= 3 and campos[2] in eventos:
+            valor = campos[0]
+            contadores[campos[2]] = int(valor) / numero if valor.isdigit() else valor
+    if not contadores:
+        return {'erro': saida.strip()[:120] or 'sem contadores'}
+    return {'por_iteracao': contadores}
+
+
+# ============================================================================
+# sys.monitoring (Python 3.12+)
+# ============================================================================
+
+def _eventos_monitoring():
+    """Eventos contados, considerando a divisão de BRANCH no Python 3.14."""
+    eventos = sys.monitoring.events
+    nomes = ['INSTRUCTION', 'PY_START', 'CALL', 'JUMP']
+    nomes += ['BRANCH_LEFT', 'BRANCH_RIGHT'] if hasattr(eventos, 'BRANCH_LEFT') else ['BRANCH']
+    return {nome: getattr(eventos, nome) for nome in nomes}
+
+
+def _contar_eventos(func, numero):
+    monitoring = sys.monitoring
+    ferramenta = next(
+        (i for i in range(6) if monitoring.get_tool(i) is None), None
+    )
+    if ferramenta is None:
+        raise RuntimeError('nenhum tool id livre no sys.monitoring')
+
+    eventos = _eventos_monitoring()
+    contagens = dict.fromkeys(eventos, 0)
+
+    def contador(nome):
+        def callback(*args):
+            contagens[nome] += 1
+        return callback
+
+    monitoring.use_tool_id(ferramenta, 'zen-python-benchmarks')
+    try:
+        for nome, evento in eventos.items():
+            monitoring.register_callback(ferramenta, evento, contador(nome))
+        monitoring.set_events(ferramenta, sum(eventos.values()))
+        for _ in range(numero):
+            func()
+        monitoring.set_events(ferramenta, 0)
+    finally:
+        for evento in eventos.values():
+            monitoring.register_callback(ferramenta, evento, None)
+        monitoring.free_tool_id(ferramenta)
+    return contagens
+
+
+def eventos_monitoring(func, numero=ITERACOES_MONITORING):
+    """Conta eventos do interpretador por iteração, descontando o laço vazio."""
+    if not hasattr(sys, 'monitoring'):
+        return {'erro': 'sys.monitoring requer Python 3.12+'}
+
+    numero = max(1, min(numero, ITERACOES_MONITORING))
+    contagens = _contar_eventos(func, numero)
+    base = _contar_eventos(_vazia, numero)
+    return {
+        'por_iteracao': {
+            nome: (contagens[nome] - base[nome]) / numero for nome in contagens
+        }
+    }
+
+
+# ============================================================================
+# INTERFACE
+# ============================================================================
+
+def instrumentar(func, numero, ferramentas):
+    """Executa as ferramentas pedidas e retorna {ferramenta: resultado}."""
+    executores = {
+        'cprofile': perfil_cprofile,
+        'perf': contadores_perf,
+        'monitoring': eventos_monitoring,
+    }
+    resultados = {}
+    for ferramenta in ferramentas:
+        try:
+            resultados[ferramenta] = executores[ferramenta](func, numero)
+        except Exception as e:
+            resultados[ferramenta] = {'erro': str(e)[:120]}
+    return resultados
+
+
+def mostrar_instrumentacao(medicoes):
+    """Imprime um resumo da instrumentação anexada a uma lista de medições."""
+    for medicao in medicoes:
+        instrumentacao = medicao.get('instrumentacao')
+        if not instrumentacao:
+            continue
+        print(f"\n   🔬 {medicao['caso']}:")
+        for ferramenta, dados in instrumentacao.items():
+            if 'erro' in dados:
+                print(f"      {ferramenta:<10} indisponível: {dados['erro']}")
+            elif ferramenta == 'cprofile':
+                quente = dados['pontos_quentes'][0] if dados['pontos_quentes'] else None
+                if quente:
+                    print(f"      {ferramenta:<10} mais caro: {quente['funcao']} "
+                          f"({quente['chamadas_por_iteracao']:.0f} chamadas/iteração)")
+            else:
+                resumo = ', '.join(
+                    f"{nome}={valor:,.0f}" if isinstance(valor, float) else f"{nome}={valor}"
+                    for nome, valor in dados['por_iteracao'].items()
+                )
+                print(f"      {ferramenta:<10} por iteração: {resumo}")
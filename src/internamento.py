@@ -0,0 +1,255 @@
+#!/usr/bin/env python3
+"""
+🔤 Internamento e Codificação por Dicionário de Textos Repetidos
+
+Registros como os de exemplos_praticos e exemplo_itertools repetem os
+mesmos valores de 'categoria' e 'cidade' milhões de vezes. Lidos de um
+arquivo, cada ocorrência vira um objeto str novo. Dois utilitários:
+
+- Internador: devolve sempre o mesmo objeto para textos iguais (como
+  sys.intern, mas para qualquer valor hasheável e descartável junto com
+  o cache)
+- Dicionario: codifica cada texto distinto como um inteiro pequeno, com
+  busca reversa; a coluna vira um array.array de códigos
+
+Os benchmarks medem a memória retida e o custo de carga de cada forma, e
+o ganho de Counter, soma por grupo e sorted + groupby sobre as colunas
+codificadas em vez de textos crus.
+
+Executar: python internamento.py
+"""
+
+import random
+from array import array
+
+from registro_benchmarks import benchmark, executar_suite
+
+INTERNAMENTO_CONFIG = {
+    'orcamento_total': 8.0,  # Segundos de medição divididos entre todos os casos
+    'rodadas': 3,
+    'instrumentar': [],
+    'estavel': False,
+    'seeds': 42,
+}
+
+CATEGORIAS = ['eletrônicos', 'livros', 'roupas', 'casa', 'esportes', 'brinquedos',
+              'alimentos', 'beleza', 'automotivo', 'jardim']
+
+
+# ============================================================================
+# UTILITÁRIOS
+# ============================================================================
+
+class Internador:
+    """Devolve sempre o mesmo objeto para valores iguais."""
+
+    def __init__(self):
+        self.cache = {}
+
+    def __call__(self, valor):
+        return self.cache.setdefault(valor, valor)
+
+    def __len__(self):
+        return len(self.cache)
+
+
+class Dicionario:
+    """
+    Codificação por dicionário: valor <-> código inteiro (0, 1, 2, ...).
+
+    Os códigos seguem a ordem da primeira ocorrência; `valores[codigo]` é
+    a busca reversa.
+    """
+
+    def __init__(self):
+        self.codigos = {}
+        self.valores = []
+
+    def __len__(self):
+        return len(self.valores)
+
+    def codificar(self, valor):
+        codigo = self.codigos.get(valor)
+        if codigo is None:
+            codigo = self.codigos[valor] = len(self.valores)
+            self.valores.append(valor)
+        return codigo
+
+    def decodificar(self, codigo):
+        return self.valores[codigo]
+
+    def codificar_coluna(self, valores, typecode='I'):
+        """Coluna de códigos compacta (4 bytes por valor com 'I', 2 com 'H')."""
+        return array(typecode, map(self.codificar, valores))
+
+    def menor_typecode(self):
+        """Menor typecode de array ('B', 'H', 'I' ou 'L') que comporta todos os códigos."""
+        return next(t for t in 'BHIL' if len(self) <= 2 ** (8 * array(t).itemsize))
+
+    def decodificar_coluna(self, codigos):
+        return list(map(self.valores.__getitem__, codigos))
+
+    def contar(self, codigos):
+        """Counter da coluna codificada, com as chaves de volta em texto."""
+        from collections import Counter
+
+        return {self.valores[codigo]: n for codigo, n in Counter(codigos).items()}
+
+
+# ============================================================================
+# DADOS
+# ============================================================================
+
+def gerar_arquivo(quantidade, cidades=1000, seed=INTERNAMENTO_CONFIG['seeds']):
+    """Linhas 'id,categoria,cidade,valor' como viriam de um arquivo."""
+    gerador = random.Random(seed)
+    nomes_cidades = [f"cidade_{i:04d}" for i in range(cidades)]
+    return [
+        f"{i},{gerador.choice(CATEGORIAS)},{gerador.choice(nomes_cidades)},{gerador.randint(1, 500)}"
+        for i in range(quantidade)
+    ]
+
+
+def carregar(linhas, transformar=None):
+    """
+    Lê as linhas em registros (dicts); `transformar` é aplicado às colunas
+    de texto repetido (categoria e cidade).
+    """
+    registros = []
+    for linha in linhas:
+        id_, categoria, cidade, valor = linha.split(',')
+        if transformar is not None:
+            categoria, cidade = transformar(categoria), transformar(cidade)
+        registros.append({'id': int(id_), 'categoria': categoria, 'cidade': cidade, 'valor': int(valor)})
+    return registros
+
+
+# ============================================================================
+# BENCHMARKS
+# ============================================================================
+
+@benchmark('cronometrado', 'internamento', 'memoria', medicoes=3)
+def benchmark_carga(quantidade=200_000, cidades=1000):
+    """Carga dos registros e memória retida: textos crus vs internados vs códigos."""
+    from medicao import descrever, formatar_bytes, medir_caso, memoria_retida
+
+    print("\n" + "="*70)
+    print("CARGA E MEMÓRIA DE TEXTOS REPETIDOS")
+    print("="*70)
+
+    linhas = gerar_arquivo(quantidade, cidades)
+    formas = {
+        'str do arquivo': lambda: carregar(linhas),
+        'Internador': lambda: carregar(linhas, Internador()),
+        'Dicionario (códigos)': lambda: carregar(linhas, Dicionario().codificar),
+    }
+
+    print(f"\n📊 {quantidade:,} registros, {len(CATEGORIAS)} categorias, {cidades:,} cidades:")
+    resultados = []
+    referencia = None
+    for nome, func in formas.items():
+        medicao = medir_caso(func, INTERNAMENTO_CONFIG, caso=f"carga@{nome}")
+        medicao['memoria_bytes'] = memoria_retida(func)
+        referencia = referencia or medicao['memoria_bytes']
+        print(f"   {nome:<22} {descrever(medicao)}  retido {formatar_bytes(medicao['memoria_bytes']):>9} "
+              f"({medicao['memoria_bytes'] / referencia:.0%})")
+        resultados.append(medicao)
+
+    # Só a coluna cidade: lista de str, lista de str compartilhadas, array de códigos
+    cidades_cruas = [linha.split(',')[2] for linha in linhas]
+    dicionario = Dicionario()
+    dicionario.codificar_coluna(cidades_cruas)
+    tipo = dicionario.menor_typecode()  # 'B' até 256 cidades distintas, 'H' até 65.536
+    colunas = {
+        'list[str] do arquivo': lambda: [linha.split(',')[2] for linha in linhas],
+        'list[str] internada': lambda: list(map(Internador(), cidades_cruas)),
+        f"array('{tipo}') de códigos": lambda: Dicionario().codificar_coluna(cidades_cruas, tipo),
+    }
+    print("\n   Coluna cidade isolada:")
+    for nome, func in colunas.items():
+        print(f"   {nome:<22} retido {formatar_bytes(memoria_retida(func)):>9}")
+    return resultados
+
+
+@benchmark('cronometrado', 'internamento', 'agregacao', medicoes=9)
+def benchmark_agregacao(quantidade=200_000, cidades=1000):
+    """Counter, soma por grupo e sorted + groupby sobre textos crus, internados e códigos."""
+    from collections import Counter
+    from itertools import groupby
+
+    from medicao import descrever, medir_caso
+
+    print("\n" + "="*70)
+    print("AGREGAÇÃO SOBRE COLUNAS CODIFICADAS")
+    print("="*70)
+
+    linhas = gerar_arquivo(quantidade, cidades)
+    crua = [linha.split(',')[2] for linha in linhas]
+    valores = [int(linha.rsplit(',', 1)[1]) for linha in linhas]
+    internada = list(map(Internador(), crua))
+    dicionario = Dicionario()
+    codigos = dicionario.codificar_coluna(crua)
+
+    def soma_por_texto(coluna):
+        somas = {}
+        for chave, valor in zip(coluna, valores):
+            somas[chave] = somas.get(chave, 0) + valor
+        return somas
+
+    def soma_por_codigo(coluna):
+        somas = [0] * len(dicionario)
+        for codigo, valor in zip(coluna, valores):
+            somas[codigo] += valor
+        return dict(zip(dicionario.valores, somas))
+
+    def grupos(coluna):
+        return {chave: len(list(grupo)) for chave, grupo in groupby(sorted(coluna))}
+
+    def grupos_por_codigo(coluna):
+        return {dicionario.valores[chave]: n for chave, n in grupos(coluna).items()}
+
+    agregacoes = {
+        'Counter': (Counter, dicionario.contar),
+        'soma por grupo': (soma_por_texto, soma_por_codigo),
+        'sorted + groupby': (grupos, grupos_por_codigo),
+    }
+    resultados = []
+    for agregacao, (por_texto, por_codigo) in agregacoes.items():
+        variantes = {
+            'str do arquivo': lambda: por_texto(crua),
+            'str internada': lambda: por_texto(internada),
+            'códigos': lambda: por_codigo(codigos),
+        }
+        esperado = dict(variantes['str do arquivo']())
+        if any(dict(func()) != esperado for func in variantes.values()):
+            raise AssertionError(f"{agregacao}: variantes divergiram")
+
+        print(f"\n📊 {agregacao} ({quantidade:,} valores, {len(dicionario):,} distintos):")
+        referencia = None
+        for nome, func in variantes.items():
+            medicao = medir_caso(func, INTERNAMENTO_CONFIG, caso=f"{agregacao}@{nome}")
+            referencia = referencia or medicao['por_chamada']
+            print(f"   {nome:<22} {descrever(medicao)}  ({referencia / medicao['por_chamada']:.1f}x)")
+            resultados.append(medicao)
+    return resultados
+
+
+def main(argv=None):
+    if executar_suite("🔤 INTERNAMENTO E CODIFICAÇÃO POR DICIONÁRIO", INTERNAMENTO_CONFIG, argv) is None:
+        return
+
+    print(f"""
+💡 Lições:
+   - Cada str lida de um arquivo é um objeto novo, mesmo repetido:
+     compartilhar os objetos iguais economiza quase toda a memória da coluna
+   - Com objetos compartilhados, comparações em dicts e sets param na
+     identidade e o hash já está em cache
+   - Códigos inteiros em array.array ocupam 1-4 bytes por valor e somam
+     por grupo com índices de lista em vez de hashing; já o Counter sobre
+     o array paga um int novo por item lido
+   - Decodifique só no fim: agregue sobre os códigos e traduza o resultado
+    """)
+
+
+if __name__ == "__main__":
+    main()
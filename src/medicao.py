@@ -0,0 +1,179 @@
+"""
+📏 Medição Adaptativa para Benchmarks
+
+Em vez de um número fixo de repetições, cada caso recebe o número de
+iterações necessário para atingir um tempo alvo de medição. O custo do
+próprio laço de medição (chamar uma função vazia) é calibrado uma vez e
+subtraído, para que casos muito rápidos não sejam dominados por ruído.
+
+Uso:
+    from medicao import medir, formatar_tempo
+
+    resultado = medir(minha_funcao, tempo_alvo=0.1, rodadas=5)
+    print(formatar_tempo(resultado['por_chamada']))
+"""
+
+import timeit
+
+# Menor tempo por chamada reportado após subtrair o overhead (1 ns)
+RESOLUCAO_MINIMA = 1e-9
+
+_overhead_calibrado = None
+
+
+def _vazia():
+    pass
+
+
+def escolher_numero(timer, tempo_alvo):
+    """
+    Escolhe quantas iterações por rodada levam ~tempo_alvo segundos.
+
+    Cresce o número em potências de 10 (como timeit.Timer.autorange) até
+    a rodada durar ao menos 1/10 do alvo e então extrapola linearmente.
+    """
+    numero = 1
+    while True:
+        decorrido = timer.timeit(numero)
+        if decorrido >= tempo_alvo / 10:
+            break
+        numero *= 10
+    return max(1, int(numero * tempo_alvo / max(decorrido, RESOLUCAO_MINIMA)))
+
+
+def calibrar_overhead(tempo_alvo=0.05, rodadas=5):
+    """Mede (uma única vez) o custo por iteração de chamar uma função vazia."""
+    global _overhead_calibrado
+    if _overhead_calibrado is None:
+        timer = timeit.Timer(_vazia)
+        numero = escolher_numero(timer, tempo_alvo)
+        _overhead_calibrado = min(timer.repeat(repeat=rodadas, number=numero)) / numero
+    return _overhead_calibrado
+
+
+def medir(func, tempo_alvo=0.1, rodadas=5):
+    """
+    Mede `func` com número de iterações adaptativo.
+
+    Args:
+        func: Função sem argumentos a medir
+        tempo_alvo: Duração aproximada de cada rodada, em segundos
+        rodadas: Quantas rodadas repetir (o mínimo é o valor reportado)
+
+    Returns:
+        Dicionário com 'caso', 'numero', 'rodadas', 'por_chamada' (segundos,
+        já sem o overhead), 'tempos' (por chamada em cada rodada, brutos),
+        'overhead' e 'variacao' (desvio padrão relativo entre rodadas).
+    """
+    overhead = calibrar_overhead()
+    timer = timeit.Timer(func)
+    numero = escolher_numero(timer, tempo_alvo)
+    tempos = [t / numero for t in timer.repeat(repeat=rodadas, number=numero)]
+
+    media = sum(tempos) / len(tempos)
+    variacao = 0.0
+    if len(tempos) > 1 and media:
+        variancia = sum((t - media) ** 2 for t in tempos) / (len(tempos) - 1)
+        variacao = variancia ** 0.5 / media
+
+    return {
+        'caso': getattr(func, '__name__', repr(func)),
+        'numero': numero,
+        'rodadas': rodadas,
+        'por_chamada': max(min(tempos) - overhead, RESOLUCAO_MINIMA),
+        'tempos': tempos,
+        'overhead': overhead,
+        'variacao': variacao,
+    }
+
+
+def medir_caso(func, config, caso=None):
+    """
+    Mede um caso de uma suíte dentro do orçamento de tempo da suíte.
+
+    O tempo alvo por rodada é config['orcamento_total'] dividido entre os
+    config['casos_cronometrados'] casos (preenchido por
+    registro_benchmarks.executar; 1 fora dele) e config['rodadas'] rodadas. Com
+    config['estavel'], o GC fica congelado durante a medição; com
+    config['instrumentar'], a instrumentação é anexada ao resultado.
+    """
+    rodadas = config['rodadas']
+    tempo_alvo = config['orcamento_total'] / (config.get('casos_cronometrados', 1) * rodadas)
+
+    if config.get('estavel'):
+        from ambiente_estavel import regiao_cronometrada
+        with regiao_cronometrada():
+            resultado = medir(func, tempo_alvo=tempo_alvo, rodadas=rodadas)
+    else:
+        resultado = medir(func, tempo_alvo=tempo_alvo, rodadas=rodadas)
+
+    if caso is not None:
+        resultado['caso'] = caso
+    if config.get('instrumentar'):
+        from instrumentacao import instrumentar
+        resultado['instrumentacao'] = instrumentar(func, resultado['numero'], config['instrumentar'])
+    return resultado
+
+
+def pico_memoria(func):
+    """
+    Executa `func` uma vez sob tracemalloc e devolve o pico de memória
+    alocada por ela, em bytes.
+
+    Só conta alocações do Python: páginas mapeadas com mmap e o cache de
+    arquivos do sistema operacional ficam de fora.
+    """
+    import gc
+    import tracemalloc
+
+    gc.collect()
+    tracemalloc.start()
+    try:
+        base, _ = tracemalloc.get_traced_memory()
+        func()
+        _, pico = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return pico - base
+
+
+def memoria_retida(func):
+    """
+    Bytes que continuam alocados pelo resultado de `func` (tracemalloc),
+    descontados os temporários liberados durante a execução.
+    """
+    import gc
+    import tracemalloc
+
+    gc.collect()
+    tracemalloc.start()
+    try:
+        base, _ = tracemalloc.get_traced_memory()
+        resultado = func()
+        gc.collect()
+        atual, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del resultado
+    return atual - base
+
+
+def descrever(resultado):
+    """Tempo por chamada e número de iterações de uma medição."""
+    return f"{formatar_tempo(resultado['por_chamada']):>11}/op  (n={resultado['numero']:,})"
+
+
+def formatar_tempo(segundos):
+    """Formata um tempo por chamada com a unidade mais legível."""
+    for unidade, escala in (('s', 1), ('ms', 1e-3), ('µs', 1e-6)):
+        if segundos >= escala:
+            return f"{segundos / escala:.3f} {unidade}"
+    return f"{segundos / 1e-9:.1f} ns"
+
+
+def formatar_bytes(quantidade):
+    """Formata um tamanho em bytes com a unidade mais legível."""
+    for unidade, escala in (('GB', 1 << 30), ('MB', 1 << 20), ('KB', 1 << 10)):
+        if abs(quantidade) >= escala:
+            return f"{quantidade / escala:.1f} {unidade}"
+    return f"{quantidade} B"
@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+"""
+🧠 Memória Compartilhada - Passagem de Dados Sem Cópia para Processos
+
+Coloca datasets numéricos (array.array) em multiprocessing.shared_memory e
+entrega aos workers apenas um descritor pequeno. Cada worker abre o bloco e
+lê um memoryview sem copiar os dados. O benchmark compara com o envio dos
+mesmos dados como argumentos serializados com pickle.
+
+Requer Python 3.8+ (multiprocessing.shared_memory).
+
+Executar: python memoria_compartilhada.py [--tamanho 10000000] [--workers N]
+"""
+
+import argparse
+import array
+import concurrent.futures
+import os
+import pickle
+import sys
+import time
+
+try:
+    from multiprocessing import shared_memory
+except ImportError:  # Python 3.7
+    shared_memory = None
+
+# Configurações para o benchmark de memória compartilhada
+MEMORIA_CONFIG = {
+    'tamanho': 1000000,
+    'tipo': 'q',  # inteiros de 64 bits
+    'blocos_por_worker': 4,
+}
+
+
+# ============================================================================
+# HELPER: DATASET EM MEMÓRIA COMPARTILHADA
+# ============================================================================
+
+class DatasetCompartilhado:
+    """
+    Dataset array-backed em um bloco de memória compartilhada.
+
+    Uso:
+        with DatasetCompartilhado(array.array('q', dados)) as dataset:
+            executor.submit(worker, dataset.descritor, inicio, fim)
+
+    O descritor é uma tupla (nome, tipo, tamanho) barata de serializar.
+    O bloco é liberado (unlink) ao sair do contexto.
+    """
+
+    def __init__(self, dados):
+        if shared_memory is None:
+            raise RuntimeError("multiprocessing.shared_memory requer Python 3.8+")
+        dados = memoryview(dados)
+        self._shm = shared_memory.SharedMemory(create=True, size=max(1, dados.nbytes))
+        self._shm.buf[:dados.nbytes] = dados.cast('B')
+        self.descritor = (self._shm.name, dados.format, len(dados))
+
+    def fechar(self):
+        """Fecha e remove o bloco compartilhado."""
+        self._shm.close()
+        self._shm.unlink()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.fechar()
+
+
+class VisaoCompartilhada:
+    """Abre um descritor no worker e expõe um memoryview tipado, sem cópia."""
+
+    def __init__(self, descritor):
+        nome, tipo, tamanho = descritor
+        self._shm = shared_memory.SharedMemory(name=nome)
+        self._bytes = self._shm.buf
+        self.dados = self._bytes.cast(tipo)[:tamanho]
+
+    def __enter__(self):
+        return self.dados
+
+    def __exit__(self, *exc):
+        # memoryviews precisam ser liberados antes de fechar o bloco
+        self.dados.release()
+        self._bytes.release()
+        self._shm.close()
+
+
+# ============================================================================
+# WORKERS
+# ============================================================================
+
+def somar_compartilhado(descritor, inicio, fim):
+    """Soma um intervalo lendo direto da memória compartilhada."""
+    with VisaoCompartilhada(descritor) as dados:
+        return sum(dados[inicio:fim])
+
+
+def somar_pickle(pedaco):
+    """Soma um pedaço recebido como argumento serializado."""
+    return sum(pedaco)
+
+
+def intervalos(tamanho, partes):
+    """Divide [0, tamanho) em até `partes` intervalos contíguos (nenhum se vazio)."""
+    passo = max(-(-tamanho // partes), 1)
+    return [(i, min(i + passo, tamanho)) for i in range(0, tamanho, passo)]
+
+
+# ============================================================================
+# BENCHMARK
+# ============================================================================
+
+def benchmark_transferencia(tamanho, workers):
+    print("\n" + "="*70)
+    print("BENCHMARK: PICKLE vs MEMÓRIA COMPARTILHADA")
+    print("="*70)
+
+    dados = array.array(MEMORIA_CONFIG['tipo'], range(tamanho))
+    lista = dados.tolist()
+    partes = intervalos(tamanho, workers * MEMORIA_CONFIG['blocos_por_worker'])
+    esperado = sum(dados)
+
+    # Custo de transferência isolado: serializar os pedaços vs copiar para o bloco
+    inicio = time.perf_counter()
+    bytes_pickle = sum(
+        len(pickle.dumps(lista[a:b], protocol=pickle.HIGHEST_PROTOCOL))
+        for a, b in partes
+    )
+    tempo_serializar = time.perf_counter() - inicio
+
+    inicio = time.perf_counter()
+    with DatasetCompartilhado(dados) as dataset:
+        tempo_copiar = time.perf_counter() - inicio
+        bytes_descritor = len(pickle.dumps(dataset.descritor)) * len(partes)
+
+    with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as executor:
+        # Aquece o pool para não medir a criação dos processos
+        list(executor.map(somar_pickle, [[0]] * workers))
+
+        # Método 1: argumentos serializados com pickle
+        inicio = time.perf_counter()
+        total_pickle = sum(executor.map(somar_pickle, [lista[a:b] for a, b in partes]))
+        tempo_pickle = time.perf_counter() - inicio
+
+        # Método 2: memória compartilhada + memoryview
+        inicio = time.perf_counter()
+        with DatasetCompartilhado(dados) as dataset:
+            futuros = [
+                executor.submit(somar_compartilhado, dataset.descritor, a, b)
+                for a, b in partes
+            ]
+            total_shm = sum(f.result() for f in futuros)
+        tempo_shm = time.perf_counter() - inicio
+
+    assert total_pickle == total_shm == esperado
+
+    print(f"\n📊 Soma de {tamanho:,} inteiros em {len(partes)} pedaços, {workers} worker(s):")
+    print(f"\n   Custo de transferência:")
+    print(f"   Pickle:        {tempo_serializar:.4f}s  ({bytes_pickle / 1e6:,.1f} MB serializados)")
+    print(f"   Compartilhada: {tempo_copiar:.4f}s  ({bytes_descritor:,} bytes de descritores)")
+    print(f"\n   Ponta a ponta:")
+    print(f"   Pickle:        {tempo_pickle:.4f}s")
+    print(f"   Compartilhada: {tempo_shm:.4f}s  ({tempo_pickle / tempo_shm:.1f}x mais rápido) ⚡")
+
+
+# ============================================================================
+# MAIN
+# ============================================================================
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--tamanho', type=int, default=MEMORIA_CONFIG['tamanho'],
+                        help='número de elementos (ex.: 10000000)')
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1,
+                        help='número de processos')
+    args = parser.parse_args(argv)
+
+    if shared_memory is None:
+        print("❌ multiprocessing.shared_memory requer Python 3.8+")
+        sys.exit(1)
+
+    benchmark_transferencia(args.tamanho, args.workers)
+
+    print(f"""
+💡 Lições:
+   - Pickle copia e serializa cada pedaço no pai e desserializa no worker
+   - Memória compartilhada envia só (nome, tipo, tamanho); o worker lê sem cópia
+   - Libere os memoryviews antes de fechar o bloco (senão: BufferError)
+    """)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,264 @@
+#!/usr/bin/env python3
+"""
+🗃️ Ordenação Externa para o Padrão sorted + groupby
+
+exemplo_itertools agrupa com groupby(sorted(dados, key=...)), e groupby
+exige a entrada ordenada pela chave. Quando os registros não cabem em
+memória, sorted() não serve. A ordenação externa (merge sort externo):
+
+1. lê o fluxo de entrada em lotes que cabem no orçamento de memória
+2. ordena cada lote e o grava em um arquivo temporário (uma "corrida")
+3. intercala as corridas com heapq.merge, que gera um registro por vez
+
+O resultado é um gerador: pode alimentar groupby direto, sem nunca
+materializar a entrada inteira. Se tudo couber no orçamento, nada é
+gravado em disco.
+
+O benchmark compara com sorted() + groupby em tamanhos que cabem em
+memória: tempo e pico de memória (tracemalloc).
+
+Executar: python ordenacao_externa.py
+Mais registros: python ordenacao_externa.py -p tamanhos=(1000000,)
+"""
+
+import heapq
+import pickle
+import sys
+import tempfile
+from itertools import groupby, islice
+from pathlib import Path
+
+from registro_benchmarks import benchmark, executar_suite
+
+ORDENACAO_CONFIG = {
+    'orcamento_total': 8.0,  # Segundos de medição divididos entre todos os casos
+    'rodadas': 3,
+    'instrumentar': [],
+    'estavel': False,
+    'seeds': 42,
+}
+
+MEMORIA_PADRAO = 64 << 20  # 64 MB
+MAXIMO_CORRIDAS = 64  # corridas intercaladas de uma vez (arquivos abertos ao mesmo tempo)
+MAXIMO_POR_LOTE = 1024  # registros por pickle.dump nas corridas
+
+
+# ============================================================================
+# ORDENAÇÃO EXTERNA
+# ============================================================================
+
+def tamanho_aproximado(registro):
+    """
+    Estimativa barata dos bytes de um registro: o objeto e, em tuplas,
+    listas e dicts, os itens de primeiro nível.
+    """
+    tamanho = sys.getsizeof(registro)
+    if isinstance(registro, dict):
+        for chave, valor in registro.items():
+            tamanho += sys.getsizeof(chave) + sys.getsizeof(valor)
+    elif isinstance(registro, (tuple, list)):
+        for item in registro:
+            tamanho += sys.getsizeof(item)
+    return tamanho
+
+
+def _gravar_corrida(registros, pasta):
+    """
+    Grava registros já ordenados em lotes de pickle; devolve o caminho.
+
+    Cada lote tem no máximo 1/MAXIMO_CORRIDAS da corrida: ao intercalar, com
+    um lote de cada corrida em memória, o total continua dentro do orçamento.
+    """
+    por_lote = max(1, min(MAXIMO_POR_LOTE, len(registros) // MAXIMO_CORRIDAS))
+    arquivo = tempfile.NamedTemporaryFile('wb', dir=pasta, suffix='.corrida', delete=False)
+    with arquivo:
+        for inicio in range(0, len(registros), por_lote):
+            pickle.dump(registros[inicio:inicio + por_lote], arquivo, protocol=pickle.HIGHEST_PROTOCOL)
+    return Path(arquivo.name)
+
+
+def _ler_corrida(caminho):
+    """Gera os registros de uma corrida, um lote por vez."""
+    with open(caminho, 'rb') as arquivo:
+        while True:
+            try:
+                lote = pickle.load(arquivo)
+            except EOFError:
+                return
+            yield from lote
+
+
+def _corridas(registros, chave, reverso, memoria_max, pasta, estatisticas):
+    """
+    Lê o fluxo em lotes dentro do orçamento e grava cada lote ordenado.
+
+    Returns:
+        (caminhos das corridas, None) ou, se tudo coube no orçamento,
+        ([], lote ordenado em memória).
+    """
+    caminhos = []
+    lote = []
+    usado = 0
+    for registro in registros:
+        lote.append(registro)
+        usado += tamanho_aproximado(registro) + 8  # + o ponteiro na lista
+        if usado >= memoria_max:
+            lote.sort(key=chave, reverse=reverso)
+            caminhos.append(_gravar_corrida(lote, pasta))
+            lote = []
+            usado = 0
+
+    lote.sort(key=chave, reverse=reverso)
+    if not caminhos:
+        return [], lote
+    if lote:
+        caminhos.append(_gravar_corrida(lote, pasta))
+    estatisticas['corridas'] = len(caminhos)
+    return caminhos, None
+
+
+def ordenar_externo(registros, chave=None, reverso=False, memoria_max=MEMORIA_PADRAO,
+                    pasta=None, estatisticas=None):
+    """
+    Gera os registros de um iterável em ordem, com memória limitada.
+
+    Args:
+        registros: Iterável (pode ser um gerador de tamanho desconhecido).
+        chave, reverso: Como key e reverse de sorted(); a ordem é estável.
+        memoria_max: Orçamento aproximado, em bytes, para cada lote em memória.
+        pasta: Diretório dos arquivos temporários (padrão: o do sistema).
+        estatisticas: Dict opcional preenchido com 'corridas', 'passagens'
+            e 'bytes_em_disco'.
+
+    Yields:
+        Os registros ordenados. Os arquivos temporários são apagados quando
+        o gerador termina ou é fechado.
+    """
+    if estatisticas is None:
+        estatisticas = {}
+    estatisticas.update(corridas=0, passagens=0, bytes_em_disco=0)
+
+    with tempfile.TemporaryDirectory(prefix='ordenacao_', dir=pasta) as temporaria:
+        caminhos, em_memoria = _corridas(registros, chave, reverso, memoria_max, temporaria, estatisticas)
+        if em_memoria is not None:
+            yield from em_memoria
+            return
+
+        estatisticas['bytes_em_disco'] = sum(caminho.stat().st_size for caminho in caminhos)
+        # Corridas demais para abrir de uma vez: intercalar em grupos até sobrarem MAXIMO_CORRIDAS
+        while len(caminhos) > MAXIMO_CORRIDAS:
+            estatisticas['passagens'] += 1
+            caminhos = [
+                _gravar_corrida(list(heapq.merge(*map(_ler_corrida, grupo), key=chave, reverse=reverso)),
+                                temporaria)
+                if len(grupo) > 1 else grupo[0]
+                for grupo in (caminhos[i:i + MAXIMO_CORRIDAS] for i in range(0, len(caminhos), MAXIMO_CORRIDAS))
+            ]
+        estatisticas['passagens'] += 1
+        yield from heapq.merge(*map(_ler_corrida, caminhos), key=chave, reverse=reverso)
+
+
+def agrupar_externo(registros, chave, **opcoes):
+    """groupby sobre ordenar_externo: gera (chave, grupo) sem materializar a entrada."""
+    return groupby(ordenar_externo(registros, chave, **opcoes), key=chave)
+
+
+# ============================================================================
+# BENCHMARK
+# ============================================================================
+
+def gerar_registros(quantidade, categorias=1000, seed=ORDENACAO_CONFIG['seeds']):
+    """Fluxo de registros {'nome', 'categoria', 'valor'} como os de exemplo_itertools."""
+    import random
+
+    gerador = random.Random(seed)
+    for i in range(quantidade):
+        yield {
+            'nome': f"cliente{i}",
+            'categoria': f"categoria{gerador.randrange(categorias):04d}",
+            'valor': gerador.randrange(1000),
+        }
+
+
+def totais_por_categoria(grupos):
+    """Consome os grupos de groupby: (categoria, registros, soma dos valores)."""
+    totais = []
+    for categoria, grupo in grupos:
+        quantidade = soma = 0
+        for registro in grupo:
+            quantidade += 1
+            soma += registro['valor']
+        totais.append((categoria, quantidade, soma))
+    return totais
+
+
+@benchmark('cronometrado', 'ordenacao', 'memoria',
+           medicoes=lambda tamanhos, fracoes_memoria, **_: len(tamanhos) * (1 + len(fracoes_memoria)))
+def benchmark_ordenacao(tamanhos=(50_000, 200_000), fracoes_memoria=(0.25, 0.05)):
+    """sorted() + groupby vs ordenação externa + groupby com orçamentos de memória menores que a entrada."""
+    from operator import itemgetter
+
+    from medicao import descrever, formatar_bytes, medir_caso, pico_memoria
+
+    print("\n" + "="*70)
+    print("ORDENAÇÃO EXTERNA + GROUPBY")
+    print("="*70)
+
+    chave = itemgetter('categoria')
+    resultados = []
+    for quantidade in tamanhos:
+        # Estimativa do tamanho da entrada a partir de uma amostra
+        amostra = list(islice(gerar_registros(quantidade), 1000))
+        total_estimado = sum(map(tamanho_aproximado, amostra)) / len(amostra) * quantidade
+
+        variantes = {
+            'sorted + groupby': lambda: totais_por_categoria(
+                groupby(sorted(gerar_registros(quantidade), key=chave), key=chave)),
+        }
+        for fracao in fracoes_memoria:
+            memoria = int(total_estimado * fracao)
+            variantes[f'externa ({formatar_bytes(memoria)})'] = lambda memoria=memoria: totais_por_categoria(
+                agrupar_externo(gerar_registros(quantidade), chave, memoria_max=memoria))
+
+        esperado = variantes['sorted + groupby']()
+        print(f"\n📊 {quantidade:,} registros (~{formatar_bytes(total_estimado)} em memória), "
+              f"{len(esperado):,} categorias:")
+        referencia = None
+        for nome, func in variantes.items():
+            if func() != esperado:
+                raise AssertionError(f"{nome} divergiu")
+            medicao = medir_caso(func, ORDENACAO_CONFIG, caso=f"{nome}@{quantidade}")
+            medicao['pico_bytes'] = pico_memoria(func)
+            referencia = referencia or medicao['por_chamada']
+            print(f"   {nome:<24} {descrever(medicao)}  ({referencia / medicao['por_chamada']:.2f}x)  "
+                  f"pico {formatar_bytes(medicao['pico_bytes']):>9}")
+            resultados.append(medicao)
+
+        estatisticas = {}
+        for _ in ordenar_externo(gerar_registros(quantidade), chave,
+                                 memoria_max=int(total_estimado * fracoes_memoria[-1]),
+                                 estatisticas=estatisticas):
+            pass
+        print(f"   corridas com o menor orçamento: {estatisticas['corridas']}, "
+              f"{formatar_bytes(estatisticas['bytes_em_disco'])} em disco")
+    return resultados
+
+
+def main(argv=None):
+    if executar_suite("🗃️ ORDENAÇÃO EXTERNA PARA SORTED + GROUPBY", ORDENACAO_CONFIG, argv) is None:
+        return
+
+    print(f"""
+💡 Lições:
+   - groupby só precisa de um fluxo ordenado, não de uma lista: a ordenação
+     externa entrega esse fluxo com memória limitada
+   - O pico de memória acompanha o orçamento, não o tamanho da entrada
+   - O preço é serializar cada registro duas vezes (gravar e ler a
+     corrida): quando os dados cabem em memória, sorted() vence
+   - heapq.merge intercala k corridas com um heap de k itens e é estável,
+     como sorted()
+    """)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+"""
+⏱️ Perfil de Importação e Partida a Frio dos Scripts
+
+Executa cada script de entrada em um interpretador novo com `-X importtime`,
+interpreta a saída e resume o custo por módulo (próprio e acumulado).
+Também compara a partida a frio "antes" (módulos importados de forma
+ansiosa no topo do script) e "depois" (importação preguiçosa).
+
+O "antes" pode vir de uma revisão do git (--revisao) ou, por padrão, é
+simulado importando antes do próprio script os módulos adiados (agora
+importados dentro das funções que os usam) e os removidos (imports que
+não eram usados e foram apagados).
+
+Executar: python perfil_importacao.py [--revisao REV] [--top N] [--repeticoes N]
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+SRC_DIR = Path(__file__).resolve().parent
+
+SCRIPTS = ('demo_rapido', 'zen_python_exemplos', 'exemplos_otimizacao')
+
+# Módulos que os scripts importavam no topo e agora importam sob demanda
+MODULOS_ADIADOS = {
+    'zen_python_exemplos': ['timeit', 'collections'],
+    'exemplos_otimizacao': ['itertools', 'collections', 'operator', 'random'],
+}
+
+# Módulos importados no topo sem uso algum: os imports foram apagados
+MODULOS_REMOVIDOS = {
+    'demo_rapido': ['pathlib'],
+    'zen_python_exemplos': ['typing', 'json'],
+}
+
+
+# ============================================================================
+# COLETA E INTERPRETAÇÃO DO -X importtime
+# ============================================================================
+
+def executar_importtime(codigo, diretorio):
+    """Roda `python -X importtime -c codigo` e retorna as linhas do stderr."""
+    resultado = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', codigo],
+        cwd=str(diretorio), capture_output=True, text=True,
+        env=dict(os.environ, PYTHONDONTWRITEBYTECODE='1'),
+    )
+    if resultado.returncode != 0:
+        raise RuntimeError(resultado.stderr.strip().splitlines()[-1])
+    return resultado.stderr.splitlines()
+
+
+def interpretar_importtime(linhas):
+    """
+    Converte as linhas do -X importtime em registros.
+
+    Formato: "import time: self [us] | cumulative | imported package",
+    onde a indentação do nome indica a profundidade da importação.
+    """
+    registros = []
+    for linha in linhas:
+        if not linha.startswith('import time:'):
+            continue
+        partes = linha[len('import time:'):].split('|')
+        if len(partes) != 3 or not partes[0].strip().isdigit():
+            continue  # cabeçalho
+        nome = partes[2].rstrip()
+        registros.append({
+            'modulo': nome.strip(),
+            'proprio_us': int(partes[0]),
+            'acumulado_us': int(partes[1]),
+            'profundidade': (len(nome) - len(nome.lstrip())) // 2,
+        })
+    return registros
+
+
+def resumir(registros, script):
+    """Resume um perfil: total do script, módulos carregados e os mais caros."""
+    total = sum(r['proprio_us'] for r in registros)
+    do_script = next((r for r in registros if r['modulo'] == script), None)
+    return {
+        'total_us': total,
+        'script_us': do_script['acumulado_us'] if do_script else 0,
+        'modulos': len(registros),
+        'mais_caros': sorted(registros, key=lambda r: r['acumulado_us'], reverse=True),
+    }
+
+
+def partida_a_frio(codigo, diretorio, repeticoes):
+    """Mediana do tempo total de importação em interpretadores novos."""
+    totais = sorted(
+        resumir(interpretar_importtime(executar_importtime(codigo, diretorio)), '')['total_us']
+        for _ in range(repeticoes)
+    )
+    return totais[len(totais) // 2]
+
+
+def extrair_revisao(revisao, destino):
+    """Copia os scripts de entrada de uma revisão do git para `destino`."""
+    for script in SCRIPTS:
+        conteudo = subprocess.run(
+            ['git', 'show', f'{revisao}:src/{script}.py'],
+            cwd=str(SRC_DIR), capture_output=True, check=True,
+        ).stdout
+        (Path(destino) / f'{script}.py').write_bytes(conteudo)
+
+
+# ============================================================================
+# RELATÓRIO
+# ============================================================================
+
+def relatorio_script(script, top):
+    """Mostra o perfil detalhado de importação de um script."""
+    perfil = resumir(interpretar_importtime(executar_importtime(f'import {script}', SRC_DIR)), script)
+    print(f"\n📦 {script}.py - {perfil['modulos']} módulos, "
+          f"{perfil['script_us'] / 1000:.1f} ms acumulados no script")
+    print(f"   {'módulo':<32} {'próprio':>10} {'acumulado':>10}")
+    for registro in perfil['mais_caros'][:top]:
+        nome = '  ' * registro['profundidade'] + registro['modulo']
+        print(f"   {nome[:32]:<32} {registro['proprio_us'] / 1000:>8.2f}ms "
+              f"{registro['acumulado_us'] / 1000:>8.2f}ms")
+
+
+def comparar_antes_depois(revisao, repeticoes):
+    """Compara a partida a frio antes/depois da importação preguiçosa."""
+    print("\n" + "="*70)
+    origem = f"revisão {revisao}" if revisao else "simulado (módulos adiados e removidos importados antes)"
+    print(f"🥶 PARTIDA A FRIO - ANTES vs DEPOIS  [antes: {origem}]")
+    print("="*70)
+
+    base = partida_a_frio('pass', SRC_DIR, repeticoes)
+    print(f"\n   Interpretador vazio: {base / 1000:.1f} ms (já incluído abaixo)")
+    print(f"\n   {'script':<22} {'antes':>10} {'depois':>10} {'ganho':>8}")
+
+    with tempfile.TemporaryDirectory() as temporario:
+        if revisao:
+            extrair_revisao(revisao, temporario)
+        for script in SCRIPTS:
+            if revisao:
+                antes = partida_a_frio(f'import {script}', temporario, repeticoes)
+            else:
+                modulos = MODULOS_ADIADOS.get(script, []) + MODULOS_REMOVIDOS.get(script, [])
+                codigo = '; '.join(f'import {m}' for m in modulos + [script])
+                antes = partida_a_frio(codigo, SRC_DIR, repeticoes)
+            depois = partida_a_frio(f'import {script}', SRC_DIR, repeticoes)
+            print(f"   {script:<22} {antes / 1000:>8.1f}ms {depois / 1000:>8.1f}ms "
+                  f"{antes / max(depois, 1):>7.1f}x")
+
+    print(f"\n   {'script':<22} {'adiados (importados sob demanda)':<48} removidos (sem uso)")
+    for script in SCRIPTS:
+        adiados = ', '.join(MODULOS_ADIADOS.get(script, [])) or '-'
+        removidos = ', '.join(MODULOS_REMOVIDOS.get(script, [])) or '-'
+        print(f"   {script:<22} {adiados:<48} {removidos}")
+
+
+# ============================================================================
+# MAIN
+# ============================================================================
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--revisao', help='revisão do git usada como "antes" (ex.: HEAD~1)')
+    parser.add_argument('--top', type=int, default=10, help='módulos listados por script')
+    parser.add_argument('--repeticoes', type=int, default=5,
+                        help='interpretadores novos por medição (mediana)')
+    args = parser.parse_args(argv)
+
+    print("\n" + "="*70)
+    print("⏱️  PERFIL DE IMPORTAÇÃO DOS SCRIPTS (-X importtime)")
+    print("="*70)
+    print(f"🐍 Python: {sys.version.split()[0]}")
+
+    for script in SCRIPTS:
+        relatorio_script(script, args.top)
+
+    comparar_antes_depois(args.revisao, args.repeticoes)
+
+    print(f"""
+💡 Lições:
+   - Importe no topo apenas o que o módulo usa ao ser carregado
+   - Dependências de um único exemplo podem ser importadas dentro dele
+   - Imports sem uso custam na partida e não fazem nada: apague-os
+   - Módulos já carregados pelo interpretador (sys, os) não custam nada extra
+    """)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,374 @@
+#!/usr/bin/env python3
+"""
+🧮 Motor de Predicados com Curto-Circuito e Avaliação em Lote
+
+exemplo_builtins mostra any()/all() sobre oito números e exemplos_praticos
+filtra usuários com `u['idade'] >= 18 and u['ativo']`. Com muitos
+predicados sobre lotes grandes, vale a pena:
+
+- descrever o predicado como dado, combinando comparações de campos com
+  & (e), | (ou) e ~ (não):
+
+      maior_ativo = (Campo('idade') >= 18) & (Campo('ativo') == True)
+
+- compilá-lo para uma closure com a expressão gerada como código Python
+  (sem uma chamada de função por cláusula)
+- reordenar as cláusulas pela seletividade e pelo custo medidos em uma
+  amostra: no 'e', primeiro o que mais rejeita por unidade de custo
+- avaliar lotes inteiros com um laço gerado (filtrar, contar, algum, todos),
+  sem uma chamada de função por registro
+
+Executar: python predicados.py
+Listar casos: python predicados.py --listar
+"""
+
+import random
+
+from registro_benchmarks import benchmark, executar_suite
+
+PREDICADOS_CONFIG = {
+    'orcamento_total': 6.0,  # Segundos de medição divididos entre todos os casos
+    'rodadas': 5,
+    'instrumentar': [],
+    'estavel': False,
+    'seeds': 42,
+}
+
+OPERADORES = ('==', '!=', '<', '<=', '>', '>=', 'in', 'not in')
+
+
+# ============================================================================
+# PREDICADOS
+# ============================================================================
+
+class Predicado:
+    """Base dos predicados: combina com &, | e ~."""
+
+    def __and__(self, outro):
+        return E(self, outro)
+
+    def __or__(self, outro):
+        return Ou(self, outro)
+
+    def __invert__(self):
+        return Nao(self)
+
+
+class Comparacao(Predicado):
+    """registro[campo] <operador> valor."""
+
+    def __init__(self, campo, operador, valor):
+        if operador not in OPERADORES:
+            raise ValueError(f"operador não suportado: {operador!r}")
+        self.campo, self.operador, self.valor = campo, operador, valor
+
+    def fonte(self, constantes):
+        nome = f"_c{len(constantes)}"
+        constantes[nome] = self.valor
+        return f"r[{self.campo!r}] {self.operador} {nome}"
+
+    def __repr__(self):
+        return f"{self.campo} {self.operador} {self.valor!r}"
+
+
+class E(Predicado):
+    """Verdadeiro se todas as cláusulas forem (avaliadas em ordem, com curto-circuito)."""
+
+    juncao = 'and'
+
+    def __init__(self, *clausulas):
+        # (a & b) & c vira E(a, b, c): a ordem fica livre para o otimizador
+        self.clausulas = [
+            parte
+            for clausula in clausulas
+            for parte in (clausula.clausulas if type(clausula) is type(self) else [clausula])
+        ]
+
+    def fonte(self, constantes):
+        return '(' + f' {self.juncao} '.join(c.fonte(constantes) for c in self.clausulas) + ')'
+
+    def __repr__(self):
+        return '(' + f' {self.juncao} '.join(map(repr, self.clausulas)) + ')'
+
+
+class Ou(E):
+    """Verdadeiro se alguma cláusula for (avaliadas em ordem, com curto-circuito)."""
+
+    juncao = 'or'
+
+
+class Nao(Predicado):
+    """Negação de um predicado."""
+
+    def __init__(self, clausula):
+        self.clausula = clausula
+
+    def fonte(self, constantes):
+        return f"(not {self.clausula.fonte(constantes)})"
+
+    def __repr__(self):
+        return f"not {self.clausula!r}"
+
+
+class Campo:
+    """Construtor de comparações: Campo('idade') >= 18, Campo('pais').em({'BR'})."""
+
+    __hash__ = None
+
+    def __init__(self, nome):
+        self.nome = nome
+
+    def __eq__(self, valor):
+        return Comparacao(self.nome, '==', valor)
+
+    def __ne__(self, valor):
+        return Comparacao(self.nome, '!=', valor)
+
+    def __lt__(self, valor):
+        return Comparacao(self.nome, '<', valor)
+
+    def __le__(self, valor):
+        return Comparacao(self.nome, '<=', valor)
+
+    def __gt__(self, valor):
+        return Comparacao(self.nome, '>', valor)
+
+    def __ge__(self, valor):
+        return Comparacao(self.nome, '>=', valor)
+
+    def em(self, valores):
+        return Comparacao(self.nome, 'in', frozenset(valores))
+
+    def fora_de(self, valores):
+        return Comparacao(self.nome, 'not in', frozenset(valores))
+
+
+# ============================================================================
+# COMPILAÇÃO
+# ============================================================================
+
+# Corpo gerado para cada modo; {expr} é a expressão do predicado sobre `r`
+MODELOS = {
+    'registro': "    return lambda r: {expr}",
+    'filtrar': (
+        "    def filtrar(registros):\n"
+        "        return [r for r in registros if {expr}]\n"
+        "    return filtrar"
+    ),
+    'contar': (
+        "    def contar(registros):\n"
+        "        total = 0\n"
+        "        for r in registros:\n"
+        "            if {expr}:\n"
+        "                total += 1\n"
+        "        return total\n"
+        "    return contar"
+    ),
+    'algum': (
+        "    def algum(registros):\n"
+        "        for r in registros:\n"
+        "            if {expr}:\n"
+        "                return True\n"
+        "        return False\n"
+        "    return algum"
+    ),
+    'todos': (
+        "    def todos(registros):\n"
+        "        for r in registros:\n"
+        "            if not {expr}:\n"
+        "                return False\n"
+        "        return True\n"
+        "    return todos"
+    ),
+}
+
+
+def compilar(predicado, modo='registro'):
+    """
+    Gera o código do predicado e devolve a função do modo pedido.
+
+    'registro' devolve f(r) -> bool; os demais recebem o lote inteiro:
+    'filtrar' (lista), 'contar' (int), 'algum' e 'todos' (bool, com
+    curto-circuito). Os valores comparados entram como variáveis da
+    closure, nunca como texto no código gerado.
+    """
+    constantes = {}
+    expressao = predicado.fonte(constantes)
+    codigo = f"def _fabrica({', '.join(constantes)}):\n" + MODELOS[modo].format(expr=expressao)
+    namespace = {}
+    exec(compile(codigo, f"<predicado {modo}>", 'exec'), namespace)
+    return namespace['_fabrica'](**constantes)
+
+
+# ============================================================================
+# OTIMIZAÇÃO POR SELETIVIDADE E CUSTO
+# ============================================================================
+
+def estimar(predicado, amostra):
+    """Fração de registros da amostra que passam e custo médio por avaliação (s)."""
+    from time import perf_counter
+
+    contar = compilar(predicado, 'contar')
+    inicio = perf_counter()
+    aprovados = contar(amostra)
+    custo = (perf_counter() - inicio) / max(1, len(amostra))
+    return aprovados / max(1, len(amostra)), custo
+
+
+def otimizar(predicado, amostra):
+    """
+    Reordena recursivamente as cláusulas de E/Ou pelo que foi medido na amostra.
+
+    No 'e', uma cláusula com chance p de passar e custo c deve vir antes
+    quanto menor for c / (1 - p): rejeita mais registros por unidade de
+    custo. No 'ou', vale o simétrico: c / p.
+    """
+    if isinstance(predicado, Nao):
+        return Nao(otimizar(predicado.clausula, amostra))
+    if not isinstance(predicado, E):
+        return predicado
+
+    filhos = [otimizar(clausula, amostra) for clausula in predicado.clausulas]
+    e_logico = not isinstance(predicado, Ou)
+
+    def prioridade(clausula):
+        passa, custo = estimar(clausula, amostra)
+        decisiva = 1 - passa if e_logico else passa
+        return custo / decisiva if decisiva else float('inf')
+
+    return type(predicado)(*sorted(filhos, key=prioridade))
+
+
+# ============================================================================
+# BENCHMARKS
+# ============================================================================
+
+PAISES = ['BR', 'PT', 'US', 'AR', 'MX', 'ES', 'FR', 'DE', 'IT', 'JP']
+
+
+def gerar_usuarios(quantidade, seed=PREDICADOS_CONFIG['seeds']):
+    """Usuários no formato de exemplos_praticos, com mais campos."""
+    gerador = random.Random(seed)
+    return [
+        {
+            'id': i,
+            'nome': f'usuario{i}',
+            'idade': gerador.randint(12, 80),
+            'ativo': gerador.random() < 0.8,
+            'pais': gerador.choice(PAISES),
+            'saldo': gerador.gauss(1000, 600),
+        }
+        for i in range(quantidade)
+    ]
+
+
+def mostrar(titulo, nomes, medicoes):
+    from medicao import descrever
+
+    print(f"\n📊 {titulo}:")
+    referencia = medicoes[0]['por_chamada']
+    for nome, medicao in zip(nomes, medicoes):
+        print(f"   {nome:<30} {descrever(medicao)}  ({referencia / medicao['por_chamada']:.1f}x)")
+
+
+@benchmark('cronometrado', 'predicados', 'filtro', medicoes=5)
+def benchmark_filtro(quantidade=100_000, amostra=2_000):
+    """Filtrar um lote: comprehensions à mão vs closure compilada vs lote compilado e reordenado."""
+    from medicao import medir_caso
+
+    print("\n" + "="*70)
+    print("FILTRO COMPOSTO SOBRE UM LOTE")
+    print("="*70)
+
+    usuarios = gerar_usuarios(quantidade)
+    # Na ordem em que alguém escreveria: as cláusulas que quase sempre passam primeiro
+    predicado = (
+        (Campo('saldo') > 0)
+        & (Campo('ativo') == True)
+        & Campo('pais').em({'BR', 'PT'})
+        & (Campo('idade') >= 65)
+    )
+    otimizado = otimizar(predicado, usuarios[:amostra])
+    print(f"\n   Predicado:  {predicado!r}")
+    print(f"   Reordenado: {otimizado!r}")
+
+    por_registro = compilar(predicado)
+    filtrar = compilar(predicado, 'filtrar')
+    filtrar_otimizado = compilar(otimizado, 'filtrar')
+    variantes = {
+        'comprehension à mão': lambda: [
+            u for u in usuarios
+            if u['saldo'] > 0 and u['ativo'] == True and u['pais'] in {'BR', 'PT'} and u['idade'] >= 65
+        ],
+        'comprehension + closure': lambda: [u for u in usuarios if por_registro(u)],
+        'lote compilado': lambda: filtrar(usuarios),
+        'lote compilado reordenado': lambda: filtrar_otimizado(usuarios),
+        'à mão, ordem ideal': lambda: [
+            u for u in usuarios
+            if u['idade'] >= 65 and u['pais'] in {'BR', 'PT'} and u['ativo'] == True and u['saldo'] > 0
+        ],
+    }
+    esperado = variantes['comprehension à mão']()
+    if any(func() != esperado for func in variantes.values()):
+        raise AssertionError("variantes de filtro divergiram")
+
+    medicoes = [
+        medir_caso(func, PREDICADOS_CONFIG, caso=nome)
+        for nome, func in variantes.items()
+    ]
+    mostrar(f"{quantidade:,} usuários, {len(esperado):,} aprovados", variantes, medicoes)
+    return medicoes
+
+
+@benchmark('cronometrado', 'predicados', 'curto_circuito', medicoes=4)
+def benchmark_any_all(quantidade=100_000):
+    """any()/all() com gerador vs laços compilados com curto-circuito."""
+    from medicao import medir_caso
+
+    print("\n" + "="*70)
+    print("ANY / ALL COM CURTO-CIRCUITO")
+    print("="*70)
+
+    usuarios = gerar_usuarios(quantidade)
+    # O único caso que satisfaz 'algum' fica no fim: o pior caso do curto-circuito
+    usuarios[-1] = dict(usuarios[-1], idade=120, ativo=True)
+    centenario = (Campo('idade') > 100) & (Campo('ativo') == True)
+    valido = (Campo('idade') >= 12) & ~Campo('pais').fora_de(PAISES)
+
+    algum = compilar(centenario, 'algum')
+    todos = compilar(valido, 'todos')
+    variantes = {
+        'any(gerador)': lambda: any(u['idade'] > 100 and u['ativo'] == True for u in usuarios),
+        'algum compilado': lambda: algum(usuarios),
+        'all(gerador)': lambda: all(u['idade'] >= 12 and u['pais'] in PAISES for u in usuarios),
+        'todos compilado': lambda: todos(usuarios),
+    }
+    if not all(func() for func in variantes.values()):
+        raise AssertionError("variantes de any/all divergiram")
+
+    medicoes = [
+        medir_caso(func, PREDICADOS_CONFIG, caso=nome)
+        for nome, func in variantes.items()
+    ]
+    nomes = list(variantes)
+    mostrar(f"any: um aprovado no fim de {quantidade:,}", nomes[:2], medicoes[:2])
+    mostrar(f"all: {quantidade:,} aprovados", nomes[2:], medicoes[2:])
+    return medicoes
+
+
+def main(argv=None):
+    if executar_suite("🧮 MOTOR DE PREDICADOS EM LOTE", PREDICADOS_CONFIG, argv) is None:
+        return
+
+    print(f"""
+💡 Lições:
+   - A ordem das cláusulas importa: no 'and', comece pela que mais rejeita
+   - Chamar uma função por registro custa mais que a própria comparação;
+     gerar o laço inteiro elimina essa chamada
+   - any()/all() com gerador pagam a retomada do gerador a cada item: um
+     laço com return antecipado faz o mesmo curto-circuito mais barato
+    """)
+
+
+if __name__ == "__main__":
+    main()
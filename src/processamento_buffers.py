@@ -0,0 +1,323 @@
+#!/usr/bin/env python3
+"""
+🧱 Processamento de Buffers sem Cópias
+
+benchmark_strings e os concat_* de demo_rapido tratam apenas de str.
+Parsers de dados binários e CSV fatiam buffers bytes grandes, e cada
+fatia de bytes é uma cópia. Este módulo traz utilitários que evitam as
+cópias e compara com o fatiamento ingênuo:
+
+- registros de tamanho fixo: fatias de bytes vs fatias de memoryview vs
+  struct.unpack_from vs struct.iter_unpack
+- quadros com cabeçalho (tipo, tamanho) e payload variável: payload como
+  bytes copiados vs memoryview sobre o buffer original
+- CSV: split() completo vs split com limite vs offsets com bytes.find
+
+Além do throughput (MB/s), cada variante é executada uma vez sobre um
+buffer que conta as cópias feitas por fatias e split.
+
+Executar: python processamento_buffers.py
+"""
+
+import random
+import struct
+
+from registro_benchmarks import benchmark, executar_suite
+
+BUFFERS_CONFIG = {
+    'orcamento_total': 6.0,  # Segundos de medição divididos entre todos os casos
+    'rodadas': 5,
+    'instrumentar': [],
+    'estavel': False,
+    'seeds': 42,
+}
+
+# id (uint32), idade (int32), saldo (double): 16 bytes por registro
+REGISTRO = struct.Struct('<Iid')
+
+# Cabeçalho de quadro: tipo (uint16), tamanho do payload (uint32)
+CABECALHO = struct.Struct('<HI')
+
+
+# ============================================================================
+# UTILITÁRIOS
+# ============================================================================
+
+def ler_quadros(buffer):
+    """
+    Gera (tipo, payload) de quadros [cabeçalho][payload] consecutivos.
+
+    O payload é uma memoryview sobre `buffer`: nenhum byte é copiado.
+    Use bytes(payload) só quando precisar guardar o dado além do buffer.
+    """
+    visao = memoryview(buffer)
+    ler_cabecalho = CABECALHO.unpack_from
+    tamanho_cabecalho = CABECALHO.size
+    posicao, fim = 0, len(visao)
+    while posicao < fim:
+        tipo, tamanho = ler_cabecalho(visao, posicao)
+        inicio = posicao + tamanho_cabecalho
+        posicao = inicio + tamanho
+        if posicao > fim:
+            raise ValueError(f"quadro truncado no byte {inicio - tamanho_cabecalho}")
+        yield tipo, visao[inicio:posicao]
+
+
+def linhas_por_offset(buffer):
+    """Gera (inicio, fim) de cada linha de `buffer`, sem fatiar."""
+    encontrar = buffer.find
+    inicio, total = 0, len(buffer)
+    while inicio < total:
+        fim = encontrar(b'\n', inicio)
+        if fim == -1:
+            fim = total
+        yield inicio, fim
+        inicio = fim + 1
+
+
+def somar_coluna(buffer, coluna, separador=b','):
+    """
+    Conta as linhas de um CSV em bytes e soma a coluna inteira `coluna`.
+
+    Só o campo pedido é fatiado (int() precisa de bytes); o resto da
+    linha é percorrido por offsets com find. Linhas com menos campos que
+    o necessário ou campo não inteiro levantam ValueError com o byte em
+    que a linha começa.
+    """
+    encontrar = buffer.find
+    quantidade = total = 0
+    for linha, fim in linhas_por_offset(buffer):
+        inicio = linha
+        for _ in range(coluna):
+            separacao = encontrar(separador, inicio, fim)
+            if separacao == -1:
+                raise ValueError(f"linha no byte {linha} tem menos de {coluna + 1} campos")
+            inicio = separacao + 1
+        final_campo = encontrar(separador, inicio, fim)
+        campo = buffer[inicio:fim if final_campo == -1 else final_campo]
+        try:
+            total += int(campo)
+        except ValueError:
+            raise ValueError(f"linha no byte {linha}: campo {coluna} não é inteiro: {bytes(campo)!r}") from None
+        quantidade += 1
+    return quantidade, total
+
+
+# ============================================================================
+# CONTAGEM DE CÓPIAS
+# ============================================================================
+
+class BytesContados(bytes):
+    """
+    bytes que contam as cópias feitas por fatias, split e splitlines.
+
+    Os resultados também são BytesContados, então cópias de cópias contam.
+    Serve só para a contagem: é mais lento que bytes e não entra no tempo.
+    """
+
+    copias = 0
+    bytes_copiados = 0
+
+    @classmethod
+    def zerar(cls):
+        cls.copias = cls.bytes_copiados = 0
+
+    @classmethod
+    def _copia(cls, dados):
+        cls.copias += 1
+        cls.bytes_copiados += len(dados)
+        return cls(dados)
+
+    def __getitem__(self, chave):
+        resultado = super().__getitem__(chave)
+        return self._copia(resultado) if isinstance(chave, slice) else resultado
+
+    def split(self, *args, **kwargs):
+        return [self._copia(parte) for parte in super().split(*args, **kwargs)]
+
+    def splitlines(self, *args, **kwargs):
+        return [self._copia(parte) for parte in super().splitlines(*args, **kwargs)]
+
+
+def contar_copias(func, dados):
+    """(cópias, bytes copiados) de uma execução de func(dados)."""
+    contados = BytesContados(dados)
+    BytesContados.zerar()
+    func(contados)
+    return BytesContados.copias, BytesContados.bytes_copiados
+
+
+# ============================================================================
+# DADOS
+# ============================================================================
+
+def gerar_registros(quantidade, seed=BUFFERS_CONFIG['seeds']):
+    gerador = random.Random(seed)
+    return b''.join(
+        REGISTRO.pack(i, gerador.randint(12, 80), gerador.uniform(-500, 5000))
+        for i in range(quantidade)
+    )
+
+
+def gerar_quadros(quantidade, seed=BUFFERS_CONFIG['seeds']):
+    gerador = random.Random(seed)
+    partes = []
+    for i in range(quantidade):
+        payload = bytes(gerador.getrandbits(8) for _ in range(gerador.randint(16, 512)))
+        partes.append(CABECALHO.pack(i % 8, len(payload)))
+        partes.append(payload)
+    return b''.join(partes)
+
+
+def gerar_csv(quantidade, seed=BUFFERS_CONFIG['seeds']):
+    """Linhas id,idade,nome,email,saldo."""
+    gerador = random.Random(seed)
+    return ''.join(
+        f"{i},{gerador.randint(12, 80)},usuario{i},usuario{i}@email.com,{gerador.uniform(-500, 5000):.2f}\n"
+        for i in range(quantidade)
+    ).encode()
+
+
+# ============================================================================
+# VARIANTES
+# ============================================================================
+
+def registros_fatia_bytes(dados):
+    tamanho, ler = REGISTRO.size, REGISTRO.unpack
+    return [ler(dados[i:i + tamanho]) for i in range(0, len(dados), tamanho)]
+
+
+def registros_fatia_memoryview(dados):
+    tamanho, ler, visao = REGISTRO.size, REGISTRO.unpack, memoryview(dados)
+    return [ler(visao[i:i + tamanho]) for i in range(0, len(dados), tamanho)]
+
+
+def registros_unpack_from(dados):
+    tamanho, ler = REGISTRO.size, REGISTRO.unpack_from
+    return [ler(dados, i) for i in range(0, len(dados), tamanho)]
+
+
+def registros_iter_unpack(dados):
+    return list(REGISTRO.iter_unpack(dados))
+
+
+def quadros_fatia_bytes(dados):
+    quadros = []
+    posicao, tamanho_cabecalho = 0, CABECALHO.size
+    while posicao < len(dados):
+        tipo, tamanho = CABECALHO.unpack(dados[posicao:posicao + tamanho_cabecalho])
+        inicio = posicao + tamanho_cabecalho
+        posicao = inicio + tamanho
+        quadros.append((tipo, dados[inicio:posicao]))
+    return quadros
+
+
+def quadros_memoryview(dados):
+    return list(ler_quadros(dados))
+
+
+def csv_split(dados):
+    quantidade = total = 0
+    for linha in dados.splitlines():
+        campos = linha.split(b',')
+        total += int(campos[1])
+        quantidade += 1
+    return quantidade, total
+
+
+def csv_split_limitado(dados):
+    quantidade = total = 0
+    for linha in dados.splitlines():
+        total += int(linha.split(b',', 2)[1])
+        quantidade += 1
+    return quantidade, total
+
+
+def csv_offsets(dados):
+    return somar_coluna(dados, 1)
+
+
+# ============================================================================
+# BENCHMARKS
+# ============================================================================
+
+def comparar(titulo, dados, variantes):
+    """Mede as variantes sobre `dados`, conta as cópias e imprime a tabela."""
+    from medicao import descrever, formatar_bytes, medir_caso
+
+    esperado = next(iter(variantes.values()))(dados)
+    for nome, func in variantes.items():
+        if func(dados) != esperado:
+            raise AssertionError(f"{nome} divergiu")
+
+    print(f"\n📊 {titulo} ({formatar_bytes(len(dados))}):")
+    medicoes = []
+    for nome, func in variantes.items():
+        medicao = medir_caso(lambda: func(dados), BUFFERS_CONFIG, caso=nome)
+        medicao['mb_s'] = len(dados) / medicao['por_chamada'] / (1 << 20)
+        medicao['copias'], medicao['bytes_copiados'] = contar_copias(func, dados)
+        print(f"   {nome:<26} {descrever(medicao)}  {medicao['mb_s']:7.1f} MB/s  "
+              f"{medicao['copias']:>8,} cópias ({formatar_bytes(medicao['bytes_copiados'])})")
+        medicoes.append(medicao)
+    return medicoes
+
+
+@benchmark('cronometrado', 'buffers', 'binario', medicoes=4)
+def benchmark_registros(quantidade=100_000):
+    """Registros de tamanho fixo: fatias de bytes vs memoryview vs unpack_from vs iter_unpack."""
+    print("\n" + "="*70)
+    print("REGISTROS BINÁRIOS DE TAMANHO FIXO")
+    print("="*70)
+
+    return comparar(f"{quantidade:,} registros de {REGISTRO.size} bytes", gerar_registros(quantidade), {
+        'fatia de bytes + unpack': registros_fatia_bytes,
+        'fatia de memoryview': registros_fatia_memoryview,
+        'unpack_from(offset)': registros_unpack_from,
+        'iter_unpack': registros_iter_unpack,
+    })
+
+
+@benchmark('cronometrado', 'buffers', 'binario', medicoes=2)
+def benchmark_quadros(quantidade=20_000):
+    """Quadros com cabeçalho e payload variável: payload copiado vs memoryview."""
+    print("\n" + "="*70)
+    print("QUADROS COM CABEÇALHO E PAYLOAD")
+    print("="*70)
+
+    return comparar(f"{quantidade:,} quadros", gerar_quadros(quantidade), {
+        'fatias de bytes': quadros_fatia_bytes,
+        'unpack_from + memoryview': quadros_memoryview,
+    })
+
+
+@benchmark('cronometrado', 'buffers', 'csv', medicoes=3)
+def benchmark_csv(quantidade=100_000):
+    """Somar uma coluna de um CSV em bytes: split completo vs split limitado vs find."""
+    print("\n" + "="*70)
+    print("COLUNA DE UM CSV EM BYTES")
+    print("="*70)
+
+    return comparar(f"{quantidade:,} linhas", gerar_csv(quantidade), {
+        'split completo': csv_split,
+        'split com limite': csv_split_limitado,
+        'offsets com find': csv_offsets,
+    })
+
+
+def main(argv=None):
+    if executar_suite("🧱 PROCESSAMENTO DE BUFFERS SEM CÓPIAS", BUFFERS_CONFIG, argv) is None:
+        return
+
+    print(f"""
+💡 Lições:
+   - Fatiar bytes copia; fatiar memoryview só cria uma janela sobre o buffer
+   - unpack_from lê direto no offset: nem fatia, nem objeto intermediário
+   - iter_unpack percorre registros fixos inteiros em C
+   - Payloads como memoryview não copiam nada até alguém precisar guardá-los
+   - Em CSV, split() em C costuma vencer find() em Python mesmo copiando
+     mais: limitar o split (maxsplit) corta as cópias inúteis
+    """)
+
+
+if __name__ == "__main__":
+    main()
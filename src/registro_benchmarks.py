@@ -0,0 +1,321 @@
+"""
+🗂️ Registro de Benchmarks e Linha de Comando
+
+Cada benchmark é declarado com o decorador @benchmark, informando suas tags.
+Os parâmetros são os argumentos com valor padrão da própria função:
+
+    @benchmark('colecoes', 'busca')
+    def benchmark_busca(tamanho=10000):
+        ...
+
+Casos que chamam medicao.medir_caso declaram quantas medições fazem
+(`medicoes`: um número, ou uma função dos parâmetros). executar soma as
+medições das execuções planejadas e divide o orçamento da suíte por elas:
+
+    @benchmark('cronometrado', 'listas', medicoes=lambda tamanhos, **_: 3 * len(tamanhos))
+
+A linha de comando permite listar, selecionar por nome/glob/tag,
+sobrescrever parâmetros e executar uma matriz de parâmetros:
+
+    python exemplos_otimizacao.py --listar
+    python exemplos_otimizacao.py 'benchmark_b*' --tag strings
+    python exemplos_otimizacao.py benchmark_busca -p tamanho=100000
+    python exemplos_otimizacao.py benchmark_listas --matriz tamanho=100,1000,10000
+    python exemplos_otimizacao.py --progresso --telemetria eventos.jsonl --tempo-limite 60
+"""
+
+from itertools import product
+
+# argparse, ast e fnmatch são importados sob demanda: este módulo é
+# carregado na partida dos scripts apenas para registrar os casos.
+
+# nome -> {'nome', 'func', 'tags', 'parametros', 'descricao', 'medicoes'}
+REGISTRO = {}
+
+
+def benchmark(*tags, medicoes=0):
+    """
+    Registra a função decorada como benchmark com as tags informadas.
+
+    `medicoes` é o número de chamadas a medir_caso feitas pelo caso, ou uma
+    função que o calcula a partir dos parâmetros (recebidos por nome).
+    """
+    def decorar(func):
+        codigo = func.__code__
+        nomes = codigo.co_varnames[:codigo.co_argcount]
+        padroes = func.__defaults__ or ()
+        parametros = dict(zip(nomes[len(nomes) - len(padroes):], padroes))
+
+        REGISTRO[func.__name__] = {
+            'nome': func.__name__,
+            'func': func,
+            'tags': set(tags),
+            'parametros': parametros,
+            'descricao': (func.__doc__ or '').strip().split('\n')[0],
+            'medicoes': medicoes,
+        }
+        return func
+    return decorar
+
+
+# ============================================================================
+# SELEÇÃO E PARÂMETROS
+# ============================================================================
+
+def selecionar(padroes=None, tags=None):
+    """Casos cujo nome casa com algum padrão (glob) e que têm alguma das tags."""
+    import fnmatch
+
+    casos = []
+    for caso in REGISTRO.values():
+        if padroes and not any(fnmatch.fnmatchcase(caso['nome'], p) for p in padroes):
+            continue
+        if tags and not caso['tags'] & set(tags):
+            continue
+        casos.append(caso)
+    return casos
+
+
+def converter_valor(texto):
+    """Converte '1000' -> 1000, '0.5' -> 0.5, 'True' -> True; senão mantém texto."""
+    import ast
+
+    try:
+        return ast.literal_eval(texto)
+    except (ValueError, SyntaxError):
+        return texto
+
+
+def ler_atribuicoes(atribuicoes, multiplos=False):
+    """Converte ['nome=valor', ...] em dicionário (valores separados por vírgula se multiplos)."""
+    resultado = {}
+    for atribuicao in atribuicoes or []:
+        nome, separador, valor = atribuicao.partition('=')
+        if not separador:
+            raise ValueError(f"esperado NOME=VALOR, recebido '{atribuicao}'")
+        if multiplos:
+            resultado[nome] = [converter_valor(v) for v in valor.split(',')]
+        else:
+            resultado[nome] = converter_valor(valor)
+    return resultado
+
+
+def combinacoes(caso, sobrescritas=None, matriz=None):
+    """Conjuntos de parâmetros a executar para um caso (produto da matriz)."""
+    base = dict(caso['parametros'])
+    base.update({k: v for k, v in (sobrescritas or {}).items() if k in base})
+    eixos = {k: v for k, v in (matriz or {}).items() if k in base}
+    if not eixos:
+        return [base]
+    return [
+        dict(base, **dict(zip(eixos, valores)))
+        for valores in product(*eixos.values())
+    ]
+
+
+def rotulo(caso, parametros):
+    """Identificação legível de uma execução: nome[param=valor,...]."""
+    alterados = {k: v for k, v in parametros.items() if caso['parametros'].get(k) != v}
+    if not alterados:
+        return caso['nome']
+    return f"{caso['nome']}[{','.join(f'{k}={v}' for k, v in alterados.items())}]"
+
+
+def medicoes_previstas(caso, parametros):
+    """Chamadas a medir_caso que `caso` fará com estes parâmetros."""
+    medicoes = caso['medicoes']
+    return medicoes(**parametros) if callable(medicoes) else medicoes
+
+
+def executar(casos, sobrescritas=None, matriz=None, telemetria=None, config=None):
+    """
+    Executa os casos e retorna uma lista de execuções estruturadas.
+
+    Com `config`, config['casos_cronometrados'] recebe o total de medições
+    previstas nas execuções planejadas: medicao.medir_caso divide o
+    orçamento da suíte por esse total, seja qual for a seleção ou a matriz.
+
+    Com `telemetria` (ver telemetria.py), cada execução emite eventos de
+    início e fim e ganha um 'status' ('ok' ou 'tempo_esgotado').
+    """
+    planejadas = [
+        (caso, parametros)
+        for caso in casos
+        for parametros in combinacoes(caso, sobrescritas, matriz)
+    ]
+    if config is not None:
+        config['casos_cronometrados'] = max(1, sum(
+            medicoes_previstas(caso, parametros) for caso, parametros in planejadas))
+    if telemetria is not None:
+        telemetria.iniciar(len(planejadas))
+
+    execucoes = []
+    try:
+        for caso, parametros in planejadas:
+            execucao = {
+                'benchmark': caso['nome'],
+                'rotulo': rotulo(caso, parametros),
+                'tags': sorted(caso['tags']),
+                'parametros': parametros,
+            }
+            if telemetria is None:
+                resultados = caso['func'](**parametros)
+            else:
+                execucao['status'], resultados = telemetria.executar_caso(
+                    execucao['rotulo'], caso['func'], parametros)
+            execucao['resultados'] = resultados or []
+            execucoes.append(execucao)
+    finally:
+        if telemetria is not None:
+            telemetria.finalizar()
+    return execucoes
+
+
+# ============================================================================
+# LINHA DE COMANDO
+# ============================================================================
+
+def ler_ferramentas(texto):
+    """Converte 'cprofile,perf' em lista, validando contra instrumentacao.FERRAMENTAS."""
+    import argparse
+
+    from instrumentacao import FERRAMENTAS
+
+    ferramentas = [f for f in texto.split(',') if f]
+    invalidas = set(ferramentas) - set(FERRAMENTAS)
+    if invalidas:
+        raise argparse.ArgumentTypeError(f"ferramentas inválidas: {', '.join(sorted(invalidas))}")
+    return ferramentas
+
+
+def criar_parser(descricao, add_help=True):
+    """Parser com as opções comuns de seleção e parametrização."""
+    import argparse
+
+    from instrumentacao import FERRAMENTAS
+
+    parser = argparse.ArgumentParser(description=descricao, add_help=add_help)
+    parser.add_argument('padroes', nargs='*', metavar='CASO',
+                        help='nome ou glob dos casos (padrão: todos)')
+    parser.add_argument('--listar', action='store_true',
+                        help='lista os casos registrados e sai')
+    parser.add_argument('--tag', action='append', dest='tags',
+                        help='executa apenas casos com esta tag (pode repetir)')
+    parser.add_argument('-p', '--param', action='append', dest='parametros',
+                        metavar='NOME=VALOR', help='sobrescreve um parâmetro')
+    parser.add_argument('--matriz', action='append', metavar='NOME=V1,V2,...',
+                        help='executa cada valor do parâmetro (produto entre matrizes)')
+    parser.add_argument('--rodadas', type=int, help='rodadas por caso medido')
+    parser.add_argument('--orcamento', type=float,
+                        help='segundos de medição para a suíte completa')
+    parser.add_argument('--estavel', action='store_true',
+                        help='fixa CPUs, congela o GC e avalia a estabilidade (ambiente_estavel.py)')
+    parser.add_argument('--cpus', metavar='LISTA',
+                        help="CPUs para fixar no modo estável, ex.: '2-3' (padrão: isoladas)")
+    parser.add_argument('--instrumentar', type=ler_ferramentas, default=[],
+                        help=f"ferramentas separadas por vírgula: {','.join(FERRAMENTAS)}")
+    from telemetria import adicionar_argumentos
+    adicionar_argumentos(parser)
+    return parser
+
+
+def interpretar(parser, argv=None):
+    """Lê os argumentos, validando parâmetros e seleção."""
+    return preparar_selecao(parser, parser.parse_args(argv))
+
+
+def preparar_selecao(parser, args):
+    """Completa `args` com sobrescritas, matriz e casos selecionados."""
+    try:
+        args.sobrescritas = ler_atribuicoes(args.parametros)
+        args.matriz_valores = ler_atribuicoes(args.matriz, multiplos=True)
+    except ValueError as e:
+        parser.error(str(e))
+    args.casos = selecionar(args.padroes, args.tags)
+    if not args.casos and not args.listar:
+        parser.error("nenhum caso corresponde à seleção (use --listar)")
+    # combinacoes ignora parâmetros que um caso não tem: um nome que nenhum aceita é erro de digitação
+    aceitos = set().union(*(caso['parametros'] for caso in args.casos))
+    desconhecidos = sorted((set(args.sobrescritas) | set(args.matriz_valores)) - aceitos)
+    if desconhecidos and args.casos:
+        parser.error(f"parâmetro(s) desconhecido(s) para os casos selecionados: {', '.join(desconhecidos)} "
+                     f"(aceitos: {', '.join(sorted(aceitos)) or 'nenhum'})")
+    return args
+
+
+def aplicar_medicao(config, args):
+    """Aplica --rodadas, --orcamento, --estavel e --instrumentar a um dicionário de configuração."""
+    config['estavel'] = args.estavel
+    config['instrumentar'] = args.instrumentar
+    if args.rodadas is not None:
+        config['rodadas'] = args.rodadas
+    if args.orcamento is not None:
+        config['orcamento_total'] = args.orcamento
+
+
+def listar(casos=None):
+    """Imprime os casos registrados com tags e parâmetros."""
+    casos = REGISTRO.values() if casos is None else casos
+    print(f"\n📋 {len(casos)} caso(s) registrado(s):\n")
+    for caso in casos:
+        parametros = ', '.join(f'{k}={v!r}' for k, v in caso['parametros'].items()) or '-'
+        print(f"   {caso['nome']:<24} tags: {', '.join(sorted(caso['tags'])):<36} parâmetros: {parametros}")
+        if caso['descricao']:
+            print(f"   {'':<24} {caso['descricao']}")
+
+
+def executar_suite(titulo, config, argv=None, cabecalho=None):
+    """
+    Linha de comando padrão de uma suíte registrada: lista ou executa os
+    casos selecionados, com --estavel, --instrumentar e --json.
+
+    `cabecalho(args)`, se informado, roda depois da preparação do ambiente
+    e antes dos casos: imprime linhas extras do cabeçalho e pode devolver
+    um dict de campos extras para o JSON (ex.: {'sistema': ...}).
+
+    Returns:
+        As execuções estruturadas (None com --listar).
+    """
+    import json
+    import sys
+
+    parser = criar_parser(titulo)
+    parser.add_argument('--json', metavar='ARQUIVO',
+                        help='grava os resultados estruturados em JSON')
+    args = interpretar(parser, argv)
+    if args.listar:
+        listar(args.casos)
+        return None
+    aplicar_medicao(config, args)
+
+    print("\n" + "="*70)
+    print(titulo)
+    print("="*70)
+    print(f"🐍 Python: {sys.version.split()[0]}")
+    print(f"🔧 Configuração: {config}")
+
+    estado = None
+    if args.estavel:
+        from ambiente_estavel import interpretar_lista_cpus, mostrar_avisos, preparar_ambiente
+        estado = preparar_ambiente(interpretar_lista_cpus(args.cpus))
+        mostrar_avisos(estado)
+
+    extras = cabecalho(args) if cabecalho is not None else None
+
+    from telemetria import criar_telemetria
+    execucoes = executar(args.casos, args.sobrescritas, args.matriz_valores, criar_telemetria(args), config)
+    if config['instrumentar']:
+        from instrumentacao import mostrar_instrumentacao
+        for execucao in execucoes:
+            mostrar_instrumentacao(execucao['resultados'])
+
+    dados = {**(extras or {}), 'config': config, 'resultados': execucoes}
+    if estado is not None:
+        from ambiente_estavel import avaliar_estabilidade, mostrar_estabilidade, variacoes_das_execucoes
+        dados['estabilidade'] = avaliar_estabilidade(estado, variacoes_das_execucoes(execucoes))
+        mostrar_estabilidade(dados['estabilidade'])
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as arquivo:
+            json.dump(dados, arquivo, ensure_ascii=False, indent=2, default=str)
+        print(f"\n💾 Resultados estruturados gravados em {args.json}")
+    return execucoes
@@ -0,0 +1,285 @@
+#!/usr/bin/env python3
+"""
+🏆 Seleção Top-k em Fluxos e Contagens Grandes
+
+exemplo_collections e exemplos_praticos chamam most_common(1)/(2) em
+Counters minúsculos. Com milhões de chaves, ordenar tudo para ficar com k
+itens desperdiça trabalho. Utilitários de seleção:
+
+- topk_fluxo: heap mínimo de tamanho k sobre um iterável (uma passada,
+  memória O(k)), a mesma ideia de heapq.nlargest
+- TopKIncremental: top-k de contagens que só crescem, atualizado a cada
+  evento e disponível a qualquer momento
+- quickselect_maiores: seleção in-place sobre um buffer array.array
+
+Os benchmarks comparam com sorted(...)[:k], heapq.nlargest e
+Counter.most_common(k) variando k e n.
+
+Executar: python selecao_topk.py
+Listar casos: python selecao_topk.py --listar
+Tamanhos menores: python selecao_topk.py -p "tamanhos=(10000,100000)"
+"""
+
+import heapq
+import random
+from array import array
+
+from registro_benchmarks import benchmark, executar_suite
+
+TOPK_CONFIG = {
+    'orcamento_total': 10.0,  # Segundos de medição divididos entre todos os casos
+    'rodadas': 3,
+    'instrumentar': [],
+    'estavel': False,
+    'seeds': 42,
+}
+
+TAMANHOS = (10_000, 100_000, 1_000_000)
+KS = (10, 1000)
+
+
+# ============================================================================
+# UTILITÁRIOS DE SELEÇÃO
+# ============================================================================
+
+def topk_fluxo(iteravel, k):
+    """
+    Os k maiores valores de um iterável, do maior para o menor.
+
+    Mantém um heap mínimo com os k maiores vistos: cada valor novo só
+    entra se superar o menor deles (heapreplace, O(log k)).
+    """
+    iterador = iter(iteravel)
+    heap = [valor for _, valor in zip(range(k), iterador)]
+    heapq.heapify(heap)
+    if heap:
+        for valor in iterador:
+            if valor > heap[0]:
+                heapq.heapreplace(heap, valor)
+    heap.sort(reverse=True)
+    return heap
+
+
+class TopKIncremental:
+    """
+    Top-k de itens cujo peso só cresce (ex.: contagens em um fluxo).
+
+    O heap mínimo guarda (peso, item) dos k maiores. Quando um item que já
+    está no heap cresce, apenas o peso em `membros` é atualizado; entradas
+    desatualizadas são corrigidas sob demanda, quando chegam ao topo.
+    """
+
+    def __init__(self, k):
+        self.k = k
+        self.heap = []
+        self.membros = {}  # item -> peso atual
+
+    def atualizar(self, item, peso):
+        """Registra o novo peso (não decrescente) de `item`."""
+        membros = self.membros
+        if item in membros:
+            membros[item] = peso
+            return
+        heap = self.heap
+        if len(heap) < self.k:
+            membros[item] = peso
+            heapq.heappush(heap, (peso, item))
+            return
+        if not heap:  # k <= 0: nenhum item entra
+            return
+
+        # Corrige o topo até que ele reflita o peso atual do seu item
+        while heap[0][0] != membros[heap[0][1]]:
+            topo = heap[0][1]
+            heapq.heapreplace(heap, (membros[topo], topo))
+        if peso > heap[0][0]:
+            _, removido = heapq.heapreplace(heap, (peso, item))
+            del membros[removido]
+            membros[item] = peso
+
+    def resultado(self):
+        """Lista de (item, peso) do maior para o menor peso."""
+        return sorted(self.membros.items(), key=lambda par: par[1], reverse=True)
+
+
+def contar_topk(eventos, k):
+    """Conta os eventos mantendo o top-k atualizado a cada um."""
+    contagens = {}
+    topk = TopKIncremental(k)
+    atualizar = topk.atualizar
+    for evento in eventos:
+        contagem = contagens.get(evento, 0) + 1
+        contagens[evento] = contagem
+        atualizar(evento, contagem)
+    return topk.resultado()
+
+
+def quickselect_maiores(buffer, k, seed=0):
+    """
+    Os k maiores valores de um array.array, do maior para o menor.
+
+    Particiona uma cópia do buffer in-place (Hoare, pivô aleatório) até
+    que as k últimas posições contenham os k maiores; só elas são
+    ordenadas no final. O(n) em média.
+    """
+    dados = array(buffer.typecode, buffer)
+    n = len(dados)
+    if k <= 0:
+        return []
+    if k >= n:
+        return sorted(dados, reverse=True)
+
+    alvo = n - k  # posição do k-ésimo maior na ordem crescente
+    sorteio = random.Random(seed).randrange
+    esquerda, direita = 0, n - 1
+    while esquerda < direita:
+        pivo = dados[sorteio(esquerda, direita + 1)]
+        i, j = esquerda, direita
+        while i <= j:
+            while dados[i] < pivo:
+                i += 1
+            while dados[j] > pivo:
+                j -= 1
+            if i <= j:
+                dados[i], dados[j] = dados[j], dados[i]
+                i += 1
+                j -= 1
+        if alvo <= j:
+            direita = j
+        elif alvo >= i:
+            esquerda = i
+        else:
+            break
+    return sorted(dados[alvo:], reverse=True)
+
+
+# ============================================================================
+# DADOS E RELATÓRIO
+# ============================================================================
+
+def gerar_fluxo(tamanho, seed=TOPK_CONFIG['seeds']):
+    """Fluxo de `tamanho` valores float uniformes."""
+    gerador = random.Random(seed)
+    return [gerador.random() for _ in range(tamanho)]
+
+
+def gerar_eventos(tamanho, seed=TOPK_CONFIG['seeds']):
+    """`tamanho` eventos sobre tamanho/10 chaves com popularidade ~ 1/posição (Zipf)."""
+    gerador = random.Random(seed)
+    chaves = [f"item{i}" for i in range(max(1, tamanho // 10))]
+    pesos = [1 / (i + 1) for i in range(len(chaves))]
+    return gerador.choices(chaves, weights=pesos, k=tamanho)
+
+
+def conferir(resultados, chave=None):
+    """Garante que todas as variantes selecionaram os mesmos valores (empates à parte)."""
+    valores = [[chave(r) if chave else r for r in resultado] for resultado in resultados]
+    if any(v != valores[0] for v in valores[1:]):
+        raise AssertionError("variantes de top-k divergiram")
+
+
+def mostrar(tamanho, k, nomes, medicoes):
+    """Imprime as medições de um (n, k), com o ganho sobre sorted()[:k]."""
+    from medicao import descrever
+
+    print(f"\n📊 n={tamanho:,}, k={k:,}:")
+    referencia = medicoes[0]['por_chamada']
+    for nome, medicao in zip(nomes, medicoes):
+        print(f"   {nome:<22} {descrever(medicao)}  ({referencia / medicao['por_chamada']:.1f}x)")
+
+
+# ============================================================================
+# BENCHMARKS
+# ============================================================================
+
+@benchmark('cronometrado', 'topk', 'fluxo', medicoes=lambda tamanhos, ks: 4 * len(tamanhos) * len(ks))
+def benchmark_fluxo(tamanhos=TAMANHOS, ks=KS):
+    """Os k maiores de um fluxo de floats: sorted, nlargest, heap limitado e quickselect."""
+    from medicao import medir_caso
+
+    print("\n" + "="*70)
+    print("TOP-K DE UM FLUXO DE VALORES")
+    print("="*70)
+
+    resultados = []
+    for tamanho in tamanhos:
+        fluxo = gerar_fluxo(tamanho)
+        buffer = array('d', fluxo)
+        for k in ks:
+            variantes = {
+                'sorted()[:k]': lambda: sorted(fluxo, reverse=True)[:k],
+                'heapq.nlargest': lambda: heapq.nlargest(k, fluxo),
+                'topk_fluxo': lambda: topk_fluxo(fluxo, k),
+                'quickselect(array)': lambda: quickselect_maiores(buffer, k),
+            }
+            conferir([func() for func in variantes.values()])
+            medicoes = [
+                medir_caso(func, TOPK_CONFIG, caso=f"{nome}@n={tamanho},k={k}")
+                for nome, func in variantes.items()
+            ]
+            mostrar(tamanho, k, variantes, medicoes)
+            resultados.extend(medicoes)
+    return resultados
+
+
+@benchmark('cronometrado', 'topk', 'contagem', medicoes=lambda tamanhos, ks: 4 * len(tamanhos) * len(ks))
+def benchmark_contagem(tamanhos=TAMANHOS, ks=KS):
+    """Top-k de contagens de eventos: sorted, most_common, heap incremental e quickselect."""
+    from collections import Counter
+    from operator import itemgetter
+
+    from medicao import medir_caso
+
+    print("\n" + "="*70)
+    print("TOP-K DE CONTAGENS (eventos com popularidade Zipf)")
+    print("="*70)
+
+    peso = itemgetter(1)
+
+    def quickselect_contagens(eventos, k):
+        contagem = Counter(eventos)
+        maiores = quickselect_maiores(array('q', contagem.values()), k)
+        if not maiores:
+            return []
+        corte = maiores[-1]
+        acima = [par for par in contagem.items() if par[1] >= corte]
+        return sorted(acima, key=peso, reverse=True)[:k]
+
+    resultados = []
+    for tamanho in tamanhos:
+        eventos = gerar_eventos(tamanho)
+        for k in ks:
+            variantes = {
+                'sorted()[:k]': lambda: sorted(Counter(eventos).items(), key=peso, reverse=True)[:k],
+                'most_common(k)': lambda: Counter(eventos).most_common(k),
+                'heap incremental': lambda: contar_topk(eventos, k),
+                'quickselect(array)': lambda: quickselect_contagens(eventos, k),
+            }
+            conferir([func() for func in variantes.values()], chave=peso)
+            medicoes = [
+                medir_caso(func, TOPK_CONFIG, caso=f"{nome}@n={tamanho},k={k}")
+                for nome, func in variantes.items()
+            ]
+            mostrar(tamanho, k, variantes, medicoes)
+            resultados.extend(medicoes)
+    return resultados
+
+
+def main(argv=None):
+    if executar_suite("🏆 SELEÇÃO TOP-K EM FLUXOS E CONTAGENS", TOPK_CONFIG, argv) is None:
+        return
+
+    print(f"""
+💡 Lições:
+   - Para k pequeno, heapq.nlargest faz uma passada com memória O(k);
+     most_common(k) já usa nlargest por baixo
+   - Com k próximo de n, sorted() volta a ganhar: ordenar em C é barato
+   - O heap incremental paga um pouco por evento, mas responde o top-k a
+     qualquer momento sem recontar nem reordenar
+   - Quickselect é O(n) em média, porém em Python puro perde para as
+     rotinas em C: meça antes de trocar uma builtin por um algoritmo
+    """)
+
+
+if __name__ == "__main__":
+    main()
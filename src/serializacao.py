@@ -0,0 +1,246 @@
+#!/usr/bin/env python3
+"""
+📦 Formatos de Serialização para Lotes de Registros
+
+Compara formatos de transmissão/armazenamento para lotes de registros no
+formato de zen_python_exemplos.User (name, email, age):
+
+- json (lista de objetos)
+- pickle protocolo 5, em banda (lista de dicts)
+- pickle protocolo 5 com buffers fora de banda: registros em colunas, e
+  as colunas viajam como buffers sem cópia (PickleBuffer)
+- marshal
+- struct com layout fixo (name 32 bytes, email 48 bytes, age int32)
+- json comprimido com zlib, lzma e bz2
+
+Para cada formato: throughput de codificação e decodificação (registros/s),
+tamanho da saída e pico de memória (tracemalloc).
+
+Executar: python serializacao.py
+Um milhão de registros: python serializacao.py -p quantidade=1000000
+"""
+
+import json
+import marshal
+import pickle
+import struct
+from array import array
+
+from registro_benchmarks import benchmark, executar_suite
+
+SERIALIZACAO_CONFIG = {
+    'orcamento_total': 10.0,  # Segundos de medição divididos entre todos os casos
+    'rodadas': 3,
+    'instrumentar': [],
+    'estavel': False,
+    'seeds': 42,
+}
+
+# Layout fixo: name (32 bytes UTF-8), email (48 bytes UTF-8), age (int32)
+LAYOUT_USUARIO = struct.Struct('<32s48si')
+
+# Protocolo 5 e PickleBuffer existem a partir do Python 3.8; antes, o maior disponível
+PROTOCOLO_PICKLE = min(5, pickle.HIGHEST_PROTOCOL)
+TEM_FORA_DE_BANDA = PROTOCOLO_PICKLE >= 5 and hasattr(pickle, 'PickleBuffer')
+
+
+# ============================================================================
+# FORMATOS
+# ============================================================================
+# codificar(registros) -> bytes (ou (bytes, buffers) no pickle fora de banda)
+# decodificar(saida) -> lista de dicts {'name', 'email', 'age'}
+
+def codificar_json(registros):
+    return json.dumps(registros, ensure_ascii=False, separators=(',', ':')).encode()
+
+
+def decodificar_json(dados):
+    return json.loads(dados)
+
+
+def codificar_pickle(registros):
+    return pickle.dumps(registros, protocol=PROTOCOLO_PICKLE)
+
+
+def decodificar_pickle(dados):
+    return pickle.loads(dados)
+
+
+def codificar_pickle_fora_de_banda(registros):
+    """
+    Registros em colunas; cada coluna é um único buffer entregue fora do pickle.
+
+    Os buffers (bytes e array.array) não são copiados para o fluxo do
+    pickle: vão por buffer_callback e podem ser escritos direto em um
+    socket, arquivo ou memória compartilhada.
+    """
+    colunas = {
+        'name': pickle.PickleBuffer('\0'.join(r['name'] for r in registros).encode()),
+        'email': pickle.PickleBuffer('\0'.join(r['email'] for r in registros).encode()),
+        'age': pickle.PickleBuffer(array('i', [r['age'] for r in registros])),
+    }
+    buffers = []
+    dados = pickle.dumps(colunas, protocol=5, buffer_callback=buffers.append)
+    return dados, [buffer.raw() for buffer in buffers]
+
+
+def decodificar_pickle_fora_de_banda(saida):
+    dados, buffers = saida
+    colunas = pickle.loads(dados, buffers=buffers)
+    nomes = str(colunas['name'], 'utf-8').split('\0')
+    emails = str(colunas['email'], 'utf-8').split('\0')
+    idades = memoryview(colunas['age']).cast('i')
+    return [
+        {'name': nome, 'email': email, 'age': idade}
+        for nome, email, idade in zip(nomes, emails, idades)
+    ]
+
+
+def codificar_marshal(registros):
+    return marshal.dumps(registros)
+
+
+def decodificar_marshal(dados):
+    return marshal.loads(dados)
+
+
+def codificar_struct(registros):
+    """Um registro de tamanho fixo por usuário, escrito em um bytearray pré-alocado."""
+    tamanho = LAYOUT_USUARIO.size
+    buffer = bytearray(tamanho * len(registros))
+    escrever = LAYOUT_USUARIO.pack_into
+    for posicao, registro in enumerate(registros):
+        nome = registro['name'].encode()
+        email = registro['email'].encode()
+        # struct trunca campos longos em silêncio: melhor falhar
+        if len(nome) > 32 or len(email) > 48:
+            raise ValueError(f"registro não cabe no layout fixo: {registro!r}")
+        escrever(buffer, posicao * tamanho, nome, email, registro['age'])
+    return bytes(buffer)
+
+
+def decodificar_struct(dados):
+    return [
+        {'name': nome.rstrip(b'\0').decode(), 'email': email.rstrip(b'\0').decode(), 'age': idade}
+        for nome, email, idade in LAYOUT_USUARIO.iter_unpack(dados)
+    ]
+
+
+def comprimido(codificar, decodificar, comprimir, descomprimir):
+    """Formato base seguido de um compressor."""
+    return (
+        lambda registros: comprimir(codificar(registros)),
+        lambda dados: decodificar(descomprimir(dados)),
+    )
+
+
+def formatos():
+    """{nome: (codificar, decodificar)}; os compressores são importados sob demanda."""
+    import bz2
+    import lzma
+    import zlib
+
+    lista = {
+        'json': (codificar_json, decodificar_json),
+        f'pickle {PROTOCOLO_PICKLE}': (codificar_pickle, decodificar_pickle),
+        'pickle 5 fora de banda': (codificar_pickle_fora_de_banda, decodificar_pickle_fora_de_banda),
+        'marshal': (codificar_marshal, decodificar_marshal),
+        'struct fixo': (codificar_struct, decodificar_struct),
+        'json + zlib': comprimido(codificar_json, decodificar_json, zlib.compress, zlib.decompress),
+        'json + lzma': comprimido(codificar_json, decodificar_json,
+                                  lambda dados: lzma.compress(dados, preset=1), lzma.decompress),
+        'json + bz2': comprimido(codificar_json, decodificar_json, bz2.compress, bz2.decompress),
+    }
+    if not TEM_FORA_DE_BANDA:
+        del lista['pickle 5 fora de banda']
+    return lista
+
+
+def tamanho_saida(saida):
+    """Bytes da saída, somando os buffers fora de banda."""
+    if isinstance(saida, tuple):
+        dados, buffers = saida
+        return len(dados) + sum(memoryview(buffer).nbytes for buffer in buffers)
+    return len(saida)
+
+
+# ============================================================================
+# BENCHMARK
+# ============================================================================
+
+def gerar_usuarios(quantidade, seed=SERIALIZACAO_CONFIG['seeds']):
+    """Registros validados por zen_python_exemplos.User, como dicts."""
+    import random
+
+    from zen_python_exemplos import User
+
+    gerador = random.Random(seed)
+    nomes = ['Ana', 'Bruno', 'Carlos', 'Diana', 'Érica', 'Fábio', 'Gabi', 'Hugo']
+    usuarios = (
+        User(f"{gerador.choice(nomes)} {i}", f"usuario{i}@email.com", gerador.randint(0, 99))
+        for i in range(quantidade)
+    )
+    return [dict(vars(usuario)) for usuario in usuarios]
+
+
+@benchmark('cronometrado', 'serializacao', medicoes=lambda **_: 2 * len(formatos()))
+def benchmark_serializacao(quantidade=50_000):
+    """Codificar e decodificar um lote de usuários em cada formato."""
+    from medicao import formatar_bytes, medir_caso, pico_memoria
+
+    print("\n" + "="*70)
+    print("SERIALIZAÇÃO DE LOTES DE REGISTROS")
+    print("="*70)
+
+    registros = gerar_usuarios(quantidade)
+    if not TEM_FORA_DE_BANDA:
+        print(f"\n⚠️  pickle 5 fora de banda ignorado: requer Python 3.8+ (PickleBuffer); "
+              f"usando pickle protocolo {PROTOCOLO_PICKLE}")
+    print(f"\n📊 {quantidade:,} usuários:")
+    print(f"   {'formato':<24} {'tamanho':>10} {'codificar':>14} {'decodificar':>14} {'pico':>10}")
+
+    resultados = []
+    referencia = None
+    for nome, (codificar, decodificar) in formatos().items():
+        saida = codificar(registros)
+        if decodificar(saida) != registros:
+            raise AssertionError(f"{nome}: ida e volta divergiu")
+        tamanho = tamanho_saida(saida)
+        referencia = referencia or tamanho
+
+        ida = medir_caso(lambda: codificar(registros), SERIALIZACAO_CONFIG, caso=f"{nome}@codificar")
+        volta = medir_caso(lambda: decodificar(saida), SERIALIZACAO_CONFIG, caso=f"{nome}@decodificar")
+        ida['pico_bytes'] = pico_memoria(lambda: codificar(registros))
+        volta['pico_bytes'] = pico_memoria(lambda: decodificar(saida))
+        for medicao in (ida, volta):
+            medicao['bytes'] = tamanho
+            medicao['registros_s'] = quantidade / medicao['por_chamada']
+
+        print(f"   {nome:<24} {formatar_bytes(tamanho):>10} "
+              f"{ida['registros_s'] / 1e6:>9.2f} M/s {volta['registros_s'] / 1e6:>9.2f} M/s "
+              f"{formatar_bytes(max(ida['pico_bytes'], volta['pico_bytes'])):>10}"
+              f"  ({tamanho / referencia:.0%} do json)")
+        resultados.extend([ida, volta])
+    return resultados
+
+
+def main(argv=None):
+    if executar_suite("📦 FORMATOS DE SERIALIZAÇÃO PARA LOTES DE REGISTROS", SERIALIZACAO_CONFIG, argv) is None:
+        return
+
+    print(f"""
+💡 Lições:
+   - marshal e pickle são rápidos para dados do próprio Python, mas não
+     servem de formato público (marshal muda entre versões; pickle executa
+     código ao carregar dados não confiáveis)
+   - Em colunas, o pickle 5 manda os dados como poucos buffers fora de
+     banda: menos objetos para codificar e nenhuma cópia no caminho
+   - Layout fixo com struct tem tamanho previsível e acesso direto ao
+     i-ésimo registro, ao custo de limitar o tamanho dos campos
+   - Compressão troca CPU por bytes: zlib é o meio-termo; lzma e bz2
+     comprimem mais e custam bem mais
+    """)
+
+
+if __name__ == "__main__":
+    main()
@@ -2,13 +2,58 @@
 """
 Script de Verificação e Configuração
 Execute: python setup_check.py
+
+As verificações rodam em paralelo e o resultado aprovado fica em cache
+(resultados/setup_check_cache.json), chaveado pela versão do Python e pelo
+mtime/tamanho dos arquivos verificados: sem mudanças, nada é refeito.
+
+Ignorar o cache: python setup_check.py --sem-cache
+Importar cada script em um subprocesso: python setup_check.py --isolado
 """
 
-import sys
+import argparse
+import hashlib
+import importlib.util
+import json
 import os
-import importlib
+import subprocess
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+PROJETO_RAIZ = Path(__file__).resolve().parent.parent
+SRC_DIR = PROJETO_RAIZ / 'src'
+ARQUIVO_CACHE = PROJETO_RAIZ / 'resultados' / 'setup_check_cache.json'
+
+MODULOS_NECESSARIOS = [
+    'timeit',
+    'itertools', 
+    'collections',
+    'operator',
+    'random',
+    'json',
+    'dataclasses',
+    'typing'
+]
+
+ARQUIVOS_NECESSARIOS = [
+    'README.md',
+    'LICENSE',
+    'src/zen_python_exemplos.py',
+    'src/exemplos_otimizacao.py',
+    'src/demo_rapido.py', 
+    'src/setup_check.py',
+    'docs/pt/zen/teoria.md',
+    'docs/pt/zen/pratica_parte1.md',
+    'docs/pt/zen/pratica_parte2.md',
+    'docs/pt/otimizacao/guia_completo.md',
+    'docs/pt/otimizacao/referencia_rapida.md',
+    'docs/pt/CONTRIBUTING.md',
+    'docs/pt/CHANGELOG.md',
+    'config/pyproject.toml',
+    '.gitignore'
+]
+
 def verificar_python():
     """Verifica se a versão do Python é adequada."""
     print("🔍 Verificando versão do Python...")
@@ -22,101 +67,118 @@ def verificar_python():
         print(f"✅ Python {version.major}.{version.minor}.{version.micro} - OK")
         return True
 
+# As verificações abaixo rodam em paralelo: cada uma devolve (ok, linhas)
+# em vez de imprimir, e main() imprime os relatórios na ordem original.
+
 def verificar_modulos():
     """Verifica se todos os módulos necessários estão disponíveis."""
-    print("\n🔍 Verificando módulos necessários...")
-    
-    modulos_necessarios = [
-        'timeit',
-        'itertools', 
-        'collections',
-        'operator',
-        'random',
-        'json',
-        'dataclasses',
-        'typing'
-    ]
-    
+    linhas = ["\n🔍 Verificando módulos necessários..."]
     erros = []
     
-    for modulo in modulos_necessarios:
-        try:
-            importlib.import_module(modulo)
-            print(f"✅ {modulo} - OK")
-        except ImportError:
-            print(f"❌ {modulo} - ERRO")
+    for modulo in MODULOS_NECESSARIOS:
+        if importlib.util.find_spec(modulo) is not None:
+            linhas.append(f"✅ {modulo} - OK")
+        else:
+            linhas.append(f"❌ {modulo} - ERRO")
             erros.append(modulo)
     
-    return len(erros) == 0
+    return len(erros) == 0, linhas
 
 def verificar_arquivos():
     """Verifica se todos os arquivos necessários estão presentes."""
-    print("\n🔍 Verificando arquivos do repositório...")
-    
-    # Usar o diretório pai (raiz do projeto) como referência
-    projeto_raiz = Path(__file__).parent.parent
-    
-    arquivos_necessarios = [
-        'README.md',
-        'LICENSE',
-        'src/zen_python_exemplos.py',
-        'src/exemplos_otimizacao.py',
-        'src/demo_rapido.py', 
-        'src/setup_check.py',
-        'docs/zen/teoria.md',
-        'docs/zen/pratica_parte1.md',
-        'docs/zen/pratica_parte2.md',
-        'docs/otimizacao/guia_completo.md',
-        'docs/otimizacao/referencia_rapida.md',
-        'docs/CONTRIBUTING.md',
-        'docs/CHANGELOG.md',
-        'config/pyproject.toml',
-        '.gitignore'
-    ]
-    
+    linhas = ["\n🔍 Verificando arquivos do repositório..."]
     erros = []
     
-    for arquivo in arquivos_necessarios:
-        caminho_completo = projeto_raiz / arquivo
-        if caminho_completo.exists():
-            print(f"✅ {arquivo} - OK")
+    for arquivo in ARQUIVOS_NECESSARIOS:
+        if (PROJETO_RAIZ / arquivo).exists():
+            linhas.append(f"✅ {arquivo} - OK")
         else:
-            print(f"❌ {arquivo} - AUSENTE")
+            linhas.append(f"❌ {arquivo} - AUSENTE")
             erros.append(arquivo)
     
-    return len(erros) == 0
+    return len(erros) == 0, linhas
 
-def teste_import_scripts():
-    """Testa se os scripts Python podem ser importados sem erro."""
-    print("\n🔍 Testando importação dos scripts...")
-    
-    # Adiciona o diretório src ao path
-    projeto_raiz = Path(__file__).parent.parent
-    src_dir = projeto_raiz / 'src'
+def _compilar(caminho):
+    """Compila o script sem executá-lo: acusa erros de sintaxe, não de importação."""
+    compile(caminho.read_bytes(), str(caminho), 'exec', dont_inherit=True)
+
+def _importar_isolado(caminho):
+    """Importa o script em um subprocesso: o sys.path deste processo não muda."""
+    resultado = subprocess.run(
+        [sys.executable, '-c', f'import {caminho.stem}'],
+        cwd=SRC_DIR, capture_output=True, text=True, timeout=60
+    )
+    if resultado.returncode != 0:
+        erro = resultado.stderr.strip().splitlines()
+        raise RuntimeError(erro[-1] if erro else f"código de saída {resultado.returncode}")
+
+def teste_import_scripts(isolado=False):
+    """Valida os scripts de src/ compilando (ou importando em subprocessos) em paralelo."""
+    titulo = "importação" if isolado else "compilação"
+    linhas = [f"\n🔍 Testando {titulo} dos scripts..."]
+    validar = _importar_isolado if isolado else _compilar
+    scripts = sorted(SRC_DIR.glob('*.py'))
     
-    scripts = [
-        'zen_python_exemplos',
-        'exemplos_otimizacao', 
-        'demo_rapido'
-    ]
+    def validar_script(caminho):
+        try:
+            validar(caminho)
+            return None
+        except Exception as e:
+            return str(e)
     
     erros = []
+    with ThreadPoolExecutor() as executor:
+        for caminho, erro in zip(scripts, executor.map(validar_script, scripts)):
+            if erro is None:
+                linhas.append(f"✅ {caminho.name} - OK")
+            else:
+                linhas.append(f"❌ {caminho.name} - ERRO: {erro[:50]}...")
+                erros.append(caminho.name)
     
-    for script in scripts:
+    return len(erros) == 0, linhas
+
+# ============================================================================
+# CACHE DE RESULTADOS
+# ============================================================================
+
+def chave_ambiente(isolado=False):
+    """
+    Hash do interpretador, das listas verificadas e do mtime/tamanho de cada
+    arquivo verificado. Qualquer mudança gera outra chave e refaz as verificações.
+    """
+    caminhos = [PROJETO_RAIZ / arquivo for arquivo in ARQUIVOS_NECESSARIOS]
+    caminhos += sorted(SRC_DIR.glob('*.py'))
+    arquivos = {}
+    for caminho in caminhos:
         try:
-            # Adiciona o diretório src ao path temporariamente
-            sys.path.insert(0, str(src_dir))
-            importlib.import_module(script)
-            print(f"✅ {script}.py - OK")
-        except Exception as e:
-            print(f"❌ {script}.py - ERRO: {str(e)[:50]}...")
-            erros.append(script)
-        finally:
-            # Remove o diretório do path
-            if str(src_dir) in sys.path:
-                sys.path.remove(str(src_dir))
+            estado = caminho.stat()
+            arquivos[str(caminho.relative_to(PROJETO_RAIZ))] = [estado.st_mtime_ns, estado.st_size]
+        except FileNotFoundError:
+            arquivos[str(caminho.relative_to(PROJETO_RAIZ))] = None
     
-    return len(erros) == 0
+    ambiente = {
+        'python': sys.version,
+        'executavel': sys.executable,
+        'modulos': MODULOS_NECESSARIOS,
+        'isolado': isolado,
+        'arquivos': arquivos
+    }
+    return hashlib.sha256(json.dumps(ambiente, sort_keys=True).encode()).hexdigest()
+
+def ler_cache(chave):
+    """True se a última verificação com esta chave passou."""
+    try:
+        return json.loads(ARQUIVO_CACHE.read_text(encoding='utf-8')).get('chave') == chave
+    except (OSError, ValueError):
+        return False
+
+def salvar_cache(chave):
+    """Guarda a chave de uma verificação que passou (falhas nunca são guardadas)."""
+    try:
+        ARQUIVO_CACHE.parent.mkdir(parents=True, exist_ok=True)
+        ARQUIVO_CACHE.write_text(json.dumps({'chave': chave}), encoding='utf-8')
+    except OSError as e:
+        print(f"⚠️  Não foi possível salvar o cache: {e}")
 
 def mostrar_info_sistema():
     """Mostra informações do sistema."""
@@ -143,32 +205,43 @@ python src/exemplos_otimizacao.py
 # Visualizar documentação:
 # Windows:
 type README.md
-type docs\\zen\\teoria.md
+type docs\\pt\\zen\\teoria.md
 
 # Linux/Mac:
 cat README.md
-cat docs/zen/teoria.md
+cat docs/pt/zen/teoria.md
     """)
 
-def main():
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Verificação do ambiente do zen-python")
+    parser.add_argument('--sem-cache', action='store_true',
+                        help="refaz as verificações mesmo com resultado aprovado em cache")
+    parser.add_argument('--isolado', action='store_true',
+                        help="importa cada script em um subprocesso em vez de só compilar")
+    args = parser.parse_args(argv)
+    
     print("="*60)
     print("🐍 ZEN PYTHON - VERIFICAÇÃO DE CONFIGURAÇÃO")
     print("="*60)
     
-    tudo_ok = True
-    
-    # Verificações
-    if not verificar_python():
-        tudo_ok = False
+    tudo_ok = verificar_python()
     
-    if not verificar_modulos():
-        tudo_ok = False
-    
-    if not verificar_arquivos():
-        tudo_ok = False
-    
-    if not teste_import_scripts():
-        tudo_ok = False
+    chave = chave_ambiente(args.isolado)
+    if not args.sem_cache and ler_cache(chave):
+        print("\n⚡ Ambiente sem mudanças desde a última verificação aprovada (cache)")
+    else:
+        # Verificações em paralelo; os relatórios saem na ordem de submissão
+        verificacoes = [verificar_modulos, verificar_arquivos,
+                        lambda: teste_import_scripts(args.isolado)]
+        with ThreadPoolExecutor(max_workers=len(verificacoes)) as executor:
+            futuros = [executor.submit(verificacao) for verificacao in verificacoes]
+            for futuro in futuros:
+                ok, linhas = futuro.result()
+                print("\n".join(linhas))
+                tudo_ok = tudo_ok and ok
+        
+        if tudo_ok:
+            salvar_cache(chave)
     
     # Informações do sistema
     mostrar_info_sistema()
@@ -0,0 +1,367 @@
+#!/usr/bin/env python3
+"""
+🧮 Crescimento e Redimensionamento de dict e set
+
+benchmark_duplicatas e benchmark_busca constroem sets e dicts de uma vez
+e só medem o resultado. Aqui o foco é o caminho até lá:
+
+- construção incremental (add / d[k] = v em laço) vs em lote (set(lista),
+  dict.fromkeys, comprehensions), em ns por elemento, para vários tamanhos
+- memória por elemento em cada fronteira de redimensionamento e a
+  latência da inserção que dispara o rehash
+- cargas com muitas remoções: entradas "dummy" que ficam na tabela,
+  memória que não volta e picos de compactação em uma fila (FIFO)
+
+Os resultados saem em gráficos de barras no terminal e em
+resultados/tabelas_hash.html (gráficos SVG por tamanho).
+
+Executar: python tabelas_hash.py
+Só memória: python tabelas_hash.py benchmark_memoria -p maximo=1000000
+"""
+
+import random
+import sys
+from pathlib import Path
+
+from registro_benchmarks import benchmark, executar_suite
+
+TABELAS_CONFIG = {
+    'orcamento_total': 10.0,  # Segundos de medição divididos entre todos os casos
+    'rodadas': 3,
+    'instrumentar': [],
+    'estavel': False,
+    'seeds': 42,
+}
+
+ARQUIVO_GRAFICOS = Path(__file__).resolve().parent.parent / 'resultados' / 'tabelas_hash.html'
+
+# (título, rótulo do eixo y, {série: [(x, y), ...]}) acumulados pelos benchmarks
+GRAFICOS = []
+
+
+# ============================================================================
+# GRÁFICOS
+# ============================================================================
+
+def grafico_texto(series, unidade, largura=40, por_serie=False):
+    """
+    Barras horizontais na mesma escala: uma linha por (x, série), agrupadas
+    por x ou, com por_serie, série a série (quando os x não coincidem).
+    """
+    maximo = max(y for pontos in series.values() for _, y in pontos) or 1
+    largura_nome = max(map(len, series))
+    if por_serie:
+        linhas = [(x, nome, y) for nome, pontos in series.items() for x, y in pontos]
+    else:
+        linhas = sorted(((x, nome, y) for nome, pontos in series.items() for x, y in pontos),
+                        key=lambda linha: linha[0])
+    for x, nome, y in linhas:
+        barra = '█' * max(1, round(y / maximo * largura))
+        print(f"   {x:>10,}  {nome:<{largura_nome}}  {y:>9.1f} {unidade}  {barra}")
+
+
+def grafico_svg(series, rotulo_y, largura=640, altura=220, margem=44):
+    """Gráfico de linhas SVG com eixo x logarítmico (tamanho) e uma cor por série."""
+    import html
+    import math
+
+    cores = ['#3572A5', '#d33', '#2a2', '#e80', '#84c', '#0aa', '#777']
+    todos = [ponto for pontos in series.values() for ponto in pontos]
+    x_min, x_max = math.log10(min(x for x, _ in todos)), math.log10(max(x for x, _ in todos))
+    y_max = max(y for _, y in todos) or 1.0
+
+    def x(valor):
+        return margem + (math.log10(valor) - x_min) / ((x_max - x_min) or 1) * (largura - 2 * margem)
+
+    def y(valor):
+        return altura - margem - valor / y_max * (altura - 2 * margem)
+
+    elementos = [
+        f'<svg xmlns="http://www.w3.org/2000/svg" width="{largura}" height="{altura + 16 * len(series)}">',
+        f'<rect width="{largura}" height="{altura}" fill="#fafafa" stroke="#ddd"/>',
+    ]
+    for indice, (nome, pontos) in enumerate(series.items()):
+        cor = cores[indice % len(cores)]
+        coordenadas = ' '.join(f"{x(a):.1f},{y(b):.1f}" for a, b in pontos)
+        elementos.append(f'<polyline points="{coordenadas}" fill="none" stroke="{cor}" stroke-width="2"/>')
+        elementos.append(f'<text x="{margem}" y="{altura + 14 + 16 * indice}" font-size="11" '
+                         f'fill="{cor}">{html.escape(nome)}</text>')
+    elementos += [
+        f'<text x="4" y="{margem - 6}" font-size="11">{y_max:.1f} {html.escape(rotulo_y)}</text>',
+        f'<text x="{margem}" y="{altura - 8}" font-size="11">{10 ** x_min:,.0f}</text>',
+        f'<text x="{largura - margem - 60}" y="{altura - 8}" font-size="11">{10 ** x_max:,.0f} elementos</text>',
+        '</svg>',
+    ]
+    return '\n'.join(elementos)
+
+
+def gravar_graficos(caminho=ARQUIVO_GRAFICOS):
+    """Grava um HTML com um gráfico SVG por benchmark executado."""
+    import html
+
+    secoes = [f"<h2>{html.escape(titulo)}</h2>\n{grafico_svg(series, rotulo_y)}"
+              for titulo, rotulo_y, series in GRAFICOS]
+    documento = (
+        '<!DOCTYPE html>\n<html lang="pt-BR"><head><meta charset="utf-8">'
+        '<title>Crescimento de dict e set</title>'
+        '<style>body{font-family:sans-serif;margin:2em}h2{font-size:1em}</style></head><body>\n'
+        '<h1>Crescimento e redimensionamento de dict e set</h1>\n'
+        + '\n'.join(secoes) + '\n</body></html>\n'
+    )
+    caminho.parent.mkdir(parents=True, exist_ok=True)
+    caminho.write_text(documento, encoding='utf-8')
+    return caminho
+
+
+# ============================================================================
+# BENCHMARKS
+# ============================================================================
+
+def gerar_chaves(tamanho, seed=TABELAS_CONFIG['seeds']):
+    """Inteiros distintos em ordem aleatória (range(n) seria um caso favorável demais)."""
+    return random.Random(seed).sample(range(tamanho * 10), tamanho)
+
+
+def construtores(chaves):
+    """{nome: função} que constroem o mesmo set ou dict a partir de `chaves`."""
+    conjunto = set(chaves)
+
+    def set_laco():
+        s = set()
+        adicionar = s.add
+        for chave in chaves:
+            adicionar(chave)
+        return s
+
+    def dict_laco():
+        d = {}
+        for chave in chaves:
+            d[chave] = None
+        return d
+
+    return {
+        'set: add em laço': set_laco,
+        'set(lista)': lambda: set(chaves),
+        'set comprehension': lambda: {chave for chave in chaves},
+        'dict: d[k] = v em laço': dict_laco,
+        'dict.fromkeys(lista)': lambda: dict.fromkeys(chaves),
+        # Origem com tamanho conhecido (set/dict): a tabela é pré-alocada, sem rehash
+        'dict.fromkeys(set)': lambda: dict.fromkeys(conjunto),
+        'dict comprehension': lambda: {chave: None for chave in chaves},
+    }
+
+
+@benchmark('cronometrado', 'colecoes', 'hash',
+           medicoes=lambda tamanhos: len(construtores(())) * len(tamanhos))
+def benchmark_construcao(tamanhos=(1_000, 10_000, 100_000, 1_000_000)):
+    """ns por elemento para construir set e dict: inserção em laço vs construção em lote."""
+    from medicao import descrever, medir_caso
+
+    print("\n" + "="*70)
+    print("CONSTRUÇÃO INCREMENTAL VS EM LOTE")
+    print("="*70)
+
+    resultados = []
+    series = {}
+    for tamanho in tamanhos:
+        chaves = gerar_chaves(tamanho)
+        variantes = construtores(chaves)
+        print(f"\n📊 {tamanho:,} chaves:")
+        for nome, func in variantes.items():
+            if len(func()) != tamanho:
+                raise AssertionError(f"{nome} divergiu")
+            medicao = medir_caso(func, TABELAS_CONFIG, caso=f"{nome}@{tamanho}")
+            medicao['ns_por_elemento'] = medicao['por_chamada'] / tamanho * 1e9
+            series.setdefault(nome, []).append((tamanho, medicao['ns_por_elemento']))
+            print(f"   {nome:<24} {descrever(medicao)}  {medicao['ns_por_elemento']:6.1f} ns/elemento")
+            resultados.append(medicao)
+
+    print("\n📈 ns por elemento x tamanho:")
+    grafico_texto(series, 'ns')
+    GRAFICOS.append(("Construção: ns por elemento x tamanho", 'ns/elemento', series))
+    return resultados
+
+
+def fronteiras(criar, inserir, maximo):
+    """
+    Insere 0..maximo-1 um a um e registra cada mudança de sys.getsizeof.
+
+    Returns:
+        (fronteiras, latência mediana em ns); cada fronteira é um dict com
+        o número de elementos, bytes antes/depois e a latência da inserção
+        que redimensionou a tabela.
+    """
+    from statistics import median
+    from time import perf_counter_ns
+
+    tabela = criar()
+    tamanho_atual = sys.getsizeof(tabela)
+    latencias = []
+    pontos = []
+    for elemento in range(maximo):
+        inicio = perf_counter_ns()
+        inserir(tabela, elemento)
+        latencia = perf_counter_ns() - inicio
+        latencias.append(latencia)
+        tamanho = sys.getsizeof(tabela)
+        if tamanho != tamanho_atual:
+            pontos.append({
+                'elementos': elemento + 1,
+                'bytes_antes': tamanho_atual,
+                'bytes_depois': tamanho,
+                'latencia_ns': latencia,
+            })
+            tamanho_atual = tamanho
+    return pontos, median(latencias)
+
+
+@benchmark('colecoes', 'hash', 'memoria')
+def benchmark_memoria(maximo=1_000_000):
+    """Bytes por elemento em cada redimensionamento de set e dict e a latência da inserção que o dispara."""
+    print("\n" + "="*70)
+    print("MEMÓRIA E REHASH NAS FRONTEIRAS DE REDIMENSIONAMENTO")
+    print("="*70)
+
+    tipos = {
+        'set': (set, set.add),
+        'dict': (dict, lambda d, chave: d.__setitem__(chave, None)),
+    }
+    resultados = []
+    series = {}
+    for nome, (criar, inserir) in tipos.items():
+        pontos, mediana = fronteiras(criar, inserir, maximo)
+        print(f"\n📊 {nome}: {len(pontos)} redimensionamentos até {maximo:,} elementos "
+              f"(inserção mediana {mediana:.0f} ns, com o custo do cronômetro)")
+        print(f"   {'elementos':>10} {'bytes':>12} {'B/elem depois':>14} {'B/elem antes':>13} {'inserção':>12}")
+        for ponto in pontos:
+            n = ponto['elementos']
+            ponto['bytes_por_elemento'] = ponto['bytes_depois'] / n
+            print(f"   {n:>10,} {ponto['bytes_depois']:>12,} {ponto['bytes_depois'] / n:>14.1f} "
+                  f"{ponto['bytes_antes'] / max(n - 1, 1):>13.1f} {ponto['latencia_ns'] / 1000:>9.1f} µs")
+            resultados.append({'caso': f"{nome}@{n}", **ponto, 'latencia_mediana_ns': mediana})
+        # Dente de serra: cheio logo antes de cada redimensionamento, vazio logo depois
+        series[nome] = [
+            ponto
+            for p in pontos if p['elementos'] >= 1000
+            for ponto in ((p['elementos'] - 1, p['bytes_antes'] / (p['elementos'] - 1)),
+                          (p['elementos'], p['bytes_por_elemento']))
+        ]
+
+    print("\n📈 bytes por elemento x tamanho (logo antes e logo depois de cada redimensionamento):")
+    grafico_texto(series, 'B', por_serie=True)
+    GRAFICOS.append(("Memória: bytes por elemento nas fronteiras de redimensionamento", 'bytes/elemento', series))
+    return resultados
+
+
+def fila_com_rotatividade(tamanho, operacoes, janelas):
+    """
+    Dict usado como fila FIFO de tamanho fixo: cada operação remove a chave
+    mais antiga e insere uma nova. As remoções deixam entradas mortas; quando
+    acabam as posições livres, o dict é compactado (redimensionado).
+
+    Returns:
+        (latência média, latência máxima) em ns de cada janela de operações.
+    """
+    from time import perf_counter_ns
+
+    fila = dict.fromkeys(range(tamanho))
+    por_janela = operacoes // janelas
+    antiga, nova = 0, tamanho
+    janelas_medidas = []
+    for _ in range(janelas):
+        latencias = []
+        for _ in range(por_janela):
+            inicio = perf_counter_ns()
+            del fila[antiga]
+            fila[nova] = None
+            latencias.append(perf_counter_ns() - inicio)
+            antiga += 1
+            nova += 1
+        janelas_medidas.append((sum(latencias) / por_janela, max(latencias)))
+    return janelas_medidas
+
+
+@benchmark('cronometrado', 'colecoes', 'hash', 'remocao', medicoes=4)
+def benchmark_remocao(tamanho=200_000, fracao_removida=0.9):
+    """Buscas e memória depois de remover a maior parte das chaves, e picos de compactação numa fila."""
+    from medicao import descrever, formatar_bytes, medir_caso
+
+    print("\n" + "="*70)
+    print("REMOÇÕES E ENTRADAS DUMMY")
+    print("="*70)
+
+    chaves = gerar_chaves(tamanho)
+    corte = int(tamanho * fracao_removida)
+    restantes = chaves[corte:]
+    ausentes = random.Random(TABELAS_CONFIG['seeds']).sample(range(tamanho * 10, tamanho * 20), len(restantes))
+
+    com_dummies = set(chaves)
+    dict_com_dummies = dict.fromkeys(chaves)
+    for chave in chaves[:corte]:
+        com_dummies.remove(chave)
+        del dict_com_dummies[chave]
+    tabelas = {
+        'set após remoções': com_dummies,
+        'set reconstruído': set(restantes),
+        'dict após remoções': dict_com_dummies,
+        'dict reconstruído': dict(dict_com_dummies),
+    }
+
+    print(f"\n📊 {tamanho:,} chaves, {fracao_removida:.0%} removidas, {len(restantes):,} buscas ausentes:")
+    resultados = []
+    referencia = None
+    for nome, tabela in tabelas.items():
+        if len(tabela) != len(restantes):
+            raise AssertionError(f"{nome} divergiu")
+
+        def buscar(tabela=tabela):
+            return sum(1 for chave in ausentes if chave in tabela)
+
+        medicao = medir_caso(buscar, TABELAS_CONFIG, caso=f"busca ausente@{nome}")
+        medicao['bytes'] = sys.getsizeof(tabela)
+        referencia = referencia or medicao['por_chamada']
+        print(f"   {nome:<22} {descrever(medicao)}  ({referencia / medicao['por_chamada']:.2f}x)  "
+              f"{formatar_bytes(medicao['bytes']):>9}")
+        resultados.append(medicao)
+
+    janelas = 30
+    operacoes = tamanho * 2
+    medidas = fila_com_rotatividade(tamanho // 10, operacoes, janelas)
+    medias = [media for media, _ in medidas]
+    print(f"\n📈 dict como fila FIFO de {tamanho // 10:,} chaves, {operacoes:,} operações "
+          f"(remove a mais antiga + insere), pior operação (µs) por janela de {operacoes // janelas:,}:")
+    grafico_texto({'pior op': [(i, maxima / 1000) for i, (_, maxima) in enumerate(medidas, 1)]}, 'µs')
+    print(f"   média de {sum(medias) / janelas:.0f} ns/op; os picos de centenas de µs são compactações "
+          f"da tabela cheia de entradas removidas")
+    resultados.append({'caso': 'fila FIFO', 'janelas_ns': medidas})
+    return resultados
+
+
+def main(argv=None):
+    if executar_suite("🧮 CRESCIMENTO E REDIMENSIONAMENTO DE DICT E SET", TABELAS_CONFIG, argv) is None:
+        return
+
+    if GRAFICOS:
+        print(f"\n💾 Gráficos SVG gravados em {gravar_graficos()}")
+
+    print(f"""
+💡 Lições:
+   - Construções em lote (set(lista), dict.fromkeys, comprehensions)
+     evitam o laço em Python; o rehash existe nos dois casos
+   - Com origem de tamanho conhecido (dict.fromkeys(set), set(set)), a
+     tabela nasce no tamanho final e nenhum rehash acontece
+   - Logo após um redimensionamento a memória por elemento é a maior: a
+     tabela cresce em saltos e só se enche aos poucos
+   - A inserção que redimensiona custa O(n): são raras, mas aparecem como
+     picos de latência
+   - Remover não devolve memória: set e dict só encolhem ao serem
+     reconstruídos (set(s), dict(d)), que também deixa as buscas mais
+     rápidas por caber melhor no cache
+   - Em um dict com inserções e remoções contínuas (fila, cache), as
+     entradas removidas ocupam espaço até uma compactação O(n), que
+     aparece como pico periódico de latência
+    """)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,247 @@
+"""
+📡 Telemetria de Execuções Longas
+
+Execuções de vários minutos só mostravam o tempo total no fim. Com
+telemetria, registro_benchmarks.executar emite um evento estruturado
+(uma linha JSON) no início e no fim de cada caso, com perf_counter_ns,
+para stderr ou para um arquivo JSON Lines:
+
+    {"evento": "inicio_caso", "caso": "benchmark_busca", "indice": 1, "total": 4, "t_ns": ..., "unix": ...}
+    {"evento": "fim_caso", "caso": "benchmark_busca", "status": "ok", "duracao_ns": ..., ...}
+
+Opções de linha de comando (criar_parser):
+
+    --telemetria ARQUIVO    eventos em JSON Lines ('-' para stderr)
+    --progresso             progresso com ETA em stderr, e aviso periódico
+                            de casos que continuam rodando (possível trava)
+    --tempo-limite SEG      interrompe o caso que passar do limite e segue
+                            para o próximo (status 'tempo_esgotado')
+
+O limite usa SIGALRM (Unix, thread principal). Onde não existe, o caso
+demorado é só reportado. Código em C que não devolve o controle ao
+interpretador (ex.: um sorted() enorme) só é interrompido ao terminar.
+"""
+
+import json
+import sys
+import threading
+import time
+
+# Intervalo (s) entre avisos de caso ainda em execução
+INTERVALO_AVISO = 10.0
+
+
+class TempoEsgotado(BaseException):
+    """
+    Levantada dentro do caso que passou do --tempo-limite.
+
+    Deriva de BaseException, como KeyboardInterrupt: o alarme dispara uma
+    única vez e um `except Exception` no caminho (ex.: instrumentacao)
+    não pode engoli-la e deixar o caso seguir como 'ok'.
+    """
+
+
+class Telemetria:
+    """
+    Eventos de início/fim por caso, progresso com ETA e tempo limite.
+
+    Args:
+        destino: Caminho do arquivo JSON Lines, '-' para stderr ou None
+            (sem eventos).
+        progresso: Imprime o progresso e os avisos em stderr.
+        tempo_limite: Segundos por caso antes de interrompê-lo (None: sem limite).
+    """
+
+    def __init__(self, destino=None, progresso=False, tempo_limite=None, intervalo_aviso=INTERVALO_AVISO):
+        self.progresso = progresso
+        self.tempo_limite = tempo_limite
+        self.intervalo_aviso = intervalo_aviso
+        self._arquivo = None
+        self._fechar_arquivo = False
+        if destino == '-':
+            self._arquivo = sys.stderr
+        elif destino:
+            self._arquivo = open(destino, 'a', encoding='utf-8')
+            self._fechar_arquivo = True
+
+        self.total = 0
+        self.concluidos = 0
+        self.inicio_ns = None
+        self.duracoes_ns = []
+        self._caso_atual = None  # (rótulo, início em ns) do caso em execução
+        self._parar = threading.Event()
+        self._vigia = None
+
+    # ------------------------------------------------------------------
+    # Eventos
+    # ------------------------------------------------------------------
+
+    def emitir(self, evento, **campos):
+        """Grava um evento como uma linha JSON."""
+        if self._arquivo is None:
+            return
+        registro = {'evento': evento, 't_ns': time.perf_counter_ns(), 'unix': time.time(), **campos}
+        self._arquivo.write(json.dumps(registro, ensure_ascii=False, default=str) + '\n')
+        self._arquivo.flush()
+
+    def _mostrar(self, texto):
+        if self.progresso:
+            print(texto, file=sys.stderr, flush=True)
+
+    def eta_ns(self):
+        """Tempo restante estimado pela média dos casos concluídos (None sem histórico)."""
+        if not self.duracoes_ns:
+            return None
+        media = sum(self.duracoes_ns) / len(self.duracoes_ns)
+        restante = media * (self.total - self.concluidos)
+        if self._caso_atual is not None:
+            restante -= min(media, time.perf_counter_ns() - self._caso_atual[1])
+        return max(0, restante)
+
+    def _linha_progresso(self):
+        decorrido = (time.perf_counter_ns() - self.inicio_ns) / 1e9
+        eta = self.eta_ns()
+        texto_eta = f"{eta / 1e9:.1f} s" if eta is not None else '?'
+        return f"[{self.concluidos}/{self.total}] decorrido {decorrido:.1f} s, ETA {texto_eta}"
+
+    # ------------------------------------------------------------------
+    # Ciclo de vida
+    # ------------------------------------------------------------------
+
+    def iniciar(self, total):
+        """Início da execução de `total` casos; liga o vigia de casos demorados."""
+        self.total = total
+        self.concluidos = 0
+        self.duracoes_ns = []
+        self.inicio_ns = time.perf_counter_ns()
+        self.emitir('inicio_execucao', total=total, tempo_limite=self.tempo_limite)
+        if self.progresso or self._arquivo is not None:
+            self._parar.clear()
+            self._vigia = threading.Thread(target=self._vigiar, name='telemetria-vigia', daemon=True)
+            self._vigia.start()
+
+    def finalizar(self):
+        """Fim da execução: evento com o total e fechamento do arquivo."""
+        self._parar.set()
+        if self._vigia is not None:
+            self._vigia.join()
+            self._vigia = None
+        duracao = time.perf_counter_ns() - self.inicio_ns
+        self.emitir('fim_execucao', concluidos=self.concluidos, total=self.total, duracao_ns=duracao)
+        self._mostrar(f"📡 {self.concluidos}/{self.total} caso(s) em {duracao / 1e9:.2f} s")
+        if self._fechar_arquivo:
+            self._arquivo.close()
+            self._arquivo = None
+
+    def _vigiar(self):
+        """Thread de fundo: avisa quando o caso atual passa de cada intervalo."""
+        avisado = None
+        while not self._parar.wait(1.0):
+            atual = self._caso_atual
+            if atual is None:
+                continue
+            rotulo, inicio = atual
+            decorrido = (time.perf_counter_ns() - inicio) / 1e9
+            intervalos = int(decorrido // self.intervalo_aviso)
+            if intervalos and (rotulo, inicio, intervalos) != avisado:
+                avisado = (rotulo, inicio, intervalos)
+                self.emitir('caso_em_andamento', caso=rotulo, decorrido_ns=int(decorrido * 1e9))
+                self._mostrar(f"⏳ {rotulo} ainda em execução há {decorrido:.0f} s  {self._linha_progresso()}")
+
+    # ------------------------------------------------------------------
+    # Casos
+    # ------------------------------------------------------------------
+
+    def executar_caso(self, rotulo, func, parametros):
+        """
+        Executa func(**parametros) entre os eventos de início e fim.
+
+        Returns:
+            (status, resultado): status 'ok' ou 'tempo_esgotado' (resultado
+            None). Outras exceções são registradas como 'erro' e propagadas.
+        """
+        indice = self.concluidos + 1
+        inicio = time.perf_counter_ns()
+        self._caso_atual = (rotulo, inicio)
+        self.emitir('inicio_caso', caso=rotulo, indice=indice, total=self.total, parametros=parametros)
+        self._mostrar(f"▶️  [{indice}/{self.total}] {rotulo}")
+
+        status, resultado, erro = 'ok', None, None
+        armado, anterior = self._armar_alarme()
+        try:
+            resultado = func(**parametros)
+            # Ainda dentro do try: um alarme que dispare até aqui vira 'tempo_esgotado'
+            self._cancelar_alarme(armado)
+        except TempoEsgotado:
+            status = 'tempo_esgotado'
+        except BaseException as e:
+            status, erro = 'erro', f"{type(e).__name__}: {e}"
+            raise
+        finally:
+            self._desarmar_alarme(armado, anterior)
+            duracao = time.perf_counter_ns() - inicio
+            self._caso_atual = None
+            self.concluidos += 1
+            self.duracoes_ns.append(duracao)
+            campos = {'erro': erro} if erro else {}
+            self.emitir('fim_caso', caso=rotulo, indice=indice, status=status, duracao_ns=duracao, **campos)
+            marca = {'ok': '✅', 'tempo_esgotado': '⌛', 'erro': '❌'}[status]
+            self._mostrar(f"{marca} {rotulo}: {duracao / 1e9:.2f} s ({status})  {self._linha_progresso()}")
+        return status, resultado
+
+    def _armar_alarme(self):
+        """
+        SIGALRM para o tempo limite.
+
+        Returns:
+            (armado, handler anterior). O handler anterior pode ser None
+            (instalado fora do Python), por isso o indicador separado.
+        """
+        if not self.tempo_limite:
+            return False, None
+        import signal
+
+        if not hasattr(signal, 'setitimer') or threading.current_thread() is not threading.main_thread():
+            return False, None
+
+        def esgotar(signum, quadro):
+            raise TempoEsgotado(f"passou de {self.tempo_limite} s")
+
+        anterior = signal.signal(signal.SIGALRM, esgotar)
+        signal.setitimer(signal.ITIMER_REAL, self.tempo_limite)
+        return True, anterior
+
+    def _cancelar_alarme(self, armado):
+        if armado:
+            import signal
+
+            signal.setitimer(signal.ITIMER_REAL, 0)
+
+    def _desarmar_alarme(self, armado, anterior):
+        """Cancela o timer e restaura o handler anterior de SIGALRM."""
+        if not armado:
+            return
+        import signal
+
+        try:
+            self._cancelar_alarme(armado)
+        except TempoEsgotado:
+            pass  # disparou depois do caso, antes do cancelamento; o timer é de disparo único
+        signal.signal(signal.SIGALRM, signal.SIG_DFL if anterior is None else anterior)
+
+
+def adicionar_argumentos(parser):
+    """Opções --telemetria, --progresso e --tempo-limite."""
+    parser.add_argument('--telemetria', metavar='ARQUIVO',
+                        help="eventos de início/fim por caso em JSON Lines ('-' para stderr)")
+    parser.add_argument('--progresso', action='store_true',
+                        help='progresso com ETA e avisos de casos demorados em stderr')
+    parser.add_argument('--tempo-limite', type=float, metavar='SEGUNDOS',
+                        help='interrompe o caso que passar do limite e segue para o próximo')
+
+
+def criar_telemetria(args):
+    """Telemetria a partir dos argumentos, ou None se nenhuma opção foi usada."""
+    if not (args.telemetria or args.progresso or args.tempo_limite):
+        return None
+    return Telemetria(args.telemetria, args.progresso, args.tempo_limite)
@@ -5,11 +5,10 @@ Demonstra cada princípio com código que roda
 Execute: python zen_python_exemplos.py
 """
 
-import timeit
-from collections import Counter, defaultdict
 from dataclasses import dataclass
-from typing import Optional
-import json
+
+# medicao (e com ele timeit) e collections são importados nos exemplos que os usam,
+# mantendo a partida do script leve.
 
 
 def mostrar_zen():
@@ -348,6 +347,8 @@ def exemplo_19_namespaces():
 # =================================================================
 
 def benchmark_exemplos():
+    from medicao import formatar_tempo, medir
+
     print("\n" + "=" * 70)
     print("BENCHMARKS - DEMONSTRANDO DIFERENÇAS DE PERFORMANCE")
     print("=" * 70)
@@ -364,12 +365,16 @@ def benchmark_exemplos():
     def com_comprehension():
         return [i * 2 for i in range(1000)]
     
-    tempo_loop = timeit.timeit(com_loop, number=1000)
-    tempo_comp = timeit.timeit(com_comprehension, number=1000)
+    # Várias rodadas: a variação entre elas entra na avaliação de estabilidade
+    loop = medir(com_loop, tempo_alvo=0.05, rodadas=5)
+    comp = medir(com_comprehension, tempo_alvo=0.05, rodadas=5)
     
-    print(f"   Loop com append: {tempo_loop:.6f}s")
-    print(f"   List comprehension: {tempo_comp:.6f}s")
-    print(f"   Comprehension é {tempo_loop/tempo_comp:.1f}x mais rápida")
+    print(f"   Loop com append: {formatar_tempo(loop['por_chamada'])} por chamada")
+    print(f"   List comprehension: {formatar_tempo(comp['por_chamada'])} por chamada")
+    print(f"   Comprehension é {loop['por_chamada']/comp['por_chamada']:.1f}x mais rápida")
+    
+    # Resultados estruturados (usados por historico_resultados.py)
+    return [loop, comp]
 
 
 # =================================================================
@@ -394,6 +399,8 @@ class User:
 
 
 def exemplo_pratico_completo():
+    from collections import Counter
+
     print("\n" + "=" * 70)
     print("EXEMPLO PRÁTICO COMPLETO")
     print("=" * 70)
@@ -0,0 +1,6 @@
+"""Os scripts de src/ se importam pelo nome (ex.: from registro_benchmarks import ...)."""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src'))
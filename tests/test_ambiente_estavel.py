@@ -0,0 +1,28 @@
+"""Pontuação de estabilidade com e sem variação entre rodadas."""
+
+import pytest
+
+import ambiente_estavel
+from ambiente_estavel import LIMIAR_ESTABILIDADE, avaliar_estabilidade
+
+ESTADO = {'cpus': None, 'avisos': [], 'carga_antes': None}
+
+
+@pytest.fixture(autouse=True)
+def sem_carga(monkeypatch):
+    monkeypatch.setattr(ambiente_estavel, 'carga_media', lambda: None)
+
+
+def test_sem_variacao_medida_nao_e_estavel():
+    relatorio = avaliar_estabilidade(ESTADO, [None, None])
+    assert relatorio['variacao_media'] is None
+    assert relatorio['pontuacao'] == 60
+    assert not relatorio['estavel']
+
+
+def test_variacao_medida_entra_na_pontuacao():
+    relatorio = avaliar_estabilidade(ESTADO, [0.0, None, 0.02])
+    assert relatorio['variacao_media'] == 0.01
+    assert relatorio['pontuacao'] == 96
+    assert relatorio['estavel']
+    assert avaliar_estabilidade(ESTADO, [0.5])['pontuacao'] < LIMIAR_ESTABILIDADE
@@ -0,0 +1,74 @@
+"""Espaços indexáveis contra itertools.product/combinations."""
+
+from itertools import combinations, product
+
+import pytest
+
+import combinatoria
+from combinatoria import EspacoCombinacoes, EspacoProduto, _comb, dividir
+
+PRODUTOS = [
+    ((range(3), 'ab', (True, False)), 1),
+    ((range(4),), 3),
+    (('xyz',), 1),
+]
+COMBINACOES = [(8, 3), (6, 0), (6, 6), (10, 4), (4, 5)]
+
+
+@pytest.fixture(params=[None, 4], ids=['bloco padrão', 'blocos pequenos'])
+def limite_bloco(request, monkeypatch):
+    if request.param is not None:
+        monkeypatch.setattr(combinatoria, 'LIMITE_BLOCO', request.param)
+
+
+@pytest.mark.parametrize('sequencias, repeat', PRODUTOS)
+def test_produto_rank_unrank_ida_e_volta(sequencias, repeat):
+    espaco = EspacoProduto(*sequencias, repeat=repeat)
+    esperado = list(product(*sequencias, repeat=repeat))
+    assert len(espaco) == len(esperado)
+    for indice, elemento in enumerate(esperado):
+        assert espaco[indice] == elemento
+        assert espaco.posicao(elemento) == indice
+    assert espaco[-1] == esperado[-1]
+
+
+@pytest.mark.parametrize('n, r', COMBINACOES)
+def test_combinacoes_rank_unrank_ida_e_volta(n, r):
+    espaco = EspacoCombinacoes(range(n), r)
+    esperado = list(combinations(range(n), r))
+    assert len(espaco) == len(esperado) == _comb(n, r)
+    for indice, elemento in enumerate(esperado):
+        assert espaco[indice] == elemento
+        assert espaco.posicao(elemento) == indice
+
+
+@pytest.mark.parametrize('espaco', [EspacoProduto(range(3), repeat=2), EspacoCombinacoes(range(5), 2)])
+def test_indice_fora_do_espaco(espaco):
+    with pytest.raises(IndexError):
+        espaco[len(espaco)]
+    with pytest.raises(IndexError):
+        espaco[-len(espaco) - 1]
+
+
+@pytest.mark.parametrize('sequencias, repeat', PRODUTOS)
+def test_produto_iterar_intervalos(limite_bloco, sequencias, repeat):
+    espaco = EspacoProduto(*sequencias, repeat=repeat)
+    esperado = list(product(*sequencias, repeat=repeat))
+    assert list(espaco) == esperado
+    for inicio, fim in [(0, 1), (3, 11), (5, 5), (max(len(esperado) - 2, 0), len(esperado) + 10)]:
+        assert list(espaco.iterar(inicio, fim)) == esperado[inicio:fim]
+
+
+@pytest.mark.parametrize('n, r', COMBINACOES)
+def test_combinacoes_iterar_intervalos(limite_bloco, n, r):
+    espaco = EspacoCombinacoes(range(n), r)
+    esperado = list(combinations(range(n), r))
+    assert list(espaco) == esperado
+    for inicio, fim in [(0, 1), (3, 11), (5, 5), (max(len(esperado) - 2, 0), len(esperado) + 10)]:
+        assert list(espaco.iterar(inicio, fim)) == esperado[inicio:fim]
+
+
+def test_dividir_cobre_o_espaco_sem_sobreposicao():
+    espaco = EspacoCombinacoes(range(9), 4)
+    blocos = dividir(espaco, 10)
+    assert [elemento for inicio, fim in blocos for elemento in espaco.iterar(inicio, fim)] == list(espaco)
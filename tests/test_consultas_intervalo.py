@@ -0,0 +1,53 @@
+"""Estruturas de consulta por intervalo contra uma varredura completa."""
+
+import random
+
+import pytest
+
+from consultas_intervalo import ESTRUTURAS, FiltroLinear, IndiceIntervalos, ListaOrdenadaBlocos
+
+
+def construir(classe, valores):
+    # Carga pequena para exercitar vários blocos/baldes e as divisões na inserção
+    if classe in (ListaOrdenadaBlocos, IndiceIntervalos):
+        return classe(valores, carga=8)
+    return classe(valores)
+
+
+def varredura(valores, a, b):
+    return sorted(v for v in valores if a <= v <= b)
+
+
+def consultar(estrutura, a, b):
+    resultado = estrutura.intervalo(a, b)
+    return sorted(resultado) if isinstance(estrutura, FiltroLinear) else resultado
+
+
+def consultas(gerador, maximo, quantidade=200):
+    pares = [tuple(sorted((gerador.randint(-10, maximo + 10), gerador.randint(-10, maximo + 10))))
+             for _ in range(quantidade)]
+    return pares + [(-50, -1), (maximo + 1, maximo + 50), (0, maximo), (5, 5), (7, 3)]
+
+
+@pytest.mark.parametrize('classe', ESTRUTURAS, ids=lambda c: c.nome)
+@pytest.mark.parametrize('tamanho, maximo', [(1, 10), (300, 100), (500, 10_000)])
+def test_consulta_igual_a_varredura(classe, tamanho, maximo):
+    gerador = random.Random(tamanho)
+    valores = [gerador.randint(0, maximo) for _ in range(tamanho)]  # com repetidos
+    estrutura = construir(classe, valores)
+    for a, b in consultas(gerador, maximo):
+        assert consultar(estrutura, a, b) == varredura(valores, a, b), (a, b)
+
+
+@pytest.mark.parametrize('classe', ESTRUTURAS, ids=lambda c: c.nome)
+@pytest.mark.parametrize('tamanho', [0, 50])
+def test_insercoes_seguidas_de_consultas(classe, tamanho):
+    gerador = random.Random(3)
+    valores = [gerador.randint(0, 1000) for _ in range(tamanho)]
+    estrutura = construir(classe, valores)
+    for _ in range(400):
+        valor = gerador.randint(-20, 1500)
+        estrutura.inserir(valor)
+        valores.append(valor)
+    for a, b in consultas(gerador, 1500):
+        assert consultar(estrutura, a, b) == varredura(valores, a, b), (a, b)
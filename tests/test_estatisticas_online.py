@@ -0,0 +1,83 @@
+"""Agregados online contra média, variância e quantis exatos."""
+
+import math
+import statistics
+from bisect import bisect_left, bisect_right
+
+import pytest
+
+from estatisticas_online import QuantilP2, ResumoOnline, TDigest, gerar_fluxo, quantil_exato
+
+VALORES = gerar_fluxo(20_000)
+ORDENADOS = sorted(VALORES)
+QUANTIS = (0.01, 0.1, 0.25, 0.5, 0.75, 0.9, 0.99)
+
+
+def fragmentos(valores, partes):
+    passo = -(-len(valores) // partes)
+    return [valores[i:i + passo] for i in range(0, len(valores), passo)]
+
+
+def erro_de_posto(estimado, q):
+    """Distância entre q e a fração dos valores abaixo da estimativa (0 se cair entre empates)."""
+    abaixo = bisect_left(ORDENADOS, estimado) / len(ORDENADOS)
+    ate = bisect_right(ORDENADOS, estimado) / len(ORDENADOS)
+    return max(0.0, abaixo - q, q - ate)
+
+
+def test_quantil_exato():
+    assert quantil_exato([1, 2, 3, 4], 0.5) == 2.5
+    assert quantil_exato([1, 2, 3, 4], 0.0) == 1
+    assert quantil_exato([1, 2, 3, 4], 1.0) == 4
+    assert quantil_exato([7], 0.9) == 7
+
+
+def test_resumo_igual_a_statistics():
+    resumo = ResumoOnline(VALORES)
+    assert resumo.n == len(VALORES)
+    assert math.isclose(resumo.media, statistics.mean(VALORES), rel_tol=1e-12)
+    assert math.isclose(resumo.variancia, statistics.variance(VALORES), rel_tol=1e-9)
+    assert (resumo.minimo, resumo.maximo) == (ORDENADOS[0], ORDENADOS[-1])
+
+
+@pytest.mark.parametrize('partes', [1, 2, 7])
+def test_resumo_mesclado_igual_ao_inteiro(partes):
+    mesclado = ResumoOnline()
+    for parte in fragmentos(VALORES, partes):
+        mesclado = mesclado.mesclar(ResumoOnline(parte))
+    inteiro = ResumoOnline(VALORES)
+    assert mesclado.n == inteiro.n
+    assert math.isclose(mesclado.media, inteiro.media, rel_tol=1e-12)
+    assert math.isclose(mesclado.variancia, inteiro.variancia, rel_tol=1e-9)
+    assert (mesclado.minimo, mesclado.maximo) == (inteiro.minimo, inteiro.maximo)
+
+
+@pytest.mark.parametrize('p', [0.5, 0.9, 0.99])
+def test_p2_perto_do_quantil_exato(p):
+    assert erro_de_posto(QuantilP2(p).atualizar(VALORES).valor, p) < 0.005
+
+
+def test_p2_com_poucos_valores():
+    assert QuantilP2(0.5).atualizar([3, 1, 2]).valor == 2
+    assert math.isnan(QuantilP2(0.5).valor)
+
+
+@pytest.mark.parametrize('q', QUANTIS)
+def test_tdigest_perto_do_quantil_exato(q):
+    assert erro_de_posto(TDigest().atualizar(VALORES).quantil(q), q) < 0.005
+
+
+@pytest.mark.parametrize('partes', [2, 8])
+def test_tdigest_mesclado_perto_do_quantil_exato(partes):
+    mesclado = TDigest()
+    for parte in fragmentos(VALORES, partes):
+        mesclado = mesclado.mesclar(TDigest().atualizar(parte))
+    assert mesclado.total == len(VALORES)
+    for q in QUANTIS:
+        assert erro_de_posto(mesclado.quantil(q), q) < 0.005
+    assert mesclado.quantil(0.0) == ORDENADOS[0]
+    assert mesclado.quantil(1.0) == ORDENADOS[-1]
+
+
+def test_tdigest_vazio():
+    assert math.isnan(TDigest().quantil(0.5))
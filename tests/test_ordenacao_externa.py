@@ -0,0 +1,56 @@
+"""ordenar_externo e agrupar_externo contra sorted() e groupby."""
+
+from itertools import groupby
+from operator import itemgetter
+
+import pytest
+
+from ordenacao_externa import agrupar_externo, gerar_registros, ordenar_externo, totais_por_categoria
+
+CATEGORIA = itemgetter('categoria')
+
+
+@pytest.mark.parametrize('reverso', [False, True])
+@pytest.mark.parametrize('memoria_max', [10 ** 9, 20_000, 2_000])
+def test_igual_a_sorted_e_estavel(tmp_path, reverso, memoria_max):
+    registros = list(gerar_registros(3000, categorias=50))
+    estatisticas = {}
+    resultado = list(ordenar_externo(iter(registros), CATEGORIA, reverso, memoria_max,
+                                     pasta=tmp_path, estatisticas=estatisticas))
+    assert resultado == sorted(registros, key=CATEGORIA, reverse=reverso)
+    if memoria_max < 10 ** 9:
+        assert estatisticas['corridas'] > 1
+    assert list(tmp_path.iterdir()) == []  # temporários apagados
+
+
+def test_sem_chave_e_muitas_corridas(monkeypatch, tmp_path):
+    import ordenacao_externa
+
+    # Força intercalação em mais de uma passagem
+    monkeypatch.setattr(ordenacao_externa, 'MAXIMO_CORRIDAS', 4)
+    numeros = [(i * 7919) % 1000 for i in range(2000)]
+    estatisticas = {}
+    resultado = list(ordenar_externo(numeros, memoria_max=500, pasta=tmp_path, estatisticas=estatisticas))
+    assert resultado == sorted(numeros)
+    assert estatisticas['passagens'] > 1
+
+
+@pytest.mark.parametrize('reverso', [False, True])
+def test_entrada_vazia(reverso):
+    estatisticas = {}
+    assert list(ordenar_externo(iter(()), reverso=reverso, memoria_max=10, estatisticas=estatisticas)) == []
+    assert estatisticas == {'corridas': 0, 'passagens': 0, 'bytes_em_disco': 0}
+
+
+def test_agrupar_externo_igual_a_groupby_sorted():
+    registros = list(gerar_registros(2000, categorias=30))
+    esperado = totais_por_categoria(groupby(sorted(registros, key=CATEGORIA), key=CATEGORIA))
+    assert totais_por_categoria(agrupar_externo(iter(registros), CATEGORIA, memoria_max=5_000)) == esperado
+
+
+def test_gerador_fechado_apaga_temporarios(tmp_path):
+    gerador = ordenar_externo(range(5000, 0, -1), memoria_max=1_000, pasta=tmp_path)
+    assert next(gerador) == 1
+    assert list(tmp_path.iterdir())  # corridas em disco durante a intercalação
+    gerador.close()
+    assert list(tmp_path.iterdir()) == []
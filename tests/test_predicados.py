@@ -0,0 +1,89 @@
+"""Predicados compilados (todos os modos) e otimizados contra uma avaliação interpretada."""
+
+import operator
+import random
+
+import pytest
+
+from predicados import PAISES, Campo, Comparacao, E, Nao, Ou, compilar, gerar_usuarios, otimizar
+
+OPERACOES = {
+    '==': operator.eq, '!=': operator.ne, '<': operator.lt, '<=': operator.le,
+    '>': operator.gt, '>=': operator.ge,
+    'in': lambda a, b: a in b, 'not in': lambda a, b: a not in b,
+}
+
+USUARIOS = gerar_usuarios(500, seed=7)
+
+
+def avaliar(predicado, r):
+    """Referência: percorre a árvore do predicado, sem gerar código."""
+    if isinstance(predicado, Comparacao):
+        return OPERACOES[predicado.operador](r[predicado.campo], predicado.valor)
+    if isinstance(predicado, Nao):
+        return not avaliar(predicado.clausula, r)
+    resultados = (avaliar(clausula, r) for clausula in predicado.clausulas)
+    return any(resultados) if isinstance(predicado, Ou) else all(resultados)
+
+
+def comparacao_aleatoria(gerador):
+    return gerador.choice([
+        lambda: Campo('idade') >= gerador.randint(10, 90),
+        lambda: Campo('idade') < gerador.randint(10, 90),
+        lambda: Campo('saldo') > gerador.uniform(-500, 5000),
+        lambda: Campo('ativo') == gerador.choice([True, False]),
+        lambda: Campo('pais') != gerador.choice(PAISES),
+        lambda: Campo('pais').em(gerador.sample(PAISES, 3)),
+        lambda: Campo('pais').fora_de(gerador.sample(PAISES, 5)),
+    ])()
+
+
+def predicado_aleatorio(gerador, profundidade=3):
+    if profundidade == 0 or gerador.random() < 0.3:
+        return comparacao_aleatoria(gerador)
+    tipo = gerador.choice(['e', 'ou', 'nao'])
+    if tipo == 'nao':
+        return ~predicado_aleatorio(gerador, profundidade - 1)
+    filhos = [predicado_aleatorio(gerador, profundidade - 1) for _ in range(gerador.randint(2, 4))]
+    return E(*filhos) if tipo == 'e' else Ou(*filhos)
+
+
+@pytest.mark.parametrize('seed', range(30))
+def test_compilado_igual_ao_interpretado(seed):
+    predicado = predicado_aleatorio(random.Random(seed))
+    esperados = [avaliar(predicado, u) for u in USUARIOS]
+    aprovados = [u for u, ok in zip(USUARIOS, esperados) if ok]
+
+    por_registro = compilar(predicado)
+    assert [por_registro(u) for u in USUARIOS] == esperados
+    assert compilar(predicado, 'filtrar')(USUARIOS) == aprovados
+    assert compilar(predicado, 'contar')(USUARIOS) == len(aprovados)
+    assert compilar(predicado, 'algum')(USUARIOS) == any(esperados)
+    assert compilar(predicado, 'todos')(USUARIOS) == all(esperados)
+
+    otimizado = otimizar(predicado, USUARIOS[:100])
+    assert compilar(otimizado, 'filtrar')(USUARIOS) == aprovados
+
+
+def test_and_or_achatam_as_clausulas():
+    a, b, c = Campo('idade') > 1, Campo('idade') > 2, Campo('idade') > 3
+    assert len(((a & b) & c).clausulas) == 3
+    assert len(((a | b) | c).clausulas) == 3
+    assert len(((a & b) | c).clausulas) == 2
+
+
+def test_constantes_nao_viram_codigo():
+    injecao = "x') or True or ('"
+    assert compilar(Campo('pais') == injecao, 'contar')(USUARIOS) == 0
+
+
+def test_lotes_vazios():
+    predicado = Campo('idade') > 0
+    assert compilar(predicado, 'filtrar')([]) == []
+    assert compilar(predicado, 'algum')([]) is False
+    assert compilar(predicado, 'todos')([]) is True
+
+
+def test_operador_invalido():
+    with pytest.raises(ValueError):
+        Comparacao('idade', '=~', 1)
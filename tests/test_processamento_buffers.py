@@ -0,0 +1,26 @@
+"""somar_coluna contra split() e linhas malformadas."""
+
+import pytest
+
+from processamento_buffers import gerar_csv, somar_coluna
+
+
+def test_somar_coluna_igual_a_split():
+    dados = gerar_csv(500)
+    linhas = dados.splitlines()
+    esperado = (len(linhas), sum(int(linha.split(b',')[1]) for linha in linhas))
+    assert somar_coluna(dados, 1) == esperado
+
+
+def test_ultima_linha_sem_quebra():
+    assert somar_coluna(b'5\n6', 0) == (2, 11)
+
+
+@pytest.mark.parametrize('buffer, coluna, mensagem', [
+    (b'1,10,x\n2\n3,30,y\n', 1, 'byte 7 tem menos de 2 campos'),
+    (b'1,10,7\n2,5\n', 2, 'byte 7 tem menos de 3 campos'),
+    (b'1,10,x\n2,5,3\n', 2, "byte 0: campo 2 não é inteiro: b'x'"),
+])
+def test_linha_malformada(buffer, coluna, mensagem):
+    with pytest.raises(ValueError, match=mensagem):
+        somar_coluna(buffer, coluna)
@@ -0,0 +1,54 @@
+"""Parâmetros, matriz e rótulos do registro de benchmarks."""
+
+import pytest
+
+import registro_benchmarks
+from registro_benchmarks import combinacoes, criar_parser, interpretar, medicoes_previstas, rotulo
+
+CASO = {
+    'nome': 'benchmark_teste',
+    'parametros': {'tamanho': 10, 'k': 2},
+    'tags': {'teste'},
+    'medicoes': lambda tamanho, k: 3 * k,
+}
+
+
+def test_combinacoes_sem_matriz_usa_padroes_e_sobrescritas():
+    assert combinacoes(CASO) == [{'tamanho': 10, 'k': 2}]
+    assert combinacoes(CASO, {'k': 5, 'outro': 1}) == [{'tamanho': 10, 'k': 5}]
+
+
+def test_combinacoes_faz_o_produto_da_matriz():
+    execucoes = combinacoes(CASO, {'k': 5}, {'tamanho': [1, 2], 'k': [3, 4]})
+    assert execucoes == [
+        {'tamanho': 1, 'k': 3}, {'tamanho': 1, 'k': 4},
+        {'tamanho': 2, 'k': 3}, {'tamanho': 2, 'k': 4},
+    ]
+
+
+def test_rotulo_mostra_so_os_parametros_alterados():
+    assert rotulo(CASO, {'tamanho': 10, 'k': 2}) == 'benchmark_teste'
+    assert rotulo(CASO, {'tamanho': 100, 'k': 2}) == 'benchmark_teste[tamanho=100]'
+
+
+def test_medicoes_previstas():
+    assert medicoes_previstas(CASO, {'tamanho': 10, 'k': 4}) == 12
+    assert medicoes_previstas(dict(CASO, medicoes=7), {}) == 7
+
+
+@pytest.fixture
+def registro(monkeypatch):
+    monkeypatch.setattr(registro_benchmarks, 'REGISTRO', {CASO['nome']: CASO})
+
+
+@pytest.mark.parametrize('opcao', [['-p', 'tamanhos=5'], ['--matriz', 'kk=1,2']])
+def test_parametro_desconhecido_e_recusado(registro, opcao, capsys):
+    with pytest.raises(SystemExit):
+        interpretar(criar_parser('teste'), opcao)
+    assert 'parâmetro(s) desconhecido(s)' in capsys.readouterr().err
+
+
+def test_parametros_conhecidos_sao_convertidos(registro):
+    args = interpretar(criar_parser('teste'), ['-p', 'k=3', '--matriz', 'tamanho=1,2.5'])
+    assert args.sobrescritas == {'k': 3}
+    assert args.matriz_valores == {'tamanho': [1, 2.5]}
@@ -0,0 +1,50 @@
+"""selecao_topk contra a referência sorted()."""
+
+import random
+from array import array
+from collections import Counter
+
+import pytest
+
+from selecao_topk import TopKIncremental, contar_topk, quickselect_maiores, topk_fluxo
+
+
+def valores(n, seed=1, maximo=None):
+    gerador = random.Random(seed)
+    if maximo is None:
+        return [gerador.random() for _ in range(n)]
+    return [gerador.randint(0, maximo) for _ in range(n)]
+
+
+@pytest.mark.parametrize('n', [0, 1, 7, 1000])
+@pytest.mark.parametrize('k', [0, 1, 5, 1000, 2000])
+def test_topk_fluxo_e_quickselect_igual_a_sorted(n, k):
+    dados = valores(n)
+    esperado = sorted(dados, reverse=True)[:k]
+    assert topk_fluxo(iter(dados), k) == esperado
+    assert quickselect_maiores(array('d', dados), k) == esperado
+
+
+@pytest.mark.parametrize('seed', range(5))
+def test_quickselect_com_repetidos(seed):
+    dados = valores(500, seed, maximo=10)
+    assert quickselect_maiores(array('q', dados), 50) == sorted(dados, reverse=True)[:50]
+
+
+@pytest.mark.parametrize('k', [1, 3, 20])
+def test_contar_topk_igual_a_contagem_ordenada(k):
+    eventos = valores(5000, maximo=50)
+    contagem = Counter(eventos)
+    pesos = sorted(contagem.values(), reverse=True)[:k]
+
+    resultado = contar_topk(eventos, k)
+    assert [peso for _, peso in resultado] == pesos
+    assert all(contagem[item] == peso for item, peso in resultado)
+
+
+def test_topk_incremental_com_k_zero():
+    topk = TopKIncremental(0)
+    for item in 'abcab':
+        topk.atualizar(item, 1)
+    assert topk.resultado() == []
+    assert contar_topk(['a', 'b', 'a'], 0) == []
@@ -0,0 +1,55 @@
+"""Tempo limite por caso e restauração do SIGALRM."""
+
+import signal
+
+import pytest
+
+from telemetria import Telemetria
+
+pytestmark = pytest.mark.skipif(not hasattr(signal, 'setitimer'), reason='requer SIGALRM/setitimer')
+
+
+def test_caso_lento_e_interrompido_e_o_proximo_roda():
+    def lento():
+        while True:
+            pass
+
+    telemetria = Telemetria(tempo_limite=0.1)
+    telemetria.iniciar(2)
+    assert telemetria.executar_caso('lento', lento, {}) == ('tempo_esgotado', None)
+    assert telemetria.executar_caso('rapido', lambda x: x * 2, {'x': 21}) == ('ok', 42)
+    telemetria.finalizar()
+
+
+def test_tempo_esgotado_nao_e_engolido_por_except_exception():
+    def engole_erros():
+        while True:
+            try:
+                while True:
+                    pass
+            except Exception:
+                pass
+
+    telemetria = Telemetria(tempo_limite=0.1)
+    telemetria.iniciar(1)
+    assert telemetria.executar_caso('engole_erros', engole_erros, {}) == ('tempo_esgotado', None)
+    telemetria.finalizar()
+
+
+def test_alarme_cancelado_e_handler_restaurado():
+    anterior = signal.getsignal(signal.SIGALRM)
+    telemetria = Telemetria(tempo_limite=5)
+    telemetria.iniciar(1)
+    telemetria.executar_caso('rapido', lambda: None, {})
+    telemetria.finalizar()
+    assert signal.getitimer(signal.ITIMER_REAL) == (0.0, 0.0)
+    assert signal.getsignal(signal.SIGALRM) == anterior
+
+
+def test_handler_anterior_none_volta_ao_padrao():
+    telemetria = Telemetria(tempo_limite=5)
+    signal.signal(signal.SIGALRM, lambda *_: None)
+    signal.setitimer(signal.ITIMER_REAL, 5)
+    telemetria._desarmar_alarme(True, None)
+    assert signal.getitimer(signal.ITIMER_REAL) == (0.0, 0.0)
+    assert signal.getsignal(signal.SIGALRM) == signal.SIG_DFL